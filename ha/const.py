@@ -168,6 +168,7 @@ DISABLE_STONITH="pcs resource disable stonith-<node>-clone"
 ENABLE_STONITH="pcs resource enable stonith-<node>-clone"
 CHECK_PCS_STANDBY_MODE = '/usr/sbin/crm_standby --query | awk \'{print $3}\''
 GET_CLUSTER_STATUS = "crm_mon --as-xml"
+GET_CLUSTER_STATUS_XML = "crm_mon --one-shot --inactive --output-as=xml"
 GET_ONLINE_NODES_CMD = "crm_mon --as-xml"
 GET_LOCAL_NODE_ID_CMD = "crm_node -i"
 GET_LOCAL_NODE_NAME_CMD = "crm_node -n"
@@ -184,11 +185,56 @@ CLUSTER_RETRY_COUNT = 6
 BASE_WAIT_TIME = 5
 NODE_STOP_TIMEOUT = 300 # 300 sec to stop single node
 CLUSTER_STANDBY_UNSTANDBY_TIMEOUT = 600 # 600 sec to stop single node
+# Max age(sec) of the shared pacemaker status snapshot before it is read again
+PCS_STATUS_TTL = 2
+# Node reachability probe: method(icmp or tcp), per probe timeout(sec), probes
+# run together, result cache ttl(sec), DNS resolution cache ttl(sec)
+NODE_PROBE_METHOD = "icmp"
+NODE_PROBE_TIMEOUT = 2
+NODE_PROBE_PARALLEL = 16
+NODE_PROBE_CACHE_TTL = 3
+NODE_RESOLVE_CACHE_TTL = 300
+# pcsd port, target of the tcp reachability probe
+PCSD_PORT = 2224
 NODE_POWERON_DELAY = 300 # Delay after node is powered-on before cluster start
 
 # wait timeout in cortx ha servervices while checking for stop
 CORTX_HA_WAIT_TIMEOUT = 5
 
+# Consul blocking query max wait and retry interval(sec) after failure
+CONSUL_WATCH_WAIT = "30s"
+CONSUL_WATCH_RETRY_INTERVAL = 2
+
+# Consul transactions sent together by commit, retries and first retry delay(sec) per transaction
+CONSUL_TXN_PARALLEL = 4
+CONSUL_TXN_RETRY_COUNT = 3
+CONSUL_TXN_RETRY_DELAY = 0.5
+
+# Seconds ConsulKvStore.get_keys results are reused for, None for no expiry
+CONSUL_KEYS_CACHE_TTL = 60
+
+# Consul HTTP transport, idle connections kept per consul server in addition
+# to the worker count, consul servers pooled and timeouts(sec) of a request
+CONSUL_POOL_SIZE = 8
+CONSUL_POOL_SERVERS = 4
+CONSUL_CONNECT_TIMEOUT = 5
+CONSUL_READ_TIMEOUT = 30
+
+# Wire format of events published by k8s monitor, messages without the
+# version key are the earlier str(dict)/json format.
+EVENT_WIRE_VERSION_KEY = "wire_version"
+EVENT_WIRE_VERSION = 1
+
+# Message bus batching, max messages per batch and max wait(ms) to fill a batch
+MESSAGE_BUS_BATCH_SIZE = 100
+MESSAGE_BUS_BATCH_TIMEOUT = 100
+
+# Sharded dispatcher retries of a message whose callback raises, before it is acked,
+# and delay(sec) before first retry, doubled for next up to the max delay
+DISPATCHER_RETRY_COUNT = 5
+DISPATCHER_RETRY_DELAY = 0.1
+DISPATCHER_RETRY_MAX_DELAY = 5
+
 # Event Analyzer
 INCLUSION = "inclusion"
 EXCLUSION = "exclusion"
@@ -254,6 +300,7 @@ class COMPONENTS(Enum):
     CLUSTER = "cluster"
     AGG_SERVICE = "agg_service"
     NODE_MAP = "node_map"
+    DISK_CVG_MAP = "disk_cvg_map"
     CVG = "cvg"
     DISK = "disk"
 
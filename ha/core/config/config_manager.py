@@ -27,6 +27,7 @@ from cortx.utils.conf_store.conf_store import Conf
 
 from ha import const
 from ha.util.consul_kv_store import ConsulKvStore
+from ha.util.consul_transport import ConsulTransport
 from ha.const import _DELIM
 from ha.core.error import HAInvalidNode
 
@@ -78,6 +79,20 @@ class ConfigManager:
             config_file = f"yaml://{const.HA_CONFIG_FILE}"
         ConfigManager._safe_load(const.HA_GLOBAL_INDEX, config_file)
 
+    @staticmethod
+    def reload(config_file=None):
+        """
+        Reload ha conf from the config file. Confstore is re-created on next
+        get_confstore() call so updated consul endpoint is used.
+        """
+        if not config_file:
+            config_file = f"yaml://{const.HA_CONFIG_FILE}"
+        Log.info(f"Reloading ha conf from {config_file}")
+        Conf.load(const.HA_GLOBAL_INDEX, config_file, fail_reload=False)
+        if const.HA_GLOBAL_INDEX not in ConfigManager._conf:
+            ConfigManager._conf.append(const.HA_GLOBAL_INDEX)
+        ConfigManager._cluster_confstore = None
+
     @staticmethod
     def get_confstore(kv_enable_batch = False):
         """
@@ -88,11 +103,26 @@ class ConfigManager:
             consul_endpoint = Conf.get(const.HA_GLOBAL_INDEX, f'consul_config{_DELIM}endpoint')
             consul_host = consul_endpoint.split(":")[1].strip("//")
             consul_port = consul_endpoint.split(":")[-1]
+            ConsulTransport.configure(pool_size=const.CONSUL_POOL_SIZE + ConfigManager._get_workers())
             ConfigManager._cluster_confstore = ConsulKvStore(prefix=const.CLUSTER_CONFSTORE_PREFIX,
                                                              host=consul_host, port=consul_port,
                                                              enable_batch=kv_enable_batch)
         return ConfigManager._cluster_confstore
 
+    @staticmethod
+    def _get_workers() -> int:
+        """
+        Get max workers configured for a service, each of them can use a
+        consul connection at the same time.
+        """
+        workers = 1
+        for service in ("EVENT_MANAGER", "FAULT_TOLERANCE"):
+            try:
+                workers = max(workers, int(Conf.get(const.HA_GLOBAL_INDEX, f"{service}{_DELIM}workers", 1)))
+            except (TypeError, ValueError):
+                pass
+        return workers
+
     @staticmethod
     def load_controller_schema():
         """
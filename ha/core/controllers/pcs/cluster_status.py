@@ -16,13 +16,11 @@
 # cortx-questions@seagate.com.
 from ha import const
 from ha.core.config.config_manager import ConfigManager
-from ha.execute import SimpleCommand
 from ha.const import CLUSTER_STATUS
+from ha.core.controllers.pcs.pcs_status import PcsStatus, PcsStatusProvider
 
 from cortx.utils.log import Log
 
-from xml.etree import ElementTree
-
 from ha.remote_execution.ssh_communicator import SSHRemoteExecutor
 
 
@@ -76,33 +74,28 @@ class PcsClusterStatus:
 
     def _get_pcs_status(self):
         """
-            Get status of the cluster using "pcs status --full xml" command.
+            Get status of the cluster from the shared pacemaker status snapshot.
         """
         self._initialize_node_health()
 
-        error = None
+        self._output = None
         try:
-            self._output, error, rc = SimpleCommand().run_cmd(PcsConstants.PCS_STATUS_XML)
-        except Exception:
-            Log.info("Failed to run pcs status on current node.")
-            rc = 1
-        Log.info(f"pcs status : rc = {rc}, error = {error}")
-
-        if rc != 0:
-            self._output = self._get_pcs_status_remote()
-
-        if self._output is not None:
-            self._output = ElementTree.fromstring(self._output)
+            self._output = PcsStatusProvider.get_instance().get().tree
+        except Exception as e:
+            Log.info(f"Failed to get cluster status on current node. Error: {e}")
+            output = self._get_pcs_status_remote()
+            if output is not None:
+                self._output = PcsStatus(output).tree
 
     def _get_pcs_status_remote(self):
         """
-            Get status of the cluster using "pcs status --full xml" command remotely.
+            Get status of the cluster using crm_mon xml command remotely.
         """
         for remote_node in self._nodes_configured:
             res = None
             remote_executor = SSHRemoteExecutor(remote_node)
             try:
-                res = remote_executor.execute(PcsConstants.PCS_STATUS_XML)
+                res = remote_executor.execute(const.GET_CLUSTER_STATUS_XML)
                 self._nodes_by_health[PcsConstants.OFFLINE] = []
             except Exception:
                 Log.info(f"Failed to run pcs status on node: {remote_node}")
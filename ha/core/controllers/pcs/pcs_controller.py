@@ -18,11 +18,12 @@
 import time
 import json
 import re
-import socket
 from ha.core.config.config_manager import ConfigManager
 
 from ha.core.controllers.element_controller import ElementController
+from ha.core.controllers.pcs.pcs_status import PcsStatus, PcsStatusProvider
 from ha.execute import SimpleCommand
+from ha.util.node_probe import NodeProbe
 from ha import const
 from ha.core.error import HAInvalidNode, ClusterManagerError, HAClusterCLIError
 from ha.const import NODE_STATUSES
@@ -82,15 +83,17 @@ class PcsController(ElementController):
             time.sleep(10)
         return resources_healed
 
+    def _get_cluster_status(self) -> PcsStatus:
+        """
+        Get pacemaker status snapshot shared by the pcs controllers.
+        """
+        return PcsStatusProvider.get_instance().get()
+
     def check_resource_failcount(self, node_id) -> bool:
         """
         Resource fail count check
         """
-        _output, _err, _rc = self._execute.run_cmd(const.PCS_FAILCOUNT_STATUS, check_error=False)
-        if node_id in _output:
-            return True
-        else:
-            return False
+        return len(self._get_cluster_status().fail_counts(node_id)) > 0
 
     def clean_failure_count(self, node_id):
         """
@@ -98,6 +101,7 @@ class PcsController(ElementController):
         """
         _output, _err, _rc = self._execute.run_cmd(const.PCS_NODE_CLEANUP.replace("<node>", node_id),
                                                    check_error=False)
+        PcsStatusProvider.get_instance().invalidate()
 
     def _get_cluster_size(self):
         """
@@ -114,16 +118,7 @@ class PcsController(ElementController):
         Return list of nodes.
         """
         #TODO: This is temporary implementation and It should be removed once nodelist is available in the system health.
-        nodelist = []
-        _output, _err, _rc = self._execute.run_cmd(const.PCS_STATUS_NODES, check_error=False)
-
-        if _rc != 0:
-            raise ClusterManagerError("Failed to get nodes status")
-        for status in _output.split("\n"):
-            nodes = status.split(":")
-            if len(nodes) > 1:
-                nodelist.extend(nodes[1].split())
-        return nodelist
+        return self._get_cluster_status().node_names()
 
     def nodes_status(self, nodeids: list = None) -> dict:
         """
@@ -137,36 +132,21 @@ class PcsController(ElementController):
             ([dict]): Return dictionary. {"node_id1": "status of node_id1",
                                           "node_id2": "status of node_id2"...}
         """
-        nodeids = self._get_node_list() if nodeids == None or len(nodeids) == 0 else nodeids
+        cluster_status = self._get_cluster_status()
+        nodeids = cluster_status.node_names() if nodeids == None or len(nodeids) == 0 else nodeids
         all_nodes_status = dict()
-        _output, _err, _rc = self._execute.run_cmd(const.PCS_STATUS_NODES, check_error=False)
         if not isinstance(nodeids, list):
             raise ClusterManagerError(f"Invalid nodeids type `{type(nodeids)}`, required `list`")
         for nodeid in nodeids:
-            if nodeid in _output:
-                for status in _output.split("\n"):
-                    nodes = status.split(":")
-                    if len(nodes) > 1 and nodeid.lower() in nodes[1].strip().lower():
-                        if nodes[0].strip().lower() == NODE_STATUSES.STANDBY.value:
-                            all_nodes_status[nodeid] = NODE_STATUSES.STANDBY.value
-                        elif nodes[0].strip().lower() == NODE_STATUSES.STANDBY_WITH_RESOURCES_RUNNING.value:
-                            all_nodes_status[nodeid] = NODE_STATUSES.STANDBY_WITH_RESOURCES_RUNNING.value
-                        elif nodes[0].strip().lower() == NODE_STATUSES.MAINTENANCE.value:
-                            all_nodes_status[nodeid] = NODE_STATUSES.MAINTENANCE.value
-                        elif nodes[0].strip().lower() == NODE_STATUSES.CLUSTER_OFFLINE.value:
-                            all_nodes_status[nodeid] = NODE_STATUSES.CLUSTER_OFFLINE.value
-                        elif nodes[0].strip().lower() == NODE_STATUSES.ONLINE.value:
-                            all_nodes_status[nodeid] = NODE_STATUSES.ONLINE.value
-                        break
-                else:
-                    all_nodes_status[nodeid] = NODE_STATUSES.UNKNOWN.value
-            else:
+            status = cluster_status.node_status(nodeid)
+            if status is None:
                 raise HAInvalidNode(f"Node {nodeid} is not a part of cluster")
-        for node in all_nodes_status.keys():
-            status = all_nodes_status[node]
-            if status == NODE_STATUSES.CLUSTER_OFFLINE.value:
-                _output, _err, _rc = self._execute.run_cmd(f"ping -c 1 {node}", check_error=False)
-                if _rc != 0:
+            all_nodes_status[nodeid] = status
+        offline_nodes = [node for node, status in all_nodes_status.items()
+                         if status == NODE_STATUSES.CLUSTER_OFFLINE.value]
+        if len(offline_nodes) > 0:
+            for node, result in NodeProbe.get_instance().probe(offline_nodes).items():
+                if not result.ok:
                     all_nodes_status[node] = NODE_STATUSES.POWEROFF.value
         return all_nodes_status
 
@@ -191,7 +171,7 @@ class PcsController(ElementController):
         '''
            Checks if node id gets resolved to some IP address or not
            Returns: bool
-           Exception: socket.gaierror, socket.herror
+           Exception: HAClusterCLIError
         '''
         # TODO: change this logic and validate the node_id from the
         # list coming from system health
@@ -214,10 +194,9 @@ class PcsController(ElementController):
         # else it can be combination of chars and numbers means hostname or just a
         # random meaningless string
         else:
-            try:
-                socket.gethostbyname(node_id)
-            except Exception as err:
-                raise HAClusterCLIError(f'{node_id} not a valid node_id: {err}')
+            result = NodeProbe.get_instance().resolve([node_id])[node_id]
+            if not result.ok:
+                raise HAClusterCLIError(f'{node_id} not a valid node_id: {result.detail}')
         return True
 
     def _is_node_in_cluster(self, node_id: str):
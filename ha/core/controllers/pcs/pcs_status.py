@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import time
+from threading import Event, Lock
+from typing import Callable, Dict, List, Optional
+from xml.etree import ElementTree
+from xml.etree.ElementTree import Element
+
+from cortx.utils.log import Log
+from ha import const
+from ha.const import NODE_STATUSES
+from ha.core.error import ClusterManagerError
+from ha.execute import SimpleCommand
+
+class PcsStatus:
+    """
+    Parsed pacemaker status(crm_mon xml) indexed by node name. Same object
+    is shared by all the readers of a snapshot, so it must not be modified.
+    """
+
+    def __init__(self, output: str):
+        """
+        Init method.
+
+        Args:
+            output (str): xml output of crm_mon or pcs status xml.
+
+        Raises:
+            ClusterManagerError: output is not a valid xml.
+        """
+        try:
+            self._tree = ElementTree.fromstring(output)
+        except ElementTree.ParseError as e:
+            raise ClusterManagerError(f"Failed to parse cluster status. Error: {e}")
+        self._nodes: Dict[str, Element] = {}
+        self._node_ids: Dict[str, str] = {}
+        for a_node in self._tree.findall("./nodes/node"):
+            name = a_node.get("name")
+            self._nodes[name] = a_node
+            self._node_ids[name.lower()] = name
+        self._fail_counts: Dict[str, Dict[str, str]] = {}
+        for a_node in self._tree.findall("./node_history/node"):
+            fail_counts = {history.get("id"): history.get("fail-count") for history in a_node
+                           if history.get("fail-count", "0") != "0"}
+            if fail_counts:
+                self._fail_counts[a_node.get("name")] = fail_counts
+
+    @property
+    def tree(self) -> Element:
+        """
+        Root element of the status xml.
+        """
+        return self._tree
+
+    def node_names(self) -> List[str]:
+        """
+        Names of all the pacemaker nodes in the order of the status.
+        """
+        return list(self._nodes)
+
+    def get_node(self, node_name: str) -> Optional[Element]:
+        """
+        Get node element by name, name is matched ignoring case.
+        """
+        name = self._node_ids.get(node_name.lower())
+        return self._nodes[name] if name is not None else None
+
+    def node_status(self, node_name: str) -> Optional[str]:
+        """
+        Get status of node as reported by "pcs status nodes".
+
+        Returns:
+            str: NODE_STATUSES value, None if node is not part of the cluster.
+        """
+        a_node = self.get_node(node_name)
+        if a_node is None:
+            return None
+        if a_node.get("online") != "true":
+            return NODE_STATUSES.CLUSTER_OFFLINE.value
+        if a_node.get("standby") == "true":
+            if int(a_node.get("resources_running", 0)) > 0:
+                return NODE_STATUSES.STANDBY_WITH_RESOURCES_RUNNING.value
+            return NODE_STATUSES.STANDBY.value
+        if a_node.get("maintenance") == "true":
+            return NODE_STATUSES.MAINTENANCE.value
+        return NODE_STATUSES.ONLINE.value
+
+    def fail_counts(self, node_name: str) -> Dict[str, str]:
+        """
+        Get non zero fail counts of resources on node {resource_id: fail_count}.
+        """
+        a_node = self.get_node(node_name)
+        if a_node is None:
+            return {}
+        return dict(self._fail_counts.get(a_node.get("name"), {}))
+
+class _StatusLoad:
+    """
+    Status read in progress, concurrent callers wait for it instead of
+    running one more read.
+    """
+
+    def __init__(self):
+        self.done = Event()
+        self.status: Optional[PcsStatus] = None
+        self.error: Optional[Exception] = None
+
+class PcsStatusProvider:
+    """
+    Snapshot of the pacemaker status shared by all the pcs controllers.
+    Status is read with one crm_mon call and reused until it is older
+    than ttl. Callers asking for status while it is being read wait for
+    that read, so there is at most one crm_mon running per provider.
+    A failed read is not cached.
+
+    Example:
+        status = PcsStatusProvider.get_instance().get()
+        status.node_status("srvnode-1")
+    """
+
+    _instance = None
+    _instance_lock = Lock()
+
+    def __init__(self, ttl: float = const.PCS_STATUS_TTL, executor: Callable[[str], tuple] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Init method.
+
+        Args:
+            ttl (float): max age(sec) of a snapshot that is returned.
+            executor (Callable): runs command and returns (output, err, rc).
+            clock (Callable): monotonic clock, used by tests.
+        """
+        self._ttl = ttl
+        self._executor = executor
+        self._clock = clock
+        self._lock = Lock()
+        self._status: Optional[PcsStatus] = None
+        self._loaded_at = 0.0
+        self._load: Optional[_StatusLoad] = None
+        # Bumped by invalidate, a read started before it is not cached.
+        self._generation = 0
+
+    @classmethod
+    def get_instance(cls) -> "PcsStatusProvider":
+        """
+        Get status provider shared by the process.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = PcsStatusProvider()
+            return cls._instance
+
+    def get(self, max_age: float = None) -> PcsStatus:
+        """
+        Get status not older than max_age, read it if needed.
+
+        Args:
+            max_age (float): max age(sec) of the snapshot, ttl by default.
+                0 forces a read unless one is already in progress.
+
+        Raises:
+            ClusterManagerError: status could not be read.
+        """
+        max_age = self._ttl if max_age is None else max_age
+        with self._lock:
+            if self._status is not None and self._clock() - self._loaded_at < max_age:
+                return self._status
+            load = self._load
+            owner = load is None
+            if owner:
+                load = self._load = _StatusLoad()
+                started_at, generation = self._clock(), self._generation
+        if owner:
+            try:
+                load.status = self._read()
+            except Exception as e:
+                load.error = e
+            with self._lock:
+                if load.status is not None and generation == self._generation:
+                    self._status, self._loaded_at = load.status, started_at
+                self._load = None
+            load.done.set()
+        else:
+            load.done.wait()
+        if load.error is not None:
+            raise load.error
+        return load.status
+
+    def invalidate(self) -> None:
+        """
+        Drop the snapshot, next get reads the status again. Used after
+        commands that change the cluster state.
+        """
+        with self._lock:
+            self._status = None
+            self._generation += 1
+
+    def _read(self) -> PcsStatus:
+        if self._executor is not None:
+            output, err, rc = self._executor(const.GET_CLUSTER_STATUS_XML)
+        else:
+            output, err, rc = SimpleCommand().run_cmd(const.GET_CLUSTER_STATUS_XML, check_error=False)
+        if rc != 0:
+            Log.error(f"Failed to get cluster status. rc: {rc}, error: {err}")
+            raise ClusterManagerError("Failed to get cluster status")
+        return PcsStatus(output)
@@ -27,6 +27,7 @@ import os
 import time
 import sys
 import traceback
+from threading import Lock
 
 from cortx.utils.log import Log
 from cortx.utils.conf_store.conf_store import Conf
@@ -38,6 +39,7 @@ from ha.core.event_analyzer.watcher.watcher import Watcher
 from ha.core.event_analyzer.filter.filter import ClusterResourceFilter
 from ha.core.event_analyzer.parser.parser import ClusterResourceParser
 from ha.core.event_analyzer.event_analyzer_exceptions import SubscriberException
+from ha.core.event_analyzer.event_envelope import EventEnvelope
 from ha.const import _DELIM
 
 class EventAnalyzerService:
@@ -87,7 +89,8 @@ class EventAnalyzerService:
                 consumer_group = Conf.get(const.HA_GLOBAL_INDEX, f"EVENT_ANALYZER{_DELIM}watcher{_DELIM}{watcher}{_DELIM}consumer_group"),
                 event_filter = event_filter_instance,
                 event_parser = event_parser_instance,
-                subscriber = system_health
+                subscriber = system_health,
+                batch_size = int(Conf.get(const.HA_GLOBAL_INDEX, f"EVENT_ANALYZER{_DELIM}watcher{_DELIM}{watcher}{_DELIM}batch_size", 1))
             )
         return watcher_list
 
@@ -107,16 +110,60 @@ class EventAnalyzer:
     """
     Analyzes an event, filter gets applied. Further it parses
     an alert to create health event object required for system
-    health processing
+    health processing.
+    Create it once and call analyze() for every message, system health,
+    filter and parser are reused till reload() is called.
+    System health cache is process wide, it is enabled by the owner of
+    the analyzers and not per analyzer.
     """
-    def __init__(self, msg=None):
-        '''init method'''
-        self._confstore = ConfigManager.get_confstore()
-        system_health = SystemHealth(self._confstore)
-        self._cluster_resource_filter = ClusterResourceFilter()
-        self._cluster_resource_parser = ClusterResourceParser()
-        if self._cluster_resource_filter.filter_event(msg):
-            health_event = self._cluster_resource_parser.parse_event(msg)
+    def __init__(self, producer=None):
+        '''
+        init method
+
+        Args:
+            producer (MessageBusProducer, optional): health event producer
+                shared by the analyzers of the process.
+        '''
+        self._lock = Lock()
+        self._producer = producer
+        self._init_pipeline()
+
+    def _init_pipeline(self):
+        """
+        Create system health, filter and parser used for analyzing events.
+        """
+        confstore = ConfigManager.get_confstore()
+        system_health = SystemHealth(confstore, producer=self._producer)
+        cluster_resource_filter = ClusterResourceFilter()
+        cluster_resource_parser = ClusterResourceParser()
+        with self._lock:
+            self._system_health = system_health
+            self._cluster_resource_filter = cluster_resource_filter
+            self._cluster_resource_parser = cluster_resource_parser
+
+    def reload(self):
+        """
+        Re-initialize the pipeline, used when the configuration is reloaded.
+        Messages being analyzed complete with the earlier pipeline.
+        """
+        Log.info("Re-initializing event analyzer pipeline.")
+        self._init_pipeline()
+
+    def analyze(self, msg: str):
+        """
+        Filter, parse and pass the event to system health.
+
+        Args:
+            msg (str/dict): message received from message bus or event decoded by the dispatcher.
+        """
+        with self._lock:
+            system_health = self._system_health
+            cluster_resource_filter = self._cluster_resource_filter
+            cluster_resource_parser = self._cluster_resource_parser
+        # Decoded once, filter and parser share the envelope.
+        event = EventEnvelope(msg)
+        if cluster_resource_filter.filter_event(event):
+            health_event = cluster_resource_parser.parse_event(event)
             try:
                 system_health.process_event(health_event)
             except Exception as e:
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+from types import MappingProxyType
+
+from ha.util.event_codec import decode_event
+
+class EventEnvelope:
+    """
+    Read only event passed through watcher, filter and parser. The message
+    is decoded once, on the first field access, and decoded fields are kept
+    so the filter and the parser do not decode or look them up again.
+
+    Values returned must not be modified, copy them if required.
+
+    Example:
+        event = EventEnvelope(message)
+        resource_type = event.get("message", "sensor_response_type", "info", "resource_type")
+    """
+
+    __slots__ = ("_message", "_data", "_fields")
+
+    def __init__(self, message):
+        """
+        Init method.
+
+        Args:
+            message (bytes/str/dict): message received from message bus or decoded event.
+        """
+        self._message = message
+        self._data = message if isinstance(message, dict) else None
+        self._fields: dict = {}
+
+    @staticmethod
+    def wrap(msg) -> 'EventEnvelope':
+        """
+        Get envelope of msg, msg is returned as it is if it is an envelope.
+        Used by filter_event and parse_event to accept str messages as well.
+        """
+        return msg if isinstance(msg, EventEnvelope) else EventEnvelope(msg)
+
+    @property
+    def data(self) -> MappingProxyType:
+        """
+        Decoded event.
+
+        Raises:
+            ValueError: message is not a valid event.
+        """
+        return MappingProxyType(self._decode())
+
+    def _decode(self) -> dict:
+        if self._data is None:
+            self._data = decode_event(self._message)
+        return self._data
+
+    def get(self, *path: str, default=None):
+        """
+        Get field of the event by the keys leading to it.
+
+        Args:
+            path (str): keys from the top of the event, ex. "payload", "resource_type".
+            default: returned if field is not present.
+
+        Raises:
+            ValueError: message is not a valid event.
+        """
+        if path in self._fields:
+            return self._fields[path]
+        value = self._decode()
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        self._fields[path] = value
+        return value
+
+    def __str__(self) -> str:
+        """
+        Message as received, used in logs.
+        """
+        if isinstance(self._message, bytes):
+            return self._message.decode('utf-8')
+        return str(self._message)
@@ -16,8 +16,6 @@
 # cortx-questions@seagate.com.
 
 import abc
-import ast
-import json
 from enum import Enum
 from cortx.utils.conf_store.conf_store import Conf
 from cortx.utils.log import Log
@@ -26,6 +24,7 @@ from ha.core.config.config_manager import ConfigManager
 from ha.const import _DELIM, ALERT_ATTRIBUTES
 from ha.core.event_analyzer.event_analyzer_exceptions import EventFilterException
 from ha.core.event_analyzer.event_analyzer_exceptions import InvalidFilterRules
+from ha.core.event_analyzer.event_envelope import EventEnvelope
 from cortx.utils.event_framework.health import HealthAttr
 from cortx.utils.event_framework.event import EventAttr
 
@@ -54,12 +53,12 @@ class Filter(metaclass=abc.ABCMeta):
             raise InvalidFilterRules(f"Invalid filter type {filter_type}")
 
     @abc.abstractmethod
-    def filter_event(self, msg: str) -> bool:
+    def filter_event(self, msg) -> bool:
         """
         Filter event.
 
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg, use EventEnvelope.wrap to get its fields
         """
         pass
 
@@ -85,15 +84,15 @@ class AlertFilter(Filter):
         self.resource_types_list = Conf.get(const.ALERT_FILTER_INDEX, const.AlertEventConstants.ALERT_RESOURCE_TYPE.value)
         Log.info("Alert Filter is initialized ...")
 
-    def filter_event(self, msg: str) -> bool:
+    def filter_event(self, msg) -> bool:
         """
         Filter event.
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg
         """
         try:
             Alert_required = False
-            message = json.loads(msg).get(ALERT_ATTRIBUTES.MESSAGE)
+            message = EventEnvelope.wrap(msg).get(ALERT_ATTRIBUTES.MESSAGE)
 
             msg_type = message.get(ALERT_ATTRIBUTES.ACTUATOR_RESPONSE_TYPE)
             if msg_type is not None:
@@ -131,15 +130,15 @@ class IEMFilter(Filter):
         self.modules_dict = Conf.get(const.ALERT_FILTER_INDEX, const.AlertEventConstants.IEM_MODULES.value)
         Log.info("IEM Filter is initialized ...")
 
-    def filter_event(self, msg: str) -> bool:
+    def filter_event(self, msg) -> bool:
         """
         Filter event.
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg
         """
         try:
             iem_required = False
-            message = json.loads(msg).get(ALERT_ATTRIBUTES.MESSAGE)
+            message = EventEnvelope.wrap(msg).get(ALERT_ATTRIBUTES.MESSAGE)
 
             actuator_response_type = message.get(ALERT_ATTRIBUTES.ACTUATOR_RESPONSE_TYPE)
             if actuator_response_type is not None:
@@ -178,19 +177,18 @@ class ClusterResourceFilter(Filter):
         """
         super(ClusterResourceFilter, self).__init__()
 
-    def filter_event(self, msg: str) -> bool:
+    def filter_event(self, msg) -> bool:
         """
         Filter event.
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg
         """
         try:
             resource_alert_required = False
-            message = json.dumps(ast.literal_eval(msg))
-            message = json.loads(message)
+            message = EventEnvelope.wrap(msg)
 
             Log.debug('Received alert from fault tolerance')
-            event_resource_type = message.get(EventAttr.EVENT_PAYLOAD.value).get(HealthAttr.RESOURCE_TYPE.value)
+            event_resource_type = message.get(EventAttr.EVENT_PAYLOAD.value, HealthAttr.RESOURCE_TYPE.value)
 
             required_resource_type_list = Conf.get(const.HA_GLOBAL_INDEX, f"CLUSTER{_DELIM}resource_type")
             if event_resource_type in required_resource_type_list:
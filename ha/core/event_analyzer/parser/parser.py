@@ -16,8 +16,6 @@
 # cortx-questions@seagate.com.
 
 import abc
-import ast
-import json
 import re
 
 from cortx.utils.log import Log
@@ -30,6 +28,7 @@ from ha.core.event_analyzer.event_analyzer_exceptions import EventParserExceptio
 from ha.core.system_health.const import CLUSTER_ELEMENTS, HEALTH_EVENTS, EVENT_SEVERITIES
 from ha.core.system_health.status_mapper import StatusMapper
 from ha.core.config.config_manager import ConfigManager
+from ha.core.event_analyzer.event_envelope import EventEnvelope
 from ha.const import PVTFQDN_TO_NODEID_KEY, ALERT_ATTRIBUTES, EVENT_ATTRIBUTES as event_attr
 from cortx.utils.event_framework.health import HealthAttr
 from cortx.utils.event_framework.event import EventAttr
@@ -47,12 +46,12 @@ class Parser(metaclass=abc.ABCMeta):
         self._confstore = ConfigManager.get_confstore()
 
     @abc.abstractmethod
-    def parse_event(self, msg: str) -> HealthEvent:
+    def parse_event(self, msg) -> HealthEvent:
         """
         Parse event.
 
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg, use EventEnvelope.wrap to get its fields
         """
         pass
 
@@ -68,14 +67,14 @@ class AlertParser(Parser):
         super(AlertParser, self).__init__()
         Log.info("Alert Parser is initialized ...")
 
-    def parse_event(self, msg: str) -> HealthEvent:
+    def parse_event(self, msg) -> HealthEvent:
         """
         Parse event.
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg
         """
         try:
-            alert = json.loads(msg).get(ALERT_ATTRIBUTES.MESSAGE)
+            alert = EventEnvelope.wrap(msg).get(ALERT_ATTRIBUTES.MESSAGE)
 
             event = {
                 event_attr.EVENT_ID : alert[ALERT_ATTRIBUTES.SENSOR_RESPONSE_TYPE][ALERT_ATTRIBUTES.ALERT_ID],
@@ -112,14 +111,14 @@ class IEMParser(Parser):
         super(IEMParser, self).__init__()
         Log.info("IEM Parser is initialized ...")
 
-    def parse_event(self, msg: str) -> HealthEvent:
+    def parse_event(self, msg) -> HealthEvent:
         """
         Parse event.
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg
         """
         try:
-            iem_alert = json.loads(msg).get(ALERT_ATTRIBUTES.MESSAGE)
+            iem_alert = EventEnvelope.wrap(msg).get(ALERT_ATTRIBUTES.MESSAGE)
 
             # Parse hostname and convert to node id
             iem_description = iem_alert[ALERT_ATTRIBUTES.SENSOR_RESPONSE_TYPE][ALERT_ATTRIBUTES.INFO][ALERT_ATTRIBUTES.DESCRIPTION]
@@ -170,15 +169,14 @@ class ClusterResourceParser(Parser):
         self.rack_id = Conf.get(const.HA_GLOBAL_INDEX, f"COMMON_CONFIG{_DELIM}rack_id")
         Log.info("ClusterResource Parser is initialized ...")
 
-    def parse_event(self, msg: str) -> HealthEvent:
+    def parse_event(self, msg) -> HealthEvent:
         """
         Parse event.
         Args:
-            msg (str): Msg
+            msg (str/EventEnvelope): Msg
         """
         try:
-            message = json.dumps(ast.literal_eval(msg))
-            cluster_resource_alert = json.loads(message)
+            cluster_resource_alert = EventEnvelope.wrap(msg).data
             timestamp = cluster_resource_alert[EventAttr.EVENT_HEADER.value][EventAttr.TIMESTAMP.value]
             event_id = cluster_resource_alert[EventAttr.EVENT_HEADER.value][EventAttr.EVENT_ID.value]
             source = cluster_resource_alert[EventAttr.EVENT_PAYLOAD.value][HealthAttr.SOURCE.value]
@@ -189,7 +187,8 @@ class ClusterResourceParser(Parser):
             specific_info = cluster_resource_alert[EventAttr.EVENT_PAYLOAD.value][HealthAttr.SPECIFIC_INFO.value]
             if resource_type == CLUSTER_ELEMENTS.NODE.value:
                 if specific_info and specific_info["generation_id"]:
-                    specific_info.update({"pod_restart": 0})
+                    # Decoded event is read only
+                    specific_info = dict(specific_info, pod_restart=0)
 
             event = {
                 event_attr.SOURCE : source,
@@ -15,7 +15,6 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
-import json
 import traceback
 from cortx.utils.log import Log
 from ha.util.message_bus import MessageBus
@@ -23,6 +22,7 @@ from ha.util.message_bus import CONSUMER_STATUS
 from ha.core.event_analyzer.filter.filter import Filter
 from ha.core.event_analyzer.parser.parser import Parser
 from ha.core.event_analyzer.subscriber import Subscriber
+from ha.core.event_analyzer.event_envelope import EventEnvelope
 from ha.core.event_analyzer.event_analyzer_exceptions import InvalidSubscriber
 from ha.core.event_analyzer.event_analyzer_exceptions import EventFilterException
 from ha.core.event_analyzer.event_analyzer_exceptions import EventParserException
@@ -32,7 +32,7 @@ class Watcher:
     """ Watch message bus to check in coming event. """
 
     def __init__(self, consumer_id: int, message_type: str, consumer_group: str,
-                event_filter: Filter, event_parser: Parser, subscriber: Subscriber):
+                event_filter: Filter, event_parser: Parser, subscriber: Subscriber, batch_size: int = 1):
         """
         Initalize Watcher class to monitor message bus event.
         Args:
@@ -42,6 +42,7 @@ class Watcher:
             event_filter (Filter): Filter unused event.
             event_parser (Parser): Parse event to HealthEvent
             subscriber (Subscriber): Pass event to Subscriber.
+            batch_size (int): Messages received and acked together, 1 disables batching.
         """
         Log.info(f"Initalizing watcher {message_type}-{str(consumer_id)}")
         self.consumer_id = consumer_id
@@ -55,7 +56,8 @@ class Watcher:
         self.consumer = MessageBus.get_consumer(consumer_id=str(self.consumer_id),
                                 consumer_group=self.consumer_group,
                                 message_type=self.message_type,
-                                callback=self.process_message)
+                                callback=self.process_message,
+                                batch_size=batch_size)
 
     def _validate(self) -> None:
         """
@@ -72,16 +74,14 @@ class Watcher:
         Args:
             message (str): Message received from message bus.
         """
-        try:
-            message = json.loads(message.decode('utf-8'))
-        except Exception as e:
-            Log.error(f"Invalid message {message}, sollow exception and ack it. Error: {e}")
-            return CONSUMER_STATUS.SUCCESS
+        # Decoded once on first access and shared by filter and parser,
+        # invalid message fails in filter and is acked.
+        message = EventEnvelope(message)
         try:
             Log.debug(f"Captured message: {message}")
-            if self.filter.filter_event(json.dumps(message)):
+            if self.filter.filter_event(message):
                 Log.info(f"Filtered Event detected: {message}")
-                event = self.parser.parse_event(json.dumps(message))
+                event = self.parser.parse_event(message)
                 try:
                     Log.info(f"Processing event {event} to subscriber...")
                     self.subscriber.process_event(event)
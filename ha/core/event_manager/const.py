@@ -25,6 +25,9 @@ class EVENT_MANAGER_KEYS(enum.Enum, metaclass=EnumListMeta):
     SUBSCRIPTION_KEY = f"events{HA_DELIM}subscribe{HA_DELIM}<component_id>"
     EVENT_KEY = f"events{HA_DELIM}<resource>{HA_DELIM}<functional_type>{HA_DELIM}<state>"
 
+EVENTS_KEY_PREFIX = "events"
+SUBSCRIBE_KEY = "subscribe"
+
 ACTION_EVENT_VERSION = "2.0"
 EVENT_MANAGER_LOG="event_manager"
 EVENT_MGR_PRODUCER_ID = "ha_event_manager_<component_id>"
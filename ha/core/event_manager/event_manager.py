@@ -20,6 +20,7 @@
 
 import json
 from collections import OrderedDict
+from threading import Lock
 from typing import List
 from ha.const import HA_DELIM
 from ha.core.event_manager.subscribe_event import SubscribeEvent
@@ -74,6 +75,14 @@ class EventManager:
         self._confstore = ConfigManager.get_confstore()
         self._monitor_rule = MonitorRulesManager()
         self._default_action = HEALTH_MON_ACTIONS.PUBLISH_ACT.value
+        # Fan-out table {(resource_type, functional_type, state): [component]},
+        # loaded on first publish and kept updated by consul watch.
+        self._fanout = None
+        self._watching = False
+        # Long lived producer per subscribed component
+        self._producers = {}
+        self._lock = Lock()
+        self._events_prefix = f"{self._confstore._prepare_key(const.EVENTS_KEY_PREFIX)}{HA_DELIM}"
         MessageBus.init()
 
     @staticmethod
@@ -112,7 +121,7 @@ class EventManager:
         MessageBus.register(message_type)
         # Add message type key/value to confstore
         message_type_key = EVENT_MANAGER_KEYS.MESSAGE_TYPE_KEY.value.replace("<component_id>", component)
-        if not self._confstore.key_exists(message_type_key):
+        if not self._confstore.exact_key_exists(message_type_key):
             self._confstore.set(message_type_key, message_type)
         Log.debug(f"Created {message_type} with {message_type_key}")
         return message_type
@@ -124,11 +133,13 @@ class EventManager:
         Args:
             component (str): Component name.
         """
+        with self._lock:
+            self._producers.pop(component, None)
         message_type = EVENT_MANAGER_KEYS.MESSAGE_TYPE_VALUE.value.replace("<component_id>", component)
         MessageBus.deregister(message_type)
         # Remove message type key from confstore
         message_type_key = EVENT_MANAGER_KEYS.MESSAGE_TYPE_KEY.value.replace("<component_id>", component)
-        if self._confstore.key_exists(message_type_key):
+        if self._confstore.exact_key_exists(message_type_key):
             self._confstore.delete(message_type_key)
         Log.info(f"Unsubscribed component {component} from message_type {message_type}")
 
@@ -139,12 +150,9 @@ class EventManager:
            key: cortx>ha>v1>events>subscribe>hare
            confstore value: ['node>server>failed', 'disk>online' ...]
         '''
-        if self._confstore.key_exists(key):
-            event_json_list = self._confstore.get(key)
-
-            # Get the event list from confstore first
-            _, event_list = event_json_list.popitem()
-
+        # Get the event list from confstore first
+        event_list = self._confstore.get_value(key)
+        if event_list is not None:
             event_list = json.loads(event_list)
             for event in val:
                 new_val = resource_type + HA_DELIM + functional_type + HA_DELIM + event
@@ -185,11 +193,9 @@ class EventManager:
                 new_key = EVENT_MANAGER_KEYS.EVENT_KEY.value.replace(
                     "<resource>", resource_type).replace(
                         "<functional_type>", functional_type).replace("<state>", state)
-                if self._confstore.key_exists(new_key):
-                    comp_json_list = self._confstore.get(new_key)
-
-                    # Get the list of components from confstore
-                    _, comp_list = comp_json_list.popitem()
+                # Get the list of components from confstore
+                comp_list = self._confstore.get_value(new_key)
+                if comp_list is not None:
                     comp_list = json.loads(comp_list)
                     if comp not in comp_list:
                         # If not already added, append to the old list
@@ -225,10 +231,9 @@ class EventManager:
         for state in states:
             delete_required_state = resource_type + HA_DELIM + func_type + HA_DELIM + state
             key = EVENT_MANAGER_KEYS.SUBSCRIPTION_KEY.value.replace("<component_id>", component)
-            if self._confstore.key_exists(key):
-                comp_json_list = self._confstore.get(key)
-                # Get the event list from confstore
-                _, event_list = comp_json_list.popitem()
+            # Get the event list from confstore
+            event_list = self._confstore.get_value(key)
+            if event_list is not None:
                 event_list = json.loads(event_list)
                 # Remove the event from the list(coming from confstore)
                 if delete_required_state in event_list:
@@ -265,10 +270,9 @@ class EventManager:
                         "<resource>", resource_type).replace(
                             "<functional_type>", func_type).replace(
                                 "<state>", state)
-            if self._confstore.key_exists(key):
-                comp_json_list = self._confstore.get(key)
-                # Get the component list
-                _, comp_list = comp_json_list.popitem()
+            # Get the component list
+            comp_list = self._confstore.get_value(key)
+            if comp_list is not None:
                 comp_list = json.loads(comp_list)
                 # Remove component from the list
                 if component in comp_list:
@@ -289,15 +293,28 @@ class EventManager:
 
     def _get_producer(self, component: str) -> object:
         """
-        Get Producer object.
+        Get Producer object, created once per component.
+
+        Args:
+            component (str): Component
+        """
+        with self._lock:
+            producer = self._producers.get(component)
+            if producer is None:
+                producer = self._create_producer(component)
+                self._producers[component] = producer
+        return producer
+
+    def _create_producer(self, component: str) -> object:
+        """
+        Create Producer object for component message type.
 
         Args:
             component (str): Component
         """
         producer_id = const.EVENT_MGR_PRODUCER_ID.replace("<component_id>", component)
         message_type_key = EVENT_MANAGER_KEYS.MESSAGE_TYPE_KEY.value.replace("<component_id>", component)
-        message_type_key_val = self._confstore.get(message_type_key)
-        _, message_type = message_type_key_val.popitem()
+        message_type = self._confstore.get_value(message_type_key)
         return MessageBus.get_producer(producer_id, message_type)
 
     def subscribe(self, component: SUBSCRIPTION_LIST, events: List[SubscribeEvent]) -> str:
@@ -328,6 +345,7 @@ class EventManager:
                     self._store_event_key(event.resource_type, func_type, event.states, comp=component)
                     for state in event.states:
                         self._monitor_rule.add_rule(event.resource_type, func_type, state, self._default_action)
+            self._invalidate_fanout()
             Log.info(f"Successfully Subscribed component {component} with message_type {message_type}")
             return message_type
         except Exception as e:
@@ -363,8 +381,9 @@ class EventManager:
                             "<resource>", event.resource_type).replace(
                                 "<functional_type>", func_type).replace(
                                     "<state>", state)
-                        if not self._confstore.key_exists(key):
+                        if not self._confstore.exact_key_exists(key):
                             self._monitor_rule.remove_rule(event.resource_type, func_type, state, self._default_action)
+            self._invalidate_fanout()
             Log.info(f"Successfully UnSubscribed component {component}")
         except InvalidComponent:
             raise
@@ -387,14 +406,57 @@ class EventManager:
         value = []
         Log.debug(f"Fetching subscribed events for {key}")
 
-        kv = self._confstore.get(key)
-        if kv:
-            for k, v in kv.items():
-                if k.endswith(key):
-                    value.extend(json.loads(v))
-                    break
+        events = self._confstore.get_value(key)
+        if events:
+            value.extend(json.loads(events))
         return value
 
+    def _invalidate_fanout(self) -> None:
+        """
+        Drop the fan-out table after subscription change by this process,
+        it is reloaded on next publish.
+        """
+        self._fanout = None
+
+    def _on_events_change(self, index: int, data: dict) -> None:
+        """
+        Consul watch callback, rebuilds the fan-out table from event keys.
+        """
+        self._fanout = self._build_fanout(data)
+        Log.debug(f"Loaded {len(self._fanout)} event subscriptions at index {index}")
+
+    def _build_fanout(self, data: dict) -> dict:
+        """
+        Prepare fan-out table from the event keys,
+        ex. events>node>server>failed: ["hare"], subscription keys are skipped.
+        """
+        fanout = {}
+        for key, val in (data or {}).items():
+            if not key.startswith(self._events_prefix):
+                continue
+            event_key = tuple(key[len(self._events_prefix):].split(HA_DELIM))
+            if len(event_key) != 3 or event_key[0] == const.SUBSCRIBE_KEY:
+                continue
+            try:
+                fanout[event_key] = json.loads(val)
+            except (TypeError, ValueError):
+                Log.warn(f"Invalid subscription {key}: {val}")
+        return fanout
+
+    def _get_components(self, resource_type: str, functional_type: str, state: str) -> list:
+        """
+        Get components subscribed for the event from fan-out table.
+        """
+        with self._lock:
+            if not self._watching:
+                self._confstore.watch(const.EVENTS_KEY_PREFIX, self._on_events_change)
+                self._watching = True
+        fanout = self._fanout
+        if fanout is None:
+            fanout = self._build_fanout(self._confstore.get(const.EVENTS_KEY_PREFIX))
+            self._fanout = fanout
+        return fanout.get((resource_type, functional_type, state), [])
+
     def publish(self, event: HealthEvent) -> None:
         """
         Publish event.
@@ -403,7 +465,6 @@ class EventManager:
         """
         try:
             #TODO: Use Transactional producer in future.
-            component_list = []
             resource_type = event[EventAttr.EVENT_PAYLOAD.value][HealthAttr.RESOURCE_TYPE.value]
             specific_info = event[EventAttr.EVENT_PAYLOAD.value][HealthAttr.SPECIFIC_INFO.value]
             if specific_info and specific_info.get(SPECIFIC_INFO_ATTRIBUTES.FUNCTIONAL_TYPE.value):
@@ -411,18 +472,12 @@ class EventManager:
             else:
                 functional_type = FUNCTIONAL_TYPES.ALL.value
             # Run through list of components subscribed for this event and send event to each of them
-            component_list_key = EVENT_MANAGER_KEYS.EVENT_KEY.value.replace(
-                "<resource>", resource_type).replace(
-                    "<functional_type>", functional_type).replace(
-                        "<state>", event[EventAttr.EVENT_PAYLOAD.value][HealthAttr.RESOURCE_STATUS.value])
-            component_list_key_val = self._confstore.get(component_list_key)
-            if component_list_key_val:
-                _, value = component_list_key_val.popitem()
-                component_list = json.loads(value)
+            component_list = self._get_components(resource_type, functional_type,
+                                                  event[EventAttr.EVENT_PAYLOAD.value][HealthAttr.RESOURCE_STATUS.value])
+            event_to_send = event.json if component_list else None
             for component in component_list:
                 if component != event[EventAttr.EVENT_PAYLOAD.value][HealthAttr.SOURCE.value]:
                     message_producer = self._get_producer(component)
-                    event_to_send = event.json
                     Log.info(f"Sending action event {event_to_send} to component {component}")
                     message_producer.publish(event_to_send)
         except Exception as e:
@@ -438,13 +493,5 @@ class EventManager:
         if isinstance(component, SUBSCRIPTION_LIST):
             component = component.value
         key = EVENT_MANAGER_KEYS.MESSAGE_TYPE_KEY.value.replace("<component_id>", component)
-        value = None
         Log.debug(f"Fetching message type for {key}")
-
-        kv = self._confstore.get(key)
-        if kv:
-            for k, v in kv.items():
-                if k.endswith(key):
-                    value = v
-                    break
-        return value
+        return self._confstore.get_value(key)
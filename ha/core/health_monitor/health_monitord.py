@@ -36,6 +36,7 @@ from ha.core.health_monitor import const
 from ha.core.system_health.model.health_event import HealthEvent
 from ha.util.message_bus import MessageBus
 from ha.util.message_bus import CONSUMER_STATUS
+from ha.util.sharded_dispatcher import ShardedDispatcher
 from ha.core.config.config_manager import ConfigManager
 from ha.core.health_monitor.monitor_rules_manager import MonitorRulesManager
 
@@ -73,6 +74,7 @@ class HealthMonitorService:
         signal.signal(signal.SIGTERM, self.set_sigterm)
         self._confstore = ConfigManager.get_confstore()
         self._rule_manager = MonitorRulesManager()
+        self._dispatcher = None
         self._event_consumer = self._get_consumer()
 
     def _get_consumer(self):
@@ -82,19 +84,46 @@ class HealthMonitorService:
         consumer_id = Conf.get(HA_GLOBAL_INDEX, f"EVENT_MANAGER{_DELIM}consumer_id")
         consumer_group = Conf.get(HA_GLOBAL_INDEX, f"EVENT_MANAGER{_DELIM}consumer_group")
         message_type = Conf.get(HA_GLOBAL_INDEX, f"EVENT_MANAGER{_DELIM}message_type")
+        batch_size = int(Conf.get(HA_GLOBAL_INDEX, f"EVENT_MANAGER{_DELIM}batch_size", 1))
+        workers = int(Conf.get(HA_GLOBAL_INDEX, f"EVENT_MANAGER{_DELIM}workers", 1))
+        batch_callback = None
+        if workers > 1:
+            # Events of different resources are evaluated in parallel, needs batches to spread.
+            # Each worker has its own rules manager, rule table is not shared between threads.
+            callbacks = [self._get_callback(MonitorRulesManager()) for _ in range(workers)]
+            self._dispatcher = ShardedDispatcher(callbacks, name="health_monitor")
+            batch_callback = self._dispatcher.dispatch
+            batch_size = max(batch_size, workers)
         MessageBus.init()
         return MessageBus.get_consumer(consumer_id=consumer_id, consumer_group=consumer_group,
-                                        message_type=message_type, callback=self.process_event)
+                                        message_type=message_type, callback=self.process_event,
+                                        batch_size=batch_size, batch_callback=batch_callback)
 
-    def process_event(self, message: str) -> None:
+    def _get_callback(self, rule_manager: MonitorRulesManager):
+        """
+        Callback for a dispatcher worker using its own rules manager.
+        """
+        return lambda message: self._process_event(message, rule_manager)
+
+    def process_event(self, message) -> None:
         """
         Callback function to receive and process event.
 
         Args:
-            message (str): event message.
+            message (bytes): event message.
+        """
+        return self._process_event(message, self._rule_manager)
+
+    def _process_event(self, message, rule_manager: MonitorRulesManager) -> None:
+        """
+        Evaluate rules of the event and act on it.
+
+        Args:
+            message (bytes/dict): event message or event decoded by the dispatcher.
+            rule_manager (MonitorRulesManager): rules manager of the calling thread.
         """
         try:
-            event = json.loads(message.decode('utf-8'))
+            event = message if isinstance(message, dict) else json.loads(message.decode('utf-8'))
             health_event = HealthEvent.dict_to_object(event)
         except Exception as e:
             Log.error(f"Invalid format for event {message}, Error: {e}. Forcefully ack.")
@@ -102,7 +131,7 @@ class HealthMonitorService:
         Log.debug(f"Captured {message} for evaluating health monitor.")
         action_handler = None
         try:
-            action_list = self._rule_manager.evaluate(health_event)
+            action_list = rule_manager.evaluate(health_event)
             if action_list:
                 Log.info(f"Evaluated {health_event} with action {action_list}")
                 action_handler = ActionFactory.get_action_handler(health_event, action_list)
@@ -119,6 +148,8 @@ class HealthMonitorService:
         Log.info(f"Received SIGTERM: {signum}")
         Log.debug(f"Stopping the Health Monitor as received a signal: {signum} during execution of frame: {frame}")
         self._event_consumer.stop(flush=True)
+        if self._dispatcher is not None:
+            self._dispatcher.stop()
 
     def start(self):
         """
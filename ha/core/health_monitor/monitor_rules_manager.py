@@ -16,6 +16,7 @@
 # cortx-questions@seagate.com.
 
 import json
+from threading import Lock
 from cortx.utils.log import Log
 from ha.const import HA_DELIM
 from ha.core.health_monitor.const import HEALTH_MON_ACTIONS
@@ -25,13 +26,21 @@ from ha.core.config.config_manager import ConfigManager
 from ha.core.system_health.const import HEALTH_STATUSES, SPECIFIC_INFO_ATTRIBUTES
 from ha.core.health_monitor.error import InvalidAction
 
+ALL_FUNCTIONAL_TYPES = "all"
+
 class MonitorRulesManager:
 
     def __init__(self):
 
         self._confstore = ConfigManager.get_confstore()
-
-    def _prepare_key(self, resource_type: str, event_type: str, functional_type: str = "all") -> str:
+        # Rule table {(resource_type, functional_type, event_type): actions},
+        # loaded on first evaluate and kept updated by consul watch.
+        self._rules = None
+        self._watching = False
+        self._rules_lock = Lock()
+        self._rule_prefix = f"{self._confstore._prepare_key(HEALTH_MON_KEYS.ACT_RULE.value)}{HA_DELIM}"
+
+    def _prepare_key(self, resource_type: str, event_type: str, functional_type: str = ALL_FUNCTIONAL_TYPES) -> str:
         """
         Prepare a key for the health monitor rules lookup, using HEALTH_MON_KEYS
 
@@ -51,37 +60,64 @@ class MonitorRulesManager:
         """
         return f"{HEALTH_MON_KEYS.ACT_RULE.value}{HA_DELIM}{resource_type}{HA_DELIM}{functional_type}{HA_DELIM}{event_type}"
 
-    def _get_val(self, key: str) -> str:
+    def _get_val(self, key: str) -> list:
         """
-        Check if the key exists. Return KV if yes else return None
+        Get actions of the rule key, only the exact key is read.
 
         Args
             key(str)
 
         Returns:
-            val(str): Returns KV
+            list: actions, None if rule does not exist.
         """
-        val = None
-        # TODO: please check if key_exists() can be skipped here.
-        if self._confstore.key_exists(key):
-            val = self._confstore.get(key)
-        return val
+        val = self._confstore.get_value(key)
+        return json.loads(val) if val is not None else None
 
-    def _get_k_v(self, kv: dict):
+    def _load_rules(self) -> dict:
         """
-        Extract key, value from the KV
-        Convert value from string to list
-
-        Args:
-            kv : KV returned from confstore
-
-        Returns:
-            key
-            value
+        Load rule table and watch consul for rules added or removed by
+        other processes.
         """
-        key, val = kv.popitem()
-        val = json.loads(val)
-        return key, val
+        with self._rules_lock:
+            if not self._watching:
+                self._confstore.watch(HEALTH_MON_KEYS.ACT_RULE.value, self._on_rules_change)
+                self._watching = True
+        if self._rules is None:
+            # consul was not reachable, rules are loaded by the watch once it is
+            raise Exception("Monitor rules are not loaded yet.")
+        return self._rules
+
+    def _on_rules_change(self, index: int, data: dict) -> None:
+        """
+        Consul watch callback, rebuilds the rule table from all the rule keys.
+        """
+        rules = {}
+        for key, val in (data or {}).items():
+            if not key.startswith(self._rule_prefix):
+                continue
+            rule = tuple(key[len(self._rule_prefix):].split(HA_DELIM))
+            if len(rule) != 3:
+                continue
+            try:
+                rules[rule] = json.loads(val)
+            except (TypeError, ValueError):
+                Log.warn(f"Invalid monitor rule {key}: {val}")
+        self._rules = rules
+        Log.info(f"Loaded {len(rules)} monitor rules at index {index}")
+
+    def _set_rule(self, resource_type: str, functional_type: str, event_type: str, actions: list) -> None:
+        """
+        Update rule table with the rule written by this process, without
+        waiting for the consul watch.
+        """
+        if self._rules is None:
+            return
+        rules = dict(self._rules)
+        if actions:
+            rules[(resource_type, functional_type, event_type)] = list(actions)
+        else:
+            rules.pop((resource_type, functional_type, event_type), None)
+        self._rules = rules
 
     def _validate_action(self, action: str):
         """
@@ -104,19 +140,18 @@ class MonitorRulesManager:
         Returns:
             list: actions configured for the rule
         """
-        val = []
+        rules = self._load_rules()
+        functional_type = ALL_FUNCTIONAL_TYPES
         if event.specific_info and event.specific_info.get(SPECIFIC_INFO_ATTRIBUTES.FUNCTIONAL_TYPE.value):
-            key = self._prepare_key(event.resource_type,
-                                    event.event_type,
-                                    event.specific_info.get(SPECIFIC_INFO_ATTRIBUTES.FUNCTIONAL_TYPE.value))
-        else:
-            key = self._prepare_key(event.resource_type, event.event_type)
-        Log.debug(f"Evaluating rule for {key}")
-        kv = self._get_val(key)
-        if kv:
-            _, val = self._get_k_v(kv)
-        Log.info(f"Evaluated action {val} for key {key}")
-        return val
+            functional_type = event.specific_info.get(SPECIFIC_INFO_ATTRIBUTES.FUNCTIONAL_TYPE.value)
+        rule = (event.resource_type, functional_type, event.event_type)
+        Log.debug(f"Evaluating rule for {rule}")
+        val = rules.get(rule)
+        if val is None:
+            # Rule for all the functional types of the resource
+            val = rules.get((event.resource_type, ALL_FUNCTIONAL_TYPES, event.event_type), [])
+        Log.info(f"Evaluated action {val} for rule {rule}")
+        return list(val)
 
     def add_rule(self, resource: str, functional_type: str, event: HEALTH_STATUSES , action: HEALTH_MON_ACTIONS):
         """
@@ -130,22 +165,19 @@ class MonitorRulesManager:
         """
         self._validate_action(action)
         key = self._prepare_key(resource, event, functional_type)
-        val = []
         Log.info(f"Adding rule for key: {key} ,value: {action}")
-        kv = self._get_val(key)
-        if kv:
-            _, val = self._get_k_v(kv)
+        val = self._get_val(key)
+        if val is not None:
             if action not in val:
                 val.append(action)
-                val = json.dumps(val)
-                self._confstore.update(key, val)
+                self._confstore.update(key, json.dumps(val))
             else:
                 Log.warn(f"key value already exists for {key} , {action}")
                 return
         else:
-            val.append(action)
-            val = json.dumps(val)
-            self._confstore.set(key, val)
+            val = [action]
+            self._confstore.set(key, json.dumps(val))
+        self._set_rule(resource, functional_type, event, val)
 
     def remove_rule(self, resource: str, func_type: str, event: HEALTH_STATUSES , action: HEALTH_MON_ACTIONS):
         """
@@ -159,11 +191,9 @@ class MonitorRulesManager:
         """
         self._validate_action(action)
         key = self._prepare_key(resource, event, func_type)
-        val = []
         Log.info(f"Removing rule for key: {key} ,value: {action}")
-        kv = self._get_val(key)
-        if kv:
-            _, val = self._get_k_v(kv)
+        val = self._get_val(key)
+        if val is not None:
             if action not in val:
                 Log.warn(f"KV not found for key: {key}, value: {action}")
             else:
@@ -172,8 +202,8 @@ class MonitorRulesManager:
                     self._confstore.delete(key)
                     Log.debug(f"key value removed for {key} , {action}. value list empty; deleting key {key}")
                 else:
-                    val = json.dumps(val)
-                    self._confstore.update(key, val)
+                    self._confstore.update(key, json.dumps(val))
                     Log.debug(f"KV removed for {key} , {action}")
+                self._set_rule(resource, func_type, event, val)
         else:
             Log.warn(f"key {key} not found")
@@ -16,7 +16,6 @@
 
 import abc
 import json
-import re
 import time
 import uuid
 from cortx.utils.log import Log
@@ -48,23 +47,7 @@ class ElementHealthEvaluator(metaclass=abc.ABCMeta):
         Prepare Key. This is an internal method for preparing component status key.
         This will be used when updating/querying a component status.
         """
-        # Get the key template.
-        key = SystemHealthComponents.get_key(component)
-        if "comp_id" in kwargs:
-            key = key.replace(f"${component}_id", kwargs["comp_id"])
-        # Check what all substitutions with actual values passed in kwargs to be done.
-        subs = re.findall("\$\w+", key)
-        # Check if the related argument present in kwargs, if yes substitute the same.
-        for sub in subs:
-            argument = re.split("\$", sub)
-            if argument[1] in kwargs:
-                key = re.sub("\$\w+", kwargs[argument[1]], key, 1)
-            else:
-                # Argument not present, break and return the key till this missing argument.
-                key = re.split("\$", key)
-                key = key[0]
-                break
-        return key
+        return SystemHealthComponents.get_key_template(component).format(kwargs)
 
     def get_children(self, element: str, element_id: str, **kwargs) -> dict:
         """
@@ -83,8 +66,7 @@ class ElementHealthEvaluator(metaclass=abc.ABCMeta):
             return {}
         key = ElementHealthEvaluator.prepare_key(element, comp_id=element_id, **kwargs)
         key = key.replace(f"{HA_DELIM}health", "").replace(HA_DELIM, "", 1)
-        data = self.healthmanager.get_key(key, just_value=False)
-        for element in data.keys():
+        for element in self.healthmanager.get_key_names(key):
             key_list = element.split(HA_DELIM)
             if children[0] in key_list:
                 child_index = key_list.index(children[0])
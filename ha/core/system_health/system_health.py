@@ -14,7 +14,6 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
-import re
 import time
 import ast
 import json
@@ -34,13 +33,14 @@ from ha.core.system_health.system_health_metadata import SystemHealthComponents,
 from ha.core.system_health.model.health_event import HealthEvent
 from ha.core.system_health.model.entity_health import EntityEvent, EntityAction, EntityHealth
 from ha.core.system_health.status_mapper import StatusMapper
-from ha.core.system_health.system_health_manager import SystemHealthManager
+from ha.core.system_health.system_health_manager import SystemHealthManager, HEALTH_KEY_PREFIX
 from ha.core.error import HaSystemHealthException
 from ha.core.system_health.health_evaluator_factory import HealthEvaluatorFactory
 from ha.core.cluster.const import SYSTEM_HEALTH_OUTPUT_V2, GET_SYS_HEALTH_ARGS
 from ha.core.system_health.const import CLUSTER_ELEMENTS, HEALTH_STATUSES, HEALTH_EVENT_ACTIONS, HEALTH_EVENTS
 from ha.core.system_health.model.health_status import StatusOutput, ComponentStatus
 from ha.core.system_health.system_health_hierarchy import HealthHierarchy
+from ha.core.system_health.system_health_index import SystemHealthIndex, HealthIndexEntry
 from ha.core.event_manager.resources import RESOURCE_TYPES
 from ha.fault_tolerance.const import HEALTH_EVENT_SOURCES
 
@@ -49,23 +49,31 @@ class SystemHealth(Subscriber):
     System Health. This class implements an interface to the HA System Health module.
     """
 
-    def __init__(self, store):
+    def __init__(self, store, producer=None):
         """
         Init method.
+
+        Args:
+            store: health key store.
+            producer (MessageBusProducer, optional): producer of health events,
+                created if not given. It is thread safe, so it can be shared.
         """
         self.update_hierarchy = []
         self.node_id = None
         self.node_map = {}
+        # {node_id: {disk_id: cvg_id}} loaded from the disk cvg map keys
+        self._disk_cvg_map = {}
         self.statusmapper = StatusMapper()
         # TODO: Convert SystemHealthManager to singleton class
         self.healthmanager = SystemHealthManager(store)
         HealthEvaluatorFactory.init_evaluators()
         # TODO: Temporary code remove when all status method moved to evaluators
         self.health_evaluator = HealthEvaluatorFactory.get_generic_evaluator()
-        self.producer = self._get_producer()
+        self.producer = producer if producer is not None else SystemHealth.get_producer()
         Log.info("All cluster element are loaded, Ready to process alerts .................")
 
-    def _get_producer(self):
+    @staticmethod
+    def get_producer():
         message_type = Conf.get(const.HA_GLOBAL_INDEX, f"EVENT_MANAGER{_DELIM}message_type")
         producer_id = Conf.get(const.HA_GLOBAL_INDEX, f"EVENT_MANAGER{_DELIM}producer_id")
         return MessageBus.get_producer(producer_id, message_type)
@@ -121,8 +129,8 @@ class SystemHealth(Subscriber):
             Log.debug(f"{component} level {component_level}, depth to return {depth}, total available depth {total_depth}")
 
             self._id_not_found = False
-            # Get raw status starting from cluster
-            self._status_dict = self.get_status_raw(CLUSTER_ELEMENTS.CLUSTER.value)
+            # Get raw status starting from cluster and index it once.
+            self._status_index = SystemHealthIndex(self.get_status_raw(CLUSTER_ELEMENTS.CLUSTER.value))
             # Prepare and return the output
             output = StatusOutput(version)
             self._prepare_status(component, component_id = component_id, start_level = component_level, current_level = component_level, depth = depth, parent = output)
@@ -139,88 +147,39 @@ class SystemHealth(Subscriber):
             Log.error(f"Failed reading status. Error: {e}")
             raise HaSystemHealthException("Failed reading status")
 
-    def _prepare_status(self, component, component_id: str = None, start_level: int = 1, current_level: int = 1, depth: int = 1, parent: object = None):
+    def _prepare_status(self, component, component_id: str = None, start_level: int = 1, current_level: int = 1, depth: int = 1, parent: object = None, entries: list = None):
         Log.debug(f"Prepare status for component {component}, id {component_id}, level {current_level}, depth {depth}")
-        # At requested level in the hierarchy
-        if current_level == depth:
-            # If request was with depth = 1 and id was provided.
-            if component_id != None:
-                status_key = self._is_status_present(component, component_id = component_id)
-                if status_key is None:
-                    self._id_not_found = True
-                    return
-                component_status = self._prapare_component_status(component, component_id = component_id, key = status_key)
+        # At the requested level look up the whole index, below it only the children of the parent.
+        if entries is None:
+            entries = self._status_index.find(component, component_id)
+        if component_id != None:
+            if not entries:
+                self._id_not_found = True
+                return
+            entries = entries[:1]
+        Log.debug(f"Status present for component {component}, id {component_id}: {[entry.key for entry in entries]}")
+        for entry in entries:
+            component_status = self._prapare_component_status(component, entry)
+            if current_level == start_level:
                 parent.add_health(component_status)
             else:
-                # Prepare and return status for all available components at this level
-                while True:
-                    status_key = self._is_status_present(component)
-                    if status_key == None:
-                        break
-                    component_status = self._prapare_component_status(component, key = status_key)
-                    if current_level == start_level:
-                        parent.add_health(component_status)
-                    else:
-                        parent.add_resource(component_status)
-                    del self._status_dict[status_key]
-        else:
-            # Prepare and return status for all available components at this and further levels
-            if component_id != None:
-                status_key = self._is_status_present(component, component_id = component_id)
-                if status_key is None:
-                    self._id_not_found = True
-                    return
-                component_status = self._prapare_component_status(component, component_id = component_id, key = status_key)
-                parent.add_health(component_status)
-                del self._status_dict[status_key]
+                parent.add_resource(component_status)
+            if current_level != depth:
+                # Prepare and return status for all available components at further levels
                 next_components = HealthHierarchy.get_next_components(component)
                 for _, value in enumerate(next_components):
-                    self._prepare_status(value, start_level = start_level, current_level = current_level + 1, depth = depth, parent = component_status)
-            else:
-                # Prepare and return status for all available components at this and further levels
-                found_any_components = False
-                while True:
-                    status_key = self._is_status_present(component)
-                    if status_key == None:
-                        break
-                    found_any_components = True
-                    component_status = self._prapare_component_status(component, key = status_key)
-                    if current_level == start_level:
-                        parent.add_health(component_status)
-                    else:
-                        parent.add_resource(component_status)
-                    del self._status_dict[status_key]
-                    next_components = HealthHierarchy.get_next_components(component)
-                    for _, value in enumerate(next_components):
-                        self._prepare_status(value, start_level = start_level, current_level = current_level + 1, depth = depth, parent = component_status)
-                if found_any_components == False:
-                    self._partial_status = True
+                    self._prepare_status(value, start_level = start_level, current_level = current_level + 1, depth = depth,
+                                         parent = component_status, entries = entry.get_children(value))
+        if not entries and current_level != depth:
+            self._partial_status = True
 
-    def _is_status_present(self, component, component_id: str = None) -> str:
-        status_key = None
-        if component_id is not None:
-            for key in self._status_dict:
-                if re.search(f"{component}{const.HA_DELIM}{component_id}{const.HA_DELIM}health", key):
-                    status_key = key
-                    break
-        else:
-            for key in self._status_dict:
-                if re.search(f"{component}{const.HA_DELIM}.+{const.HA_DELIM}health", key):
-                    split_key = re.split(const.HA_DELIM, key)
-                    if component == split_key[-3]:
-                        status_key = key
-                        break
-        Log.debug(f"Status key {status_key} present for component {component}, id {component_id}")
-        return status_key
-
-    def _prapare_component_status(self, component: str, component_id: str = None, key: str = None) -> object:
+    def _prapare_component_status(self, component: str, entry: HealthIndexEntry = None) -> object:
             status = HEALTH_STATUSES.UNKNOWN.value
             created_timestamp = HEALTH_STATUSES.UNKNOWN.value
-            if key is not None:
-                entity_health = self._status_dict[key]
-                entity_health = json.loads(entity_health)
-                split_key = re.split(const.HA_DELIM, key)
-                component_id = split_key[-2]
+            component_id = None
+            if entry is not None:
+                entity_health = json.loads(entry.value)
+                component_id = entry.component_id
                 status = entity_health["events"][0]["status"]
                 created_timestamp = entity_health['events'][0]['created_timestamp']
 
@@ -383,6 +342,30 @@ class SystemHealth(Subscriber):
             Log.error(f"Failed to get cvg_id for {healthevent.resource_id} of node {self.node_id}")
         return cvg_list
 
+    def set_disk_cvg_map(self, disk_cvg_map: dict) -> None:
+        """
+        Store the cvg of every disk, one key per node.
+        Args:
+            disk_cvg_map: {node_id: {disk_id: cvg_id}}
+        """
+        self.healthmanager.set_keys({self._prepare_key(const.COMPONENTS.DISK_CVG_MAP.value, node_id=node_id): json.dumps(disks)
+                                     for node_id, disks in disk_cvg_map.items()})
+        self._disk_cvg_map.update(disk_cvg_map)
+
+    def _get_disk_cvg(self, node_id: str, disk_id: str) -> str:
+        """
+        Get cvg id of the disk from the disk cvg map of the node. Map is read
+        again if the disk is not found, it may be updated after loading.
+        Returns:
+            cvg id, None if disk is not in the map.
+        """
+        disks = self._disk_cvg_map.get(node_id)
+        if disks is None or disk_id not in disks:
+            value = self.healthmanager.get_key(self._prepare_key(const.COMPONENTS.DISK_CVG_MAP.value, node_id=node_id))
+            disks = json.loads(value) if value else {}
+            self._disk_cvg_map[node_id] = disks
+        return disks.get(disk_id)
+
     def process_event(self, healthevent: HealthEvent):
         """
         Process Event method. This method could be called for updating the health status.
@@ -415,12 +398,15 @@ class SystemHealth(Subscriber):
                 if healthevent.specific_info.get(NODE_MAP_ATTRIBUTES.CVG_ID.value):
                     self.cvg_id = healthevent.specific_info[NODE_MAP_ATTRIBUTES.CVG_ID.value]
                 else:
-                    match_criteria = {CLUSTER_ELEMENTS.NODE.value: self.node_id,
-                                      component_type: component_id}
-                    cvg_list = self._get_cvg_list(healthevent, match_criteria)
-                    if len(cvg_list) > 1:
-                        Log.error(f"Expected only 1 cvg_id, but received {len(cvg_list)}")
-                    self.cvg_id = cvg_list[0] if cvg_list else None
+                    self.cvg_id = self._get_disk_cvg(self.node_id, component_id)
+                    if self.cvg_id is None:
+                        # Disk is not in the disk cvg map, search the health keys
+                        match_criteria = {CLUSTER_ELEMENTS.NODE.value: self.node_id,
+                                          component_type: component_id}
+                        cvg_list = self._get_cvg_list(healthevent, match_criteria)
+                        if len(cvg_list) > 1:
+                            Log.error(f"Expected only 1 cvg_id, but received {len(cvg_list)}")
+                        self.cvg_id = cvg_list[0] if cvg_list else None
                     healthevent.specific_info[NODE_MAP_ATTRIBUTES.CVG_ID.value] = self.cvg_id
 
             self.node_map = {'cluster_id':healthevent.cluster_id, 'site_id':healthevent.site_id,
@@ -520,6 +506,97 @@ class SystemHealth(Subscriber):
             Log.error(f"Failed processing system health event with Error: {err}")
             raise HaSystemHealthException("Failed processing system health event")
 
+    def bootstrap(self, healthevents: list) -> dict:
+        """
+        Add initial health of many resources together. Stored health is read
+        once, new health values are prepared in memory and written with one
+        set_keys call, which commits them in transactions for batch enabled
+        store. Resources already having health are updated and published
+        same as process_event. Events of the monitor carry the pod generation
+        id used to detect node restart, they are passed to process_event.
+
+        Args:
+            healthevents (list): HealthEvent for each resource.
+
+        Returns:
+            dict: time taken(sec) by each phase, read, prepare, write and publish.
+        """
+        timing = {}
+        start = time.perf_counter()
+        stored = self.healthmanager.get_keys_values(HEALTH_KEY_PREFIX)
+        timing["read"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        records = {}
+        publish_events = []
+        monitor_events = []
+        for healthevent in healthevents:
+            if healthevent.source == HEALTH_EVENT_SOURCES.MONITOR.value:
+                monitor_events.append(healthevent)
+                continue
+            key, current_health, updated_health = self._prepare_bootstrap_health(healthevent, stored)
+            if current_health and self._is_update_required(current_health, updated_health, healthevent) == \
+                    HEALTH_EVENT_ACTIONS.IGNORE.value:
+                continue
+            records[key] = updated_health
+            stored[self.healthmanager.get_full_key(key)] = updated_health
+            if current_health:
+                publish_events.append(healthevent)
+        timing["prepare"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.healthmanager.set_keys(records)
+        timing["write"] = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for healthevent in publish_events:
+            self.producer.publish_async(str(healthevent))
+        self.producer.flush()
+        for healthevent in monitor_events:
+            self.process_event(healthevent)
+        timing["publish"] = time.perf_counter() - start
+        Log.info(f"SystemHealth: Bootstrapped health of {len(healthevents)} resources, "
+                 f"updated {len(records)} keys, published {len(publish_events)} events, "
+                 f"processed {len(monitor_events)} monitor events. Time taken: {timing}")
+        return timing
+
+    def _prepare_bootstrap_health(self, healthevent: HealthEvent, stored: dict) -> tuple:
+        """
+        Prepare health value of resource from the stored health values.
+
+        Returns:
+            tuple: health key, current health value or None, updated health value.
+        """
+        component = SystemHealthComponents.get_component(healthevent.resource_type)
+        comp_type = healthevent.resource_type.split(':')[-1]
+        self.node_id = healthevent.node_id
+        self.cvg_id = None
+        if comp_type == CLUSTER_ELEMENTS.DISK.value:
+            if not isinstance(healthevent.specific_info, dict):
+                healthevent.specific_info = {}
+            self.cvg_id = healthevent.specific_info.get(NODE_MAP_ATTRIBUTES.CVG_ID.value)
+            if not self.cvg_id:
+                cvg_list = self._get_cvg_list(healthevent, {CLUSTER_ELEMENTS.NODE.value: self.node_id,
+                                                            comp_type: healthevent.resource_id})
+                self.cvg_id = cvg_list[0] if cvg_list else None
+                healthevent.specific_info[NODE_MAP_ATTRIBUTES.CVG_ID.value] = self.cvg_id
+        key = self._prepare_key(component, cluster_id=healthevent.cluster_id, site_id=healthevent.site_id,
+                                rack_id=healthevent.rack_id, storageset_id=healthevent.storageset_id,
+                                node_id=self.node_id, server_id=self.node_id, storage_id=self.node_id,
+                                comp_type=comp_type, comp_id=healthevent.resource_id, cvg_id=self.cvg_id)
+        current_health = stored.get(self.healthmanager.get_full_key(key))
+        if current_health:
+            specific_info = json.loads(current_health)["events"][0]["specific_info"]
+            if specific_info and specific_info.get('functional_type'):
+                healthevent.specific_info['functional_type'] = specific_info.get('functional_type')
+            latest_health = EntityHealth.read(current_health)
+        else:
+            latest_health = EntityHealth()
+        status = self.statusmapper.map_event(healthevent)
+        updated_health = SystemHealth.create_updated_event_object(healthevent.timestamp, str(int(time.time())),
+                                                                  status, healthevent.specific_info, latest_health)
+        return key, current_health, updated_health
+
     def get_health_event_template(self, nodeid: str, event_type: str, source: str) -> dict:
         """
         Create health event
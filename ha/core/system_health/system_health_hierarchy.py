@@ -22,6 +22,9 @@ from cortx.utils.log import Log
 class HealthHierarchy:
 
     SCHEMA = None
+    # Index of the schema components {component: (level, next components)}
+    _index: dict = {}
+    _index_schema = None
 
     @staticmethod
     def get_schema():
@@ -33,15 +36,30 @@ class HealthHierarchy:
                 HealthHierarchy.SCHEMA = json.load(fi)
         return HealthHierarchy.SCHEMA
 
+    @staticmethod
+    def _get_index() -> dict:
+        """
+        Index levels and next components of the schema, rebuilt if the
+        schema is replaced.
+        """
+        schema = HealthHierarchy.get_schema()
+        if HealthHierarchy._index_schema is not schema:
+            components = schema["components"]
+            index = {}
+            for count, value in enumerate(components):
+                next_components = index.get(value, (0, []))[1]
+                if count < (len(components) - 1):
+                    next_components = next_components + [components[count + 1]]
+                index[value] = (count + 1, next_components)
+            HealthHierarchy._index = index
+            HealthHierarchy._index_schema = schema
+        return HealthHierarchy._index
+
     @staticmethod
     def get_component_level(component: str) -> int:
         component_level = 0
         try:
-            schema = HealthHierarchy.get_schema()
-            components = schema["components"]
-            for count, value in enumerate(components):
-                if value == component:
-                    component_level = count + 1
+            component_level = HealthHierarchy._get_index().get(component, (0, []))[0]
         except Exception as e:
             Log.error(f"Failed to fetch component level. Error: {e}")
 
@@ -69,12 +87,7 @@ class HealthHierarchy:
     def get_next_components(component: str) -> list:
         next_components = []
         try:
-            schema = HealthHierarchy.get_schema()
-            components = schema["components"]
-            for count, value in enumerate(components):
-                if value == component:
-                    if count < (len(components) -1 ):
-                        next_components.append(components[count + 1])
+            next_components = list(HealthHierarchy._get_index().get(component, (0, []))[1])
         except Exception as e:
             Log.error(f"Failed fetching next component. Error: {e}")
-        return next_components
\ No newline at end of file
+        return next_components
@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+from ha.const import HA_DELIM
+
+HEALTH_KEY_SUFFIX = "health"
+HEALTH_KEY_ROOT = "cluster"
+
+class HealthIndexEntry:
+    """
+    One element of the health tree: an element id, its raw health value
+    (None if only its children were found in the store) and its children
+    grouped per component.
+    """
+
+    __slots__ = ("component", "component_id", "key", "value", "children")
+
+    def __init__(self, component: str, component_id: str):
+        self.component = component
+        self.component_id = component_id
+        self.key = None
+        self.value = None
+        # {component: {component_id: HealthIndexEntry}}
+        self.children = {}
+
+    def get_children(self, component: str) -> list:
+        """
+        Return child entries of the given component which have a health value.
+        """
+        return [entry for entry in self.children.get(component, {}).values()
+                if entry.value is not None]
+
+class SystemHealthIndex:
+    """
+    Index of the system health keys. Every health key is split only once and
+    stored in a tree keyed by component and component id, so the health
+    status output can be assembled without scanning all keys per element.
+
+    Example:
+        key: "cortx>ha>v2>cortx>ha>system>cluster>c1>site>1>rack>1>node>n1>health"
+        is indexed as cluster:c1 -> site:1 -> rack:1 -> node:n1
+    """
+
+    def __init__(self, status_dict: dict = None):
+        """
+        Init method.
+
+        Args:
+            status_dict (dict): health key to health value map, as returned by
+                ElementHealthEvaluator.get_status_raw.
+        """
+        self._root = HealthIndexEntry(None, None)
+        # {component: [HealthIndexEntry]} in the order keys were indexed.
+        self._components = {}
+        if status_dict:
+            for key, value in status_dict.items():
+                self.add(key, value)
+
+    def add(self, key: str, value: str) -> bool:
+        """
+        Add health key to the index.
+
+        Returns:
+            bool: False if key is not a component health key.
+        """
+        tokens = key.split(HA_DELIM)
+        if len(tokens) < 3 or tokens[-1] != HEALTH_KEY_SUFFIX:
+            return False
+        try:
+            start = tokens.index(HEALTH_KEY_ROOT)
+        except ValueError:
+            return False
+        path = tokens[start:-1]
+        if len(path) % 2 != 0:
+            return False
+        entry = self._root
+        for index in range(0, len(path), 2):
+            component, component_id = path[index], path[index + 1]
+            ids = entry.children.setdefault(component, {})
+            child = ids.get(component_id)
+            if child is None:
+                child = HealthIndexEntry(component, component_id)
+                ids[component_id] = child
+                self._components.setdefault(component, []).append(child)
+            entry = child
+        entry.key = key
+        entry.value = value
+        return True
+
+    def find(self, component: str, component_id: str = None) -> list:
+        """
+        Get all entries with health value for the component, at any position
+        in the tree.
+
+        Args:
+            component (str): component, e.g. node
+            component_id (str): optional filter on the component id
+        """
+        return [entry for entry in self._components.get(component, [])
+                if entry.value is not None and
+                (component_id is None or entry.component_id == component_id)]
@@ -15,51 +15,144 @@
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
 import re
-from ha.const import _DELIM
+from cortx.utils.log import Log
+from ha.const import _DELIM, HA_DELIM
+from ha.util.consul_kv_cache import ConsulKvCache
+
+HEALTH_KEY_PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}system"
 
 class SystemHealthManager:
     """
     System Health Manager. This class provides low level get/put methods
     for storing/reading health keys to/from the store.
+    If the cache is enabled with init_cache(), health keys are read from
+    the process local cache and written through it to the store.
     """
 
+    _cache: ConsulKvCache = None
+
     def __init__(self, store):
         """
         Init method.
         """
         self._store = store
 
+    @staticmethod
+    def init_cache(store) -> ConsulKvCache:
+        """
+        Enable the write-through cache of health keys for all the
+        SystemHealthManager instances of the process. An earlier cache
+        keeps serving reads till the new one is warmed.
+        """
+        cache = ConsulKvCache(store, HEALTH_KEY_PREFIX)
+        cache.start()
+        previous, SystemHealthManager._cache = SystemHealthManager._cache, cache
+        if previous is not None:
+            previous.stop()
+        Log.info("System health cache is enabled.")
+        return cache
+
+    @staticmethod
+    def stop_cache() -> None:
+        """
+        Disable the health keys cache, keys are read from the store again.
+        """
+        if SystemHealthManager._cache is not None:
+            SystemHealthManager._cache.stop()
+            SystemHealthManager._cache = None
+
+    def _get_cache(self, key: str) -> ConsulKvCache:
+        cache = SystemHealthManager._cache
+        if cache is not None and cache.covers(key):
+            return cache
+        return None
+
     def get_key(self, key: str, just_value=True):
         """
-        Get key method.
+        Get key method. With just_value only the exact key is read,
+        else all the key values under key.
         """
-        key_val = self._store.get(key)
+        cache = self._get_cache(key)
         if just_value:
-            if key_val is not None:
-                _, value = key_val.popitem()
-                return value
-        return key_val
+            if cache is not None:
+                return cache.get_value(key)
+            return self._store.get_value(key)
+        if cache is not None:
+            return cache.get(key)
+        return self._store.get(key)
 
     def set_key(self, key: str, value: str):
         """
         Set key method.
         """
-        if self._store.key_exists(key):
+        cache = self._get_cache(key)
+        if cache is not None:
+            cache.update(key, value)
+        elif self._store.exact_key_exists(key):
             self._store.update(key=key, new_val=value)
         else:
             self._store.set(key=key, val=value)
 
+    def get_keys_values(self, key: str) -> dict:
+        """
+        Get all the key values under key.
+        Args:
+            key (str): Key.
+        Return:
+            dict: {full key: value}, full key includes the store prefix.
+        """
+        cache = self._get_cache(key)
+        key_val = cache.get(key) if cache is not None else self._store.get(key)
+        return key_val if key_val else {}
+
+    def get_full_key(self, key: str) -> str:
+        """
+        Get key as returned by get_keys_values.
+        """
+        return self._store._prepare_key(key)
+
+    def set_keys(self, key_values: dict) -> None:
+        """
+        Set many keys together. Keys are not checked for existence, with
+        batch enabled store they are written with commit in transactions,
+        other values queued in the store are not committed.
+        Args:
+            key_values (dict): {key: value}
+        """
+        for key, value in key_values.items():
+            cache = self._get_cache(key)
+            if cache is not None:
+                cache.update(key, value)
+            else:
+                self._store.update(key=key, new_val=value)
+        if self._store._enable_batch_put and key_values:
+            self._store.commit(keys=list(key_values))
+
     def key_exists(self, key: str) -> bool:
         """
-        Check if key exists.
+        Check if exactly the key exists.
         Args:
             key (str): Key.
         Return:
             bool: True if key exists else False.
         """
-        if self._store.key_exists(key):
-            return True
-        return False
+        cache = self._get_cache(key)
+        if cache is not None:
+            return cache.exact_key_exists(key)
+        return self._store.exact_key_exists(key)
+
+    def get_key_names(self, key: str) -> list:
+        """
+        Get names of all the keys under key, values are not read.
+        Args:
+            key (str): Key.
+        Return:
+            list: full key names, full key includes the store prefix.
+        """
+        cache = self._get_cache(key)
+        if cache is not None:
+            return cache.get_key_names(key)
+        return self._store.get_key_names(key)
 
     def parse_key(self, lookup, match_with, prefix):
         """
@@ -84,7 +177,11 @@ class SystemHealthManager:
         """
         match_str = [ _DELIM.join(i) for i in match_with.items() ]
         values = []
-        keys = self._store.get_keys(prefix)
+        cache = SystemHealthManager._cache
+        if cache is not None and cache.covers(prefix, full_key=True):
+            keys = cache.get_keys(prefix)
+        else:
+            keys = self._store.get_keys(prefix)
         for key in keys:
             if all(x in key for x in match_str):
                 pattern = f".*{lookup}{_DELIM}(.*){_DELIM}.*"
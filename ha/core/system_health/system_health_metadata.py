@@ -14,11 +14,50 @@
 # For any questions about this software or licensing,
 # please email opensource@seagate.com or cortx-questions@seagate.com.
 
+import re
+from typing import List, Tuple
+
 from cortx.utils.log import Log
 from ha import const
 from ha.const import HA_DELIM
 from ha.core.error import HaSystemHealthComponentsException, HaSystemHealthHierarchyException
 
+class HealthKeyTemplate:
+    """
+    Key template of a component compiled once into literal parts and
+    argument names, ex. ">cortx>...>cluster>$cluster_id>health" becomes
+    prefix ">cortx>...>cluster>" and [("cluster_id", ">health")].
+    """
+
+    __slots__ = ("component", "prefix", "parts")
+
+    _ARGUMENT = re.compile(r"\$(\w+)")
+
+    def __init__(self, component: str, template: str):
+        self.component = component
+        literals = self._ARGUMENT.split(template)
+        self.prefix: str = literals[0]
+        # [(argument name, literal after the argument)]
+        self.parts: List[Tuple[str, str]] = list(zip(literals[1::2], literals[2::2]))
+
+    def format(self, kwargs: dict) -> str:
+        """
+        Substitute arguments in the template. comp_id is used for the
+        "$<component>_id" argument. Key is returned till the first argument
+        missing in kwargs.
+        """
+        key = [self.prefix]
+        component_id = f"{self.component}_id"
+        for name, literal in self.parts:
+            if name == component_id and "comp_id" in kwargs:
+                key.append(kwargs["comp_id"])
+            elif name in kwargs:
+                key.append(kwargs[name])
+            else:
+                break
+            key.append(literal)
+        return "".join(key)
+
 class SystemHealthComponents:
     """
     System Health Components. This class provides a method for fetching component/key
@@ -50,17 +89,35 @@ class SystemHealthComponents:
                                                         const.KEY: f"{HA_DELIM}cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}$cluster_id{HA_DELIM}service{HA_DELIM}$comp_type{HA_DELIM}$comp_id{HA_DELIM}aggregate"},
                    const.COMPONENTS.NODE_MAP.value: {const.RESOURCE_LIST: [],
                                                      const.KEY: f"{HA_DELIM}cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}node_map{HA_DELIM}$node_id"},
+                   const.COMPONENTS.DISK_CVG_MAP.value: {const.RESOURCE_LIST: [],
+                                                         const.KEY: f"{HA_DELIM}cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}disk_cvg_map{HA_DELIM}$node_id"},
                    const.COMPONENTS.CVG.value: {const.RESOURCE_LIST: ["cvg"],
                                                  const.KEY: f"{HA_DELIM}cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}$cluster_id{HA_DELIM}site{HA_DELIM}$site_id{HA_DELIM}rack{HA_DELIM}$rack_id{HA_DELIM}node{HA_DELIM}$node_id{HA_DELIM}cvg{HA_DELIM}$cvg_id{HA_DELIM}health"},
                    const.COMPONENTS.DISK.value: {const.RESOURCE_LIST: ["disk"],
                                                  const.KEY: f"{HA_DELIM}cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}$cluster_id{HA_DELIM}site{HA_DELIM}$site_id{HA_DELIM}rack{HA_DELIM}$rack_id{HA_DELIM}node{HA_DELIM}$node_id{HA_DELIM}cvg{HA_DELIM}$cvg_id{HA_DELIM}disk{HA_DELIM}$disk_id{HA_DELIM}health"}}
 
+    # Memoised {resource type: component} and {component: HealthKeyTemplate}
+    _resource_components: dict = {}
+    _key_templates: dict = {}
+
     @staticmethod
     def get_component(resource_type: str) -> str:
         """
         This method returns a component associated with a resource type,
         received in the health event.
         """
+        component = SystemHealthComponents._resource_components.get(resource_type)
+        if component is not None:
+            return component
+        component = SystemHealthComponents._find_component(resource_type)
+        SystemHealthComponents._resource_components[resource_type] = component
+        return component
+
+    @staticmethod
+    def _find_component(resource_type: str) -> str:
+        """
+        Find component whose resource list matches the resource type.
+        """
         try:
             # Get system health component using the resource type
             for key in SystemHealthComponents._components:
@@ -95,6 +152,17 @@ class SystemHealthComponents:
             Log.error(f"Failed to get {component} with Error: {e}")
             raise HaSystemHealthComponentsException("Failed to get component")
 
+    @staticmethod
+    def get_key_template(component: str) -> HealthKeyTemplate:
+        """
+        This method returns the compiled key template for a component.
+        """
+        template = SystemHealthComponents._key_templates.get(component)
+        if template is None:
+            template = HealthKeyTemplate(component, SystemHealthComponents.get_key(component))
+            SystemHealthComponents._key_templates[component] = template
+        return template
+
 class SystemHealthHierarchy:
     """
     System Health Hierarchy. This class provides system health component health update hierarchy.
@@ -18,12 +18,10 @@
 Handler for handling cluster stop events received from CSM
 """
 
-import json
-import ast
-
 from cortx.utils.conf_store import Conf
 from cortx.utils.log import Log
 from ha.util.message_bus import MessageBus, CONSUMER_STATUS, MessageBusConsumer
+from ha.util.event_codec import decode_event
 
 from ha import const
 from ha.k8s_setup.const import _DELIM
@@ -81,9 +79,7 @@ class ClusterStopMonitor:
         Log.debug(f'Received the message from message bus: {message}')
         try:
             # parse the message and check if cluster stop received
-            msg_decode = message.decode('utf-8')
-            msg = json.dumps(ast.literal_eval(msg_decode))
-            cluster_alert = json.loads(msg)
+            cluster_alert = decode_event(message)
 
             if cluster_alert["start_cluster_shutdown"] == 1:
                 self.stop_cluster()
@@ -22,8 +22,12 @@ import traceback
 from cortx.utils.conf_store import Conf
 from cortx.utils.log import Log
 from ha.util.message_bus import MessageBus, CONSUMER_STATUS, MessageBusConsumer
+from ha.util.sharded_dispatcher import ShardedDispatcher
 from ha import const
+from ha.core.config.config_manager import ConfigManager
 from ha.core.event_analyzer.event_analyzerd import EventAnalyzer
+from ha.core.system_health.system_health import SystemHealth
+from ha.core.system_health.system_health_manager import SystemHealthManager
 from ha.k8s_setup.const import _DELIM
 
 from consul.base import ConsulException
@@ -41,6 +45,7 @@ class FaultMonitor:
 
     def __init__(self):
         """Init method"""
+        self._dispatcher = None
         self._consumer = self._get_consumer()
 
     def start(self):
@@ -58,6 +63,8 @@ class FaultMonitor:
         """
         if self._consumer is not None:
             self._consumer.stop(flush=flush)
+            if self._dispatcher is not None:
+                self._dispatcher.stop()
         else:
             Log.warn(f"Consumer not found for message type  {self._message_type}.")
 
@@ -76,8 +83,38 @@ class HealthStatusMonitor(FaultMonitor):
     """
     def __init__(self):
         """Init method"""
+        self._init_health_cache()
+        # System health keeps per event state, so each worker has its own
+        # analyzer. The health event producer is thread safe and is shared.
+        producer = SystemHealth.get_producer()
+        self._event_analyzers = [EventAnalyzer(producer) for _ in range(self._get_workers())]
+        self._event_analyzer = self._event_analyzers[0]
         super().__init__()
 
+    @staticmethod
+    def _get_workers() -> int:
+        return int(Conf.get(const.HA_GLOBAL_INDEX, f'FAULT_TOLERANCE{_DELIM}workers', 1))
+
+    @staticmethod
+    def _init_health_cache():
+        """
+        Enable or disable the process wide system health cache as per
+        configuration. It is shared by all the event analyzers.
+        """
+        if Conf.get(const.HA_GLOBAL_INDEX, f"SYSTEM_HEALTH{_DELIM}cache_enabled", False):
+            SystemHealthManager.init_cache(ConfigManager.get_confstore())
+        else:
+            SystemHealthManager.stop_cache()
+
+    def reload(self):
+        """
+        Re-initialize the system health cache once and then the event
+        analyzers on configuration reload.
+        """
+        self._init_health_cache()
+        for event_analyzer in self._event_analyzers:
+            event_analyzer.reload()
+
     def _get_consumer(self) -> MessageBusConsumer:
         """
            Returns an object of MessageBusConsumer class which will listen on
@@ -86,17 +123,34 @@ class HealthStatusMonitor(FaultMonitor):
         self._consumer_id = Conf.get(const.HA_GLOBAL_INDEX, f'FAULT_TOLERANCE{_DELIM}consumer_id')
         self._consumer_group = Conf.get(const.HA_GLOBAL_INDEX, f'FAULT_TOLERANCE{_DELIM}consumer_group')
         self._message_type = Conf.get(const.HA_GLOBAL_INDEX, f'FAULT_TOLERANCE{_DELIM}message_type')
+        batch_size = int(Conf.get(const.HA_GLOBAL_INDEX, f'FAULT_TOLERANCE{_DELIM}batch_size', 1))
+        batch_callback = None
+        if len(self._event_analyzers) > 1:
+            callbacks = [self._get_callback(event_analyzer) for event_analyzer in self._event_analyzers]
+            self._dispatcher = ShardedDispatcher(callbacks, name="fault_tolerance")
+            batch_callback = self._dispatcher.dispatch
+            batch_size = max(batch_size, len(callbacks))
         MessageBus.init()
         return MessageBus.get_consumer(consumer_id=self._consumer_id, \
                                 consumer_group=self._consumer_group, \
                                 message_type=self._message_type, \
-                                callback=self.process_message)
+                                callback=self.process_message, \
+                                batch_size=batch_size, \
+                                batch_callback=batch_callback)
+
+    def _get_callback(self, event_analyzer: EventAnalyzer):
+        """Callback for a dispatcher worker using its own event analyzer"""
+        return lambda message: self._process_message(message, event_analyzer)
 
     def process_message(self, message: str):
         """Callback method for MessageConsumer"""
+        return self._process_message(message, self._event_analyzer)
+
+    def _process_message(self, message, event_analyzer: EventAnalyzer):
+        """Analyze message received from message bus or event decoded by the dispatcher"""
         Log.info(f'Received the message from message bus: {message}')
         try:
-            EventAnalyzer(message.decode('utf-8'))
+            event_analyzer.analyze(message if isinstance(message, dict) else message.decode('utf-8'))
             return CONSUMER_STATUS.SUCCESS
         except ConsulException as e:
             Log.error(f"consule exception {e} {traceback.format_exc()} for {message}. Ack Message.")
@@ -37,6 +37,7 @@ class FaultTolerance:
         Create monitor objects and Sets the callbacks to sigterm
         """
         signal.signal(signal.SIGTERM, self.set_sigterm)
+        signal.signal(signal.SIGHUP, self.set_sighup)
         ConfigManager.init("fault_tolerance")
         self.node_fault_monitor = HealthStatusMonitor()
         self.cluster_stop_monitor = ClusterStopMonitor()
@@ -50,6 +51,18 @@ class FaultTolerance:
         self.node_fault_monitor.stop(flush=True)
         self.cluster_stop_monitor.stop(flush=True)
 
+    def set_sighup(self, signum, frame):
+        """
+        Callback function to reload configuration on a signal
+        """
+        Log.info(f"Received SIGHUP {signum}, reloading configuration")
+        Log.debug(f"Reloading the Fault Tolerance Monitor received a signal: {signum} during execution of frame: {frame}")
+        try:
+            ConfigManager.reload()
+            self.node_fault_monitor.reload()
+        except Exception as e:
+            Log.error(f"Failed to reload configuration. Error: {e}")
+
     def start(self):
         """
         start the threads
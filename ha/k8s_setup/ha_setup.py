@@ -256,13 +256,14 @@ class ConfigCmd(Cmd):
                          'event_topic' : 'hare',
                          'MONITOR' : {'message_type' : health_comm_msg_type, 'producer_id' : 'cluster_monitor'},
                          'EVENT_MANAGER' : {'message_type' : 'health_events', 'producer_id' : 'system_health',
-                                            'consumer_group' : 'health_monitor', 'consumer_id' : '1'},
+                                            'consumer_group' : 'health_monitor', 'consumer_id' : '1', 'batch_size' : 1,
+                                            'workers' : 1},
                          'FAULT_TOLERANCE' : {'message_type' : health_comm_msg_type, 'consumer_group' : 'event_listener',
-                                              'consumer_id' : '1'},
+                                              'consumer_id' : '1', 'batch_size' : 1, 'workers' : 1},
                          'CLUSTER_STOP_MON' : {'message_type' : 'cluster_stop', 'consumer_group' : 'cluster_mon',
                                               'consumer_id' : '2'},
                          'CLUSTER': {'resource_type': ['node', 'disk', 'cvg', 'cluster']},
-                         'SYSTEM_HEALTH' : {'num_entity_health_events' : 2}
+                         'SYSTEM_HEALTH' : {'num_entity_health_events' : 2, 'cache_enabled' : False}
                          }
 
             if not os.path.isdir(const.CONFIG_DIR):
@@ -318,6 +319,8 @@ class ConfigCmd(Cmd):
             self._confStoreAPI = ConftStoreSearch()
             data_pods, server_pods, control_pods, _, _ = self._confStoreAPI.set_cluster_cardinality(self._index)
 
+            # Health events are collected and added together by SystemHealth.bootstrap
+            self._health_events = []
             # Init cluster,site,rack health
             self._add_cluster_component_health()
             # Init node health
@@ -326,6 +329,11 @@ class ConfigCmd(Cmd):
             # Stopped disk, cvg resource key addition to consul to reduce consul accesses
             # till CORTX-29667 gets resolved
             #self._add_cvg_and_disk_health()
+            system_health = SystemHealth(self._confstore)
+            # Disk cvg map is used to find the cvg of disk events
+            system_health.set_disk_cvg_map(self._get_disk_cvg_map())
+            timing = system_health.bootstrap(self._health_events)
+            Log.info(f'Added initial health of {len(self._health_events)} resources, time taken(sec): {timing}')
 
             # Note: if batch put is enabled needs to commit
             # to push all the local cashed values to consul server
@@ -408,6 +416,23 @@ class ConfigCmd(Cmd):
                                            resource_id=cvg)
                     self._add_disk_health(node_id, cvg)
 
+    def _get_disk_cvg_map(self) -> dict:
+        """
+        Get cvg of all the disks of all the nodes.
+        Returns:
+            dict: {node_id: {disk_id: cvg_id}}
+        """
+        disk_cvg_map = {}
+        _, _, node_mapping = self._confStoreAPI.get_cluster_cardinality()
+        for node_id in node_mapping.values():
+            disks = {}
+            for cvg in ConftStoreSearch.get_cvg_list(self._index, node_id) or []:
+                for disk in ConftStoreSearch.get_disk_list_for_cvg(self._index, node_id, cvg):
+                    disks[disk] = cvg
+            if disks:
+                disk_cvg_map[node_id] = disks
+        return disk_cvg_map
+
     def _add_disk_health(self, node_id, cvg_id) -> None:
         disk_list = ConftStoreSearch.get_disk_list_for_cvg(self._index, node_id, cvg_id)
         if disk_list:
@@ -421,6 +446,7 @@ class ConfigCmd(Cmd):
                           resource_id: str, specific_info: dict=None) -> None:
         """
         Add health events for multiple resources (e.g. Node, CVG, disk)
+        to the list of events for SystemHealth.bootstrap
         Args:
             node_id (str): node id
             resource_type (str): Resource type will be Node, CVG, disk, etc.
@@ -446,9 +472,7 @@ class ConfigCmd(Cmd):
             EVENT_ATTRIBUTES.SPECIFIC_INFO : specific_info
         }
         Log.debug(f"Adding initial health {health_event} for {resource_type} : {resource_id}")
-        health_event = HealthEvent.dict_to_object(health_event)
-        system_health = SystemHealth(self._confstore)
-        system_health.process_event(health_event)
+        self._health_events.append(HealthEvent.dict_to_object(health_event))
 
 
 class InitCmd(Cmd):
@@ -80,6 +80,10 @@ def main(argv: list):
         signal.signal(signal.SIGINT, handle_signal)
         signal.signal(signal.SIGSEGV, handle_signal)
         signal.signal(signal.SIGTERM, handle_signal)
+        # Only fault tolerance reloads configuration on SIGHUP, other drivers
+        # keep the default action of SIGHUP and would be terminated by it.
+        if args.services == 'fault_tolerance':
+            signal.signal(signal.SIGHUP, handle_signal)
 
         start_driver_process()
 
@@ -15,87 +15,49 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
-from collections import namedtuple
-
-
-class K8sAlert:
-    def __init__(self):
-        self._resource_type = None
-        self._resource_name = None
-        self._event_type = None
-        self._k8s_container = None
-        self._generation_id = None
-        self._node = None
-        self._is_status = False
-        self._timestamp = None
-
-    @property
-    def resource_type(self):
-        return self._resource_type
-
-    @resource_type.setter
-    def resource_type(self, res_type):
-        self._resource_type = f"{res_type}"
-
-    @property
-    def resource_name(self):
-        return self._resource_name
-
-    @resource_name.setter
-    def resource_name(self, res_name):
-        self._resource_name = res_name
-
-    @property
-    def event_type(self):
-        return self._event_type
-
-    @event_type.setter
-    def event_type(self, event_type):
-        self._event_type = event_type
-
-    @property
-    def k8s_container(self):
-        return self._k8s_container
-
-    @k8s_container.setter
-    def k8s_container(self, name):
-        self._k8s_container = name
-
-    @property
-    def generation_id(self):
-        return self._generation_id
-
-    @generation_id.setter
-    def generation_id(self, name):
-        self._generation_id = name
-
-    @property
-    def node(self):
-        return self._node
-
-    @node.setter
-    def node(self, name):
-        self._node = name
-
-    @property
-    def is_status(self):
-        return self._is_status
-
-    @is_status.setter
-    def is_status(self, status):
-        self._is_status = status
-
-    @property
-    def timestamp(self):
-        return self._timestamp
-
-    @timestamp.setter
-    def timestamp(self, time):
-        self._timestamp = time
-
-    def to_dict(self):
-        return vars(self)
-
-    @staticmethod
-    def to_alert(obj_dict):
-        return namedtuple('K8sAlert', obj_dict.keys())(*obj_dict.values())
+from typing import NamedTuple
+
+from ha.fault_tolerance.const import HEALTH_EVENT_SOURCES, NOT_DEFINED
+from cortx.utils.event_framework.health import HealthAttr, HealthEvent
+
+
+class K8sAlert(NamedTuple):
+    """
+    Alert of a kubernetes object, created by the k8s event parsers.
+    Immutable so it can be shared by threads, use _replace to change it.
+    """
+    resource_type: str
+    resource_id: str
+    status: str
+    generation_id: str = None
+    is_status: bool = False
+
+    def to_dict(self) -> dict:
+        return self._asdict()
+
+    def to_health_event(self) -> HealthEvent:
+        """
+        Instantiates Event class which creates Health event object with necessary
+        attributes to pass it for further processing.
+        """
+        # KvPayload supports empty strings for default value if value not set.
+        # None will decode as 'null' in json.dumps in KvPayload object
+        payload = {HealthAttr.SOURCE.value: HEALTH_EVENT_SOURCES.MONITOR.value,
+                   HealthAttr.CLUSTER_ID.value: '',
+                   HealthAttr.SITE_ID.value: NOT_DEFINED,
+                   HealthAttr.RACK_ID.value: NOT_DEFINED,
+                   HealthAttr.STORAGESET_ID.value: NOT_DEFINED,
+                   HealthAttr.NODE_ID.value: self.resource_id,
+                   HealthAttr.RESOURCE_TYPE.value: self.resource_type,
+                   HealthAttr.RESOURCE_ID.value: self.resource_id,
+                   HealthAttr.RESOURCE_STATUS.value: self.status,
+                   HealthAttr.SPECIFIC_INFO.value: {}}
+        event = HealthEvent(**payload)
+        specific_info = {}
+        if self.generation_id is not None:
+            specific_info["generation_id"] = self.generation_id
+        if self.is_status:
+            specific_info["is_status"] = 'True'
+        if specific_info:
+            event.set_specific_info(specific_info)
+        return event
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import time
+from collections import OrderedDict
+from itertools import count
+from threading import Condition
+
+from ha.monitor.k8s.const import AlertQueueConst
+
+class AlertQueue:
+    """
+    Bounded queue of alerts between the k8s watch reader and the publisher,
+    so a slow message bus does not stall the watch. What put does when the
+    queue is full depends on the policy:
+        block: wait for the publisher.
+        coalesce: alert replaces the latest queued alert of the same resource,
+            keeping its place, waits only if no alert of the resource is queued.
+    Every alert is queued while the queue is not full, so no state transition
+    is lost unless the publisher falls behind.
+        drop_oldest: oldest queued alert is dropped.
+    """
+
+    def __init__(self, size: int = AlertQueueConst.SIZE, policy: str = AlertQueueConst.POLICY):
+        """
+        Init method.
+
+        Args:
+            size (int): max alerts queued.
+            policy (str): overflow policy, one of AlertQueueConst.POLICIES.
+        """
+        if policy not in AlertQueueConst.POLICIES:
+            raise ValueError(f"Invalid alert queue policy {policy}, expected one of {AlertQueueConst.POLICIES}")
+        self._size = size
+        self._policy = policy
+        # {sequence: (key, alert, time queued)}, oldest first
+        self._alerts = OrderedDict()
+        # {key: sequence of the latest queued alert of key}
+        self._latest = {}
+        self._sequence = count()
+        self._cond = Condition()
+        self._closed = False
+        self._max_depth = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._lag = 0.0
+        self._max_lag = 0.0
+
+    def put(self, key, alert) -> None:
+        """
+        Queue alert of the resource key, key is used only to coalesce.
+        """
+        with self._cond:
+            if self._policy == AlertQueueConst.COALESCE:
+                self._cond.wait_for(lambda: len(self._alerts) < self._size or
+                                    self._latest.get(key) in self._alerts or self._closed)
+                sequence = self._latest.get(key)
+                if len(self._alerts) >= self._size and sequence in self._alerts:
+                    queued_at = self._alerts[sequence][2]
+                    self._alerts[sequence] = (key, alert, queued_at)
+                    self._coalesced += 1
+                    return
+            elif self._policy == AlertQueueConst.DROP_OLDEST:
+                while len(self._alerts) >= self._size:
+                    self._pop()
+                    self._dropped += 1
+            else:
+                self._cond.wait_for(lambda: len(self._alerts) < self._size or self._closed)
+            sequence = next(self._sequence)
+            self._alerts[sequence] = (key, alert, time.monotonic())
+            self._latest[key] = sequence
+            self._max_depth = max(self._max_depth, len(self._alerts))
+            self._cond.notify_all()
+
+    def get(self, timeout: float = None):
+        """
+        Get the oldest alert, waits till an alert is queued.
+
+        Returns:
+            alert, None if the queue is closed and empty or on timeout.
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._alerts or self._closed, timeout):
+                return None
+            if not self._alerts:
+                return None
+            alert, queued_at = self._pop()
+            self._lag = time.monotonic() - queued_at
+            self._max_lag = max(self._max_lag, self._lag)
+            self._cond.notify_all()
+            return alert
+
+    def _pop(self) -> tuple:
+        """
+        Remove the oldest alert, returns (alert, time queued).
+        """
+        sequence, (key, alert, queued_at) = self._alerts.popitem(last=False)
+        if self._latest.get(key) == sequence:
+            del self._latest[key]
+        return alert, queued_at
+
+    def close(self) -> None:
+        """
+        Wake up waiting put and get, get returns None once queued alerts are read.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    def __len__(self) -> int:
+        with self._cond:
+            return len(self._alerts)
+
+    def stats(self) -> dict:
+        """
+        Get queue depth, counters and lag(seconds an alert waited) metrics.
+        """
+        with self._cond:
+            return {"depth": len(self._alerts), "max_depth": self._max_depth, "coalesced": self._coalesced,
+                    "dropped": self._dropped, "lag": self._lag, "max_lag": self._max_lag}
@@ -21,6 +21,10 @@ class K8SEventsConst:
     RAW_OBJECT = 'raw_object'
     METADATA = 'metadata'
     NAME = 'name'
+    NAMESPACE = 'namespace'
+    RESOURCE_VERSION = 'resourceVersion'
+    ITEMS = 'items'
+    CODE = 'code'
     LABELS ='labels'
     # cortx specific key for fetching machine id from event.
     # k8s event: ['raw_object']['metadata']['labels']['cortx.io/machine-id']
@@ -42,6 +46,8 @@ class EventStates:
     ADDED = 'ADDED'
     MODIFIED = 'MODIFIED'
     DELETED = 'DELETED'
+    BOOKMARK = 'BOOKMARK'
+    ERROR = 'ERROR'
 
 
 class AlertStates:
@@ -53,7 +59,44 @@ class K8SClientConst:
     PRETTY = 'pretty'
     LABEL_SELECTOR = 'label_selector'
     TIMEOUT_SECONDS = 'timeout_seconds'
+    FIELD_SELECTOR = 'field_selector'
+    RESOURCE_VERSION = 'resource_version'
+    ALLOW_WATCH_BOOKMARKS = 'allow_watch_bookmarks'
+    PRELOAD_CONTENT = '_preload_content'
+    # Watch from a resource version no longer kept by the api server
+    HTTP_GONE = 410
+    # Longer 'label in (values)' selectors are replaced by 'label' exists
+    # selector and values are matched in process, long urls are rejected
+    # by the api server and proxies.
+    MAX_LABEL_SELECTOR_LENGTH = 4096
     NODE = 'node'
     POD = 'pod'
 
     VAL_WATCH_TIMEOUT_DEFAULT = 5
+
+class PublishedAlertConst:
+    # Alerts remembered for duplicate suppression, least recently seen is dropped first
+    MAX_ALERTS = 10000
+    # Seconds an alert is remembered after it was last seen
+    TTL = 86400
+
+class AlertQueueConst:
+    # Alerts queued between watch reader and publisher
+    SIZE = 1000
+    # Overflow policies, block the reader, replace queued alert of the same
+    # resource(blocks if full of other resources) or drop the oldest alert.
+    BLOCK = 'block'
+    COALESCE = 'coalesce'
+    DROP_OLDEST = 'drop_oldest'
+    POLICIES = (BLOCK, COALESCE, DROP_OLDEST)
+    POLICY = COALESCE
+
+class FlapDampingConst:
+    # Seconds alerts of a resource are damped after an alert is published,
+    # 0 disables damping. Set per object type by MONITOR>flap_window>{node|pod}
+    WINDOW = 0
+    # Window is doubled while the resource keeps flapping, up to max seconds
+    MAX_HOLD_DOWN = 300
+    # Seconds between checks for alerts due at the end of a window
+    POLL_INTERVAL = 1
+    FLAP_COUNT = 'flap_count'
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import time
+from threading import Lock
+from typing import Callable
+
+from ha.monitor.k8s.const import FlapDampingConst
+
+class _FlapState:
+    """
+    Damping state of a resource.
+    """
+
+    __slots__ = ("window", "until", "status", "pending", "flaps")
+
+    def __init__(self, window: float):
+        self.window = window
+        self.until = 0.0
+        # Status of the last alert published
+        self.status = None
+        self.pending = None
+        self.flaps = 0
+
+class FlapDamper:
+    """
+    Damp alerts of resources changing state repeatedly, ex. crash looping pod.
+
+    First alert of a resource is published right away and opens a window,
+    alerts received in the window are not published, only the last one is
+    kept. At the end of the window it is published if its status is not
+    same as the status published, with the number of alerts collapsed in
+    specific_info 'flap_count'. Window is doubled every time it had alerts,
+    up to max_hold_down, and reset after a window without alerts.
+
+    offer is called by the watch reader and poll by the publisher.
+    """
+
+    def __init__(self, window: float, max_hold_down: float = FlapDampingConst.MAX_HOLD_DOWN,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Init method.
+
+        Args:
+            window (float): seconds alerts are damped after an alert is published.
+            max_hold_down (float): max window of a flapping resource.
+            clock (Callable): time source, seconds.
+        """
+        self._window = window
+        self._max_hold_down = max(max_hold_down, window)
+        self._clock = clock
+        self._resources = {}
+        self._lock = Lock()
+        self._damped = 0
+
+    @staticmethod
+    def _get_key(alert: dict) -> tuple:
+        payload = alert["payload"]
+        return payload["resource_type"], payload["resource_id"]
+
+    def offer(self, alert: dict) -> list:
+        """
+        Add alert of a resource.
+
+        Returns:
+            list: alerts to be published now.
+        """
+        key = FlapDamper._get_key(alert)
+        now = self._clock()
+        with self._lock:
+            state = self._resources.get(key)
+            if state is None:
+                state = self._resources[key] = _FlapState(self._window)
+            if state.pending is None and now >= state.until:
+                # Resource is stable, publish without delay.
+                state.status = alert["payload"]["resource_status"]
+                state.until = now + state.window
+                return [alert]
+            state.pending = alert
+            state.flaps += 1
+            self._damped += 1
+            return []
+
+    def poll(self, flush: bool = False) -> list:
+        """
+        Get alerts due at the end of their window.
+
+        Args:
+            flush (bool): get all the alerts kept, used when stopping.
+
+        Returns:
+            list: alerts to be published now.
+        """
+        now = self._clock()
+        due = []
+        with self._lock:
+            for key, state in list(self._resources.items()):
+                if now < state.until and not flush:
+                    continue
+                if state.pending is None:
+                    # No alerts in the window, resource is stable again.
+                    del self._resources[key]
+                    continue
+                alert, flaps = state.pending, state.flaps
+                state.pending, state.flaps = None, 0
+                state.window = min(state.window * 2, self._max_hold_down)
+                state.until = now + state.window
+                status = alert["payload"]["resource_status"]
+                if status == state.status:
+                    # Resource is back to the status published
+                    continue
+                state.status = status
+                alert["payload"]["specific_info"][FlapDampingConst.FLAP_COUNT] = flaps
+                due.append(alert)
+        return due
+
+    def stats(self) -> dict:
+        """
+        Get resources being damped and count of alerts damped.
+        """
+        with self._lock:
+            flapping = sum(1 for state in self._resources.values() if state.pending is not None)
+            return {"resources": len(self._resources), "flapping": flapping, "damped": self._damped}
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import json
+from typing import Callable, Iterator
+
+from cortx.utils.log import Log
+from ha.monitor.k8s.const import EventStates, K8SClientConst, K8SEventsConst
+
+class Informer:
+    """
+    List and watch kubernetes objects, same as client-go informer.
+
+    Objects are listed once and then watched from the resource version of
+    the list. When the watch times out it is resumed from the last resource
+    version seen(ex. from bookmarks) so nothing is listed or sent again.
+    Objects are listed again only if the api server no longer has that
+    version(HTTP 410 Gone), changes found are sent as events.
+
+    Events have the same 'type' and 'raw_object' as kubernetes watch.stream,
+    objects are kept in a local store by 'namespace/name'.
+
+    Example:
+        informer = Informer(k8s_client.list_pod_for_all_namespaces, watch.Watch(),
+                            label_selector="app=cortx", timeout_seconds=5)
+        while True:
+            for an_event in informer.stream():
+                ...
+    """
+
+    # Args of watch_args also used for list
+    _LIST_ARGS = (K8SClientConst.LABEL_SELECTOR, K8SClientConst.FIELD_SELECTOR)
+
+    def __init__(self, list_func: Callable, k8s_watch, **watch_args):
+        """
+        Init method.
+
+        Args:
+            list_func (Callable): kubernetes client list function, ex. list_node.
+            k8s_watch (kubernetes.watch.Watch): watch used to stream events.
+            watch_args (dict): kwargs for kubernetes.watch.Watch.stream.
+        """
+        self._list_func = list_func
+        self._watch = k8s_watch
+        self._watch_args = dict(watch_args)
+        self._list_args = {arg: watch_args[arg] for arg in Informer._LIST_ARGS if arg in watch_args}
+        self._resource_version = None
+        self._store = {}
+        self._stopped = False
+
+    @property
+    def resource_version(self) -> str:
+        """
+        Resource version the next watch starts from, None if objects are to be listed.
+        """
+        return self._resource_version
+
+    def get(self, key: str) -> dict:
+        """
+        Get raw object from the local store, key is 'namespace/name' or 'name'.
+        """
+        return self._store.get(key)
+
+    def list(self) -> list:
+        """
+        Get all the raw objects of the local store.
+        """
+        return list(self._store.values())
+
+    def stop(self) -> None:
+        """
+        Stop streaming, same as kubernetes.watch.Watch.stop. Events already
+        received can still be read from the stream.
+        """
+        self._stopped = True
+        self._watch.stop()
+
+    def stream(self) -> Iterator[dict]:
+        """
+        Stream events till the watch times out or stop is called. Objects
+        are listed first, if there is no resource version to watch from.
+        """
+        if self._resource_version is None:
+            yield from self._relist()
+        if self._stopped:
+            return
+        watch_args = dict(self._watch_args)
+        watch_args[K8SClientConst.RESOURCE_VERSION] = self._resource_version
+        watch_args[K8SClientConst.ALLOW_WATCH_BOOKMARKS] = True
+        try:
+            for an_event in self._watch.stream(self._list_func, **watch_args):
+                event_type = an_event[K8SEventsConst.TYPE]
+                raw_object = an_event[K8SEventsConst.RAW_OBJECT]
+                if event_type == EventStates.ERROR:
+                    self._on_error(raw_object)
+                    return
+                self._resource_version = raw_object[K8SEventsConst.METADATA][K8SEventsConst.RESOURCE_VERSION]
+                if event_type == EventStates.BOOKMARK:
+                    continue
+                self._update_store(event_type, raw_object)
+                yield an_event
+        except Exception as err:
+            # Newer kubernetes clients raise ApiException for the 410 error event
+            if getattr(err, 'status', None) != K8SClientConst.HTTP_GONE:
+                raise
+            self._on_error({K8SEventsConst.CODE: K8SClientConst.HTTP_GONE, 'message': str(err)})
+
+    def _on_error(self, status: dict) -> None:
+        if status.get(K8SEventsConst.CODE) == K8SClientConst.HTTP_GONE:
+            Log.info(f"Resource version {self._resource_version} is too old, listing objects again.")
+            self._resource_version = None
+        else:
+            Log.warn(f"Watch failed, resuming from resource version {self._resource_version}. Error: {status}")
+
+    def _relist(self) -> Iterator[dict]:
+        """
+        List objects and send events for the changes from the local store.
+        """
+        response = self._list_func(**self._list_args, **{K8SClientConst.PRELOAD_CONTENT: False})
+        object_list = json.loads(response.data)
+        self._resource_version = object_list[K8SEventsConst.METADATA][K8SEventsConst.RESOURCE_VERSION]
+        Log.info(f"Listed {len(object_list[K8SEventsConst.ITEMS])} objects at resource version {self._resource_version}.")
+        current = {}
+        for raw_object in object_list[K8SEventsConst.ITEMS]:
+            current[Informer._get_key(raw_object)] = raw_object
+        deleted = [key for key in self._store if key not in current]
+        for key, raw_object in current.items():
+            cached = self._store.get(key)
+            if cached is None:
+                event_type = EventStates.ADDED
+            elif Informer._get_version(cached) != Informer._get_version(raw_object):
+                event_type = EventStates.MODIFIED
+            else:
+                continue
+            self._store[key] = raw_object
+            yield {K8SEventsConst.TYPE: event_type, K8SEventsConst.RAW_OBJECT: raw_object}
+        for key in deleted:
+            raw_object = self._store.pop(key)
+            yield {K8SEventsConst.TYPE: EventStates.DELETED, K8SEventsConst.RAW_OBJECT: raw_object}
+
+    def _update_store(self, event_type: str, raw_object: dict) -> None:
+        key = Informer._get_key(raw_object)
+        if event_type == EventStates.DELETED:
+            self._store.pop(key, None)
+        else:
+            self._store[key] = raw_object
+
+    @staticmethod
+    def _get_key(raw_object: dict) -> str:
+        metadata = raw_object[K8SEventsConst.METADATA]
+        namespace = metadata.get(K8SEventsConst.NAMESPACE)
+        name = metadata[K8SEventsConst.NAME]
+        return f"{namespace}/{name}" if namespace else name
+
+    @staticmethod
+    def _get_version(raw_object: dict) -> str:
+        return raw_object[K8SEventsConst.METADATA].get(K8SEventsConst.RESOURCE_VERSION)
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+from ha.monitor.k8s.const import K8SClientConst
+from ha.monitor.k8s.parser import ReadyStates
+
+class LabelHandler:
+    """
+    Handles the events of the objects having label with a value in
+    resource_id_map, objects of the watch are matched to the handler by labels.
+    Keeps the last state of its objects used by the event parser.
+    Handler without label handles all the objects.
+    """
+
+    __slots__ = ("label", "resource_id_map", "object_state")
+
+    def __init__(self, label: str = None, resource_id_map: dict = None):
+        """
+        Init method.
+
+        Args:
+            label (str): label of the objects handled, ex. 'cortx.io/machine-id'.
+            resource_id_map (dict): mapping of label value and resource id.
+        """
+        self.label = label
+        self.resource_id_map = resource_id_map
+        self.object_state = ReadyStates()
+
+    def matches(self, labels: dict) -> bool:
+        """
+        Check if object with labels is handled.
+        """
+        return self.label is None or labels.get(self.label) in self.resource_id_map
+
+    @staticmethod
+    def get_handler(handlers: list, labels: dict) -> 'LabelHandler':
+        """
+        Get first handler of object with labels, None if not handled.
+        """
+        for handler in handlers:
+            if handler.matches(labels or {}):
+                return handler
+        return None
+
+    def get_selector(self, max_length: int = K8SClientConst.MAX_LABEL_SELECTOR_LENGTH) -> str:
+        """
+        Get label selector of the watch of handled objects. Requirements of a
+        selector are and'ed, so one watch can not select objects of handlers of
+        different labels. Too long selector is replaced by label exists, objects with
+        other label values are then dropped in process.
+
+        Returns:
+            str: label selector, None if handler has no label.
+        """
+        if self.label is None:
+            return None
+        selector = f"{self.label} in ({', '.join(self.resource_id_map.keys())})"
+        if len(selector) > max_length:
+            return self.label
+        return selector
@@ -21,6 +21,7 @@
 
 import os
 import signal
+from kubernetes import config, client
 from cortx.utils.log import Log
 
 from cortx.utils.conf_store import Conf
@@ -30,7 +31,9 @@ from ha.core.config.config_manager import ConfigManager
 from ha.util.message_bus import MessageBus
 from ha.util.conf_store import ConftStoreSearch
 from ha.monitor.k8s.object_monitor import ObjectMonitor
-from ha.monitor.k8s.const import K8SClientConst, K8SEventsConst
+from ha.monitor.k8s.label_handler import LabelHandler
+from ha.monitor.k8s.const import K8SClientConst, K8SEventsConst, PublishedAlertConst, AlertQueueConst
+from ha.monitor.k8s.const import FlapDampingConst
 
 class ResourceMonitor:
     """
@@ -63,53 +66,102 @@ class ResourceMonitor:
             # until catch any event on which it is waiting.
             monitor_args['watch_args'][K8SClientConst.TIMEOUT_SECONDS] = wait_time
 
+            # Bounds of the published alerts remembered to drop duplicates
+            monitor_args['max_published_alerts'] = int(Conf.get(const.HA_GLOBAL_INDEX,
+                f"MONITOR{_DELIM}max_published_alerts", PublishedAlertConst.MAX_ALERTS))
+            monitor_args['published_alert_ttl'] = int(Conf.get(const.HA_GLOBAL_INDEX,
+                f"MONITOR{_DELIM}published_alert_ttl", PublishedAlertConst.TTL))
+
+            # Queue between watch reader and publisher threads of a monitor
+            monitor_args['alert_queue_size'] = int(Conf.get(const.HA_GLOBAL_INDEX,
+                f"MONITOR{_DELIM}alert_queue_size", AlertQueueConst.SIZE))
+            monitor_args['alert_queue_policy'] = Conf.get(const.HA_GLOBAL_INDEX,
+                f"MONITOR{_DELIM}alert_queue_policy", AlertQueueConst.POLICY)
+            monitor_args['flap_max_hold_down'] = float(Conf.get(const.HA_GLOBAL_INDEX,
+                f"MONITOR{_DELIM}flap_max_hold_down", FlapDampingConst.MAX_HOLD_DOWN))
+
             # Get MessageBus producer object for all monitor threads
             producer = self._get_producer()
 
+            # One api client shared by all the monitor threads
+            config.load_incluster_config()
+            monitor_args['k8s_client'] = client.CoreV1Api()
+
             # Change to multiprocessing
             # Creating NODE monitor object
             Log.info("Instantiating monitor for all the nodes in cluster.")
+            monitor_args['flap_window'] = self._get_flap_window(K8SClientConst.NODE)
             node_monitor = ObjectMonitor(producer, K8SClientConst.NODE, **monitor_args)
             self.monitors.append(node_monitor)
 
             _, label_id_map, resource_id_map = _conf_stor_search.get_cluster_cardinality()
             Log.debug(f"label id map: {label_id_map}, resource id map: {resource_id_map}")
 
-            # NOTE: Currently running two pod monitors with the label 'cortx.io/machine-id' and
-            #  'statefulset.kubernetes.io/pod-name'. in any deployment, both labels will not co-exist,
-            #  so either one pod monitor will not be receiving any events.
+            # NOTE: Pods are watched with either label 'cortx.io/machine-id' or
+            #  'statefulset.kubernetes.io/pod-name'. Both maps are always stored in confstore, but
+            #  a selector can not or labels, so the pods are probed for the label they carry and
+            #  one pod watch filtered by the server is started for it.
             # TODO: CORTX-31875 So once the label 'statefulset.kubernetes.io/pod-name' is available,
-            #  the pod monitor with the label 'cortx.io/machine-id' needs to be removed as,
-            #  it is running only for backward compatibility.
-            # 1. pod monitor for pods with 'cortx.io/machine-id' labels
+            #  the handler for the label 'cortx.io/machine-id' needs to be removed as,
+            #  it is there only for backward compatibility.
+            label_handlers = []
+            # 1. pods with 'cortx.io/machine-id' labels
             if label_id_map:
-                Log.info(f"Instantiating monitor for pods with 'cortx.io/machine-id' labels: {label_id_map.keys()}")
-                label_ids = ', '.join(label_id for label_id in label_id_map.keys())
-                monitor_args['watch_args'][K8SClientConst.LABEL_SELECTOR] = \
-                    f'{K8SEventsConst.LABEL_MACHINEID} in ({label_ids})'
-                monitor_args['resource_id_map'] = label_id_map
-                # Creating POD monitor object watching on label machine id
-                pod_monitor_for_machineids = ObjectMonitor(producer, K8SClientConst.POD, **monitor_args)
-                self.monitors.append(pod_monitor_for_machineids)
+                Log.info(f"Monitoring pods with 'cortx.io/machine-id' labels: {label_id_map.keys()}")
+                label_handlers.append(LabelHandler(K8SEventsConst.LABEL_MACHINEID, label_id_map))
             else:
                 Log.warn(f"No pods found to monitor in machine id map {label_id_map}.")
 
-            # 2. pod monitor for pods with 'statefulset.kubernetes.io/pod-name' labels
+            # 2. pods with 'statefulset.kubernetes.io/pod-name' labels
             if resource_id_map:
-                Log.info(f"Instantiating monitor for pods with names: {resource_id_map.keys()}")
-                pod_names = ', '.join(pod_name for pod_name in resource_id_map.keys())
-                monitor_args['watch_args'][K8SClientConst.LABEL_SELECTOR] = \
-                    f'{K8SEventsConst.LABEL_PODNAME} in ({pod_names})'
-                monitor_args['resource_id_map'] = resource_id_map
-                # Creating POD monitor object watching on label pod name
-                pod_monitor_for_podnames = ObjectMonitor(producer, K8SClientConst.POD, **monitor_args)
-                self.monitors.append(pod_monitor_for_podnames)
+                Log.info(f"Monitoring pods with names: {resource_id_map.keys()}")
+                label_handlers.append(LabelHandler(K8SEventsConst.LABEL_PODNAME, resource_id_map))
             else:
                 Log.warn(f"No pods found to monitor in resource id map: {resource_id_map}")
 
+            if label_handlers:
+                label_handler = self._get_pod_label_handler(monitor_args['k8s_client'], label_handlers)
+                label_selector = label_handler.get_selector()
+                monitor_args['watch_args'][K8SClientConst.LABEL_SELECTOR] = label_selector
+                monitor_args['label_handlers'] = [label_handler]
+                monitor_args['flap_window'] = self._get_flap_window(K8SClientConst.POD)
+                Log.info(f"Instantiating pod monitor with label selector: {label_selector}")
+                # Creating POD monitor object
+                pod_monitor = ObjectMonitor(producer, K8SClientConst.POD, **monitor_args)
+                self.monitors.append(pod_monitor)
+
         except Exception as err:
             Log.error(f'Monitor failed to start watchers: {err}')
 
+    @staticmethod
+    def _get_pod_label_handler(k8s_client, label_handlers: list) -> LabelHandler:
+        """
+        Get handler of the label carried by the pods, in order of label_handlers.
+        First handler is used if no pod is found with any of the labels.
+        """
+        if len(label_handlers) == 1:
+            return label_handlers[0]
+        for label_handler in label_handlers:
+            try:
+                pods = k8s_client.list_pod_for_all_namespaces(label_selector=label_handler.get_selector(), limit=1)
+            except Exception as err:
+                Log.warn(f"Failed to list pods with label {label_handler.label}: {err}")
+                continue
+            if pods.items:
+                Log.info(f"Pods carry label {label_handler.label}")
+                return label_handler
+        Log.warn(f"No pods found with labels {[handler.label for handler in label_handlers]}, "
+                 f"watching label {label_handlers[0].label}")
+        return label_handlers[0]
+
+    @staticmethod
+    def _get_flap_window(k_object: str) -> float:
+        """
+        Get seconds alerts of a resource of k_object type are damped, 0 if not damped.
+        """
+        return float(Conf.get(const.HA_GLOBAL_INDEX, f"MONITOR{_DELIM}flap_window{_DELIM}{k_object}",
+                              FlapDampingConst.WINDOW))
+
     def _get_producer(self):
         """
         Get message bus producer
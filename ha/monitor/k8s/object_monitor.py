@@ -21,10 +21,16 @@ import threading
 from kubernetes import config, client, watch
 
 from ha.core.config.config_manager import ConfigManager
+from ha.util.event_codec import encode_event
+from ha.monitor.k8s.alert_queue import AlertQueue
+from ha.monitor.k8s.flap_damper import FlapDamper
+from ha.monitor.k8s.informer import Informer
+from ha.monitor.k8s.label_handler import LabelHandler
 from ha.monitor.k8s.objects import ObjectMap
 from ha.monitor.k8s.parser import EventParser
+from ha.monitor.k8s.published_alerts import PublishedAlerts
 from ha.monitor.k8s.const import EventStates, K8SClientConst
-from ha.monitor.k8s.const import K8SEventsConst
+from ha.monitor.k8s.const import K8SEventsConst, PublishedAlertConst, AlertQueueConst, FlapDampingConst
 from cortx.utils.log import Log
 from ha import const
 
@@ -42,20 +48,49 @@ class ObjectMonitor(threading.Thread):
             kwargs (dict): dict for other optional values
                 key 'watch_args' [required]: kwargs for Kubernetes.Watch.stream()
                 key 'resource_id_map' [optional]: mapping of resource id and machine ids
+                key 'label_handlers' [optional]: list of LabelHandler, events of the
+                    watch are parsed by the handler of the object labels, used instead of resource_id_map
+                key 'k8s_client' [optional]: kubernetes CoreV1Api shared by monitors
+                key 'alert_queue_size' [optional]: max alerts queued for the publisher
+                key 'alert_queue_policy' [optional]: AlertQueueConst policy when queue is full
+                key 'flap_window' [optional]: seconds alerts of a resource are damped, 0 disables
+                key 'flap_max_hold_down' [optional]: max damping window of a flapping resource
+                key 'max_published_alerts' [optional]: max alerts remembered to drop duplicates
+                key 'published_alert_ttl' [optional]: seconds an alert is remembered
         """
 
         super().__init__()
         self._publish_alert = True
         self._object = k_object
         self.name = f"Monitor-{k_object}-Thread"
+        # Client is shared, not copied
+        self._k8s_client = kwargs.pop('k8s_client', None)
+        # Handlers keep object states guarded by a lock, they are owned by the monitor, not copied
+        label_handlers = kwargs.pop('label_handlers', None)
         self._kwargs = copy.deepcopy(kwargs)
         self._starting_up = True
-        self._object_state = {}
+        self._label_handlers = label_handlers or \
+            [LabelHandler(resource_id_map=self._kwargs.get('resource_id_map', None))]
         self._sigterm_received = threading.Event()
         self._stop_event_processing = False
         self._producer = producer
         self._confstore = ConfigManager.get_confstore()
-        self._published_alerts = {}
+        self._cluster_stop = None
+        # Watch is on the key prefix, data has full key names of all the keys under it
+        self._cluster_stop_key = self._confstore._prepare_key(const.CLUSTER_STOP_KEY)
+        # cluster stop key is pushed by consul watch instead of read per alert
+        self._confstore.watch(const.CLUSTER_STOP_KEY, self._on_cluster_stop_change)
+        self._published_alerts = PublishedAlerts(
+            self._kwargs.get('max_published_alerts', PublishedAlertConst.MAX_ALERTS),
+            self._kwargs.get('published_alert_ttl', PublishedAlertConst.TTL))
+        # Alerts are published by another thread so the watch is not stalled by message bus
+        self._alert_queue = AlertQueue(
+            self._kwargs.get('alert_queue_size', AlertQueueConst.SIZE),
+            self._kwargs.get('alert_queue_policy', AlertQueueConst.POLICY))
+        flap_window = self._kwargs.get('flap_window', FlapDampingConst.WINDOW)
+        self._flap_damper = FlapDamper(flap_window, self._kwargs.get('flap_max_hold_down',
+            FlapDampingConst.MAX_HOLD_DOWN)) if flap_window > 0 else None
+        self._publisher = threading.Thread(target=self._run_publisher, name=f"{self.name}-Publisher", daemon=True)
         Log.info(f"Initialization done for {self._object} monitor")
 
     def set_sigterm(self, signum, frame):
@@ -70,7 +105,7 @@ class ObjectMonitor(threading.Thread):
             self._confstore.delete(key=const.CLUSTER_STOP_KEY, recurse=True)
         self._sigterm_received.set()
 
-    def check_for_signals(self, k8s_watch: watch.Watch, k8s_watch_stream):
+    def check_for_signals(self, informer: Informer, k8s_watch_stream):
         """
         Check if any pending signal while watching on kubernetes.watch.stream synchronusly.
         Note: curretnly handling only SIGTERM signal
@@ -80,17 +115,17 @@ class ObjectMonitor(threading.Thread):
         # SIGTERM signal
         if self._sigterm_received.is_set():
             Log.info(f"{self.name} Handling SIGTERM signal.")
-            self.handle_sigterm(k8s_watch, k8s_watch_stream)
+            self.handle_sigterm(informer, k8s_watch_stream)
             # clear the flag once handled
             self._sigterm_received.clear()
 
-    def handle_sigterm(self, k8s_watch: watch.Watch, k8s_watch_stream):
+    def handle_sigterm(self, informer: Informer, k8s_watch_stream):
         """
         handling pending sigterm signal which must have came,
         while watching on kubernetes.watch.stream synchronusly.
         """
         # set the stop flag so it will not pick the new events
-        k8s_watch.stop()
+        informer.stop()
         # flush out already fetched events and release the connection and other acquired resources
         Log.info(f"Flusing remaining Kubernetes {self._object} events.")
         for an_event in k8s_watch_stream:
@@ -101,17 +136,22 @@ class ObjectMonitor(threading.Thread):
         Log.info(f"Stopped watching for {self._object} events.")
         self._stop_event_processing = True
 
+    def _on_cluster_stop_change(self, index: int, data: dict):
+        """
+        Consul watch callback for cluster_stop key, keeps the last value locally.
+        """
+        self._cluster_stop = data.get(self._cluster_stop_key) if data else None
+        Log.debug(f"{self._object}_monitor cluster stop key changed to {self._cluster_stop} at index {index}")
+
     def is_publish_enable(self) -> bool:
         """
         Check if cluster_stop key is exist and if exist check if it is enable
         if enable then publish event should be stopped
         """
         if self._publish_alert:
-            if self._confstore.key_exists(const.CLUSTER_STOP_KEY):
-                _, cluster_stop = (self._confstore.get(const.CLUSTER_STOP_KEY)).popitem()
-                if cluster_stop == const.CLUSTER_STOP_VAL_ENABLE:
-                    Log.info(f"{self._object}_monitor stopping publish alert as cluster stop message is received.")
-                    self._publish_alert = False
+            if self._cluster_stop == const.CLUSTER_STOP_VAL_ENABLE:
+                Log.info(f"{self._object}_monitor stopping publish alert as cluster stop message is received.")
+                self._publish_alert = False
         return self._publish_alert
 
     def publish_alert(self, alert):
@@ -122,21 +162,50 @@ class ObjectMonitor(threading.Thread):
         if self.is_publish_enable():
             # Write to message bus
             Log.info(f"{self._object}_monitor sending alert on message bus {alert}")
-            self._producer.publish(str(alert))
+            self._producer.publish(encode_event(alert))
         else:
             Log.info(f"{self._object}_monitor received cluster stop message so skipping publish alert: {str(alert)}.")
 
+    def _run_publisher(self):
+        """
+        Publisher thread target method, publishes alerts queued by the watch reader.
+        """
+        timeout = None if self._flap_damper is None else FlapDampingConst.POLL_INTERVAL
+        while True:
+            alert = self._alert_queue.get(timeout)
+            alerts = [] if alert is None else [alert]
+            if self._flap_damper is not None:
+                # Alerts at the end of damping window, all of them when stopping
+                alerts = self._flap_damper.poll(flush=self._alert_queue.closed) + alerts
+            for an_alert in alerts:
+                try:
+                    self.publish_alert(an_alert)
+                except Exception as err:
+                    Log.error(f"{self._object}_monitor failed to publish alert {an_alert}. Error: {err}")
+            if alert is None and self._alert_queue.closed:
+                break
+
+    @staticmethod
+    def _get_resource_key(alert: dict) -> tuple:
+        """
+        Get resource of the alert, queued alerts of a resource are coalesced.
+        """
+        payload = alert.get("payload", {})
+        return payload.get("resource_type"), payload.get("resource_id")
+
     def run(self):
         """
         Thread target method which loops on Kubernetes Watch.stream() to get pod or node events
         """
         Log.info(f"Starting the {self.name}...")
 
-        # Setup Credentials
-        config.load_incluster_config()
+        k8s_client = self._k8s_client
+        if k8s_client is None:
+            # Setup Credentials
+            config.load_incluster_config()
 
-        # Initialize client
-        k8s_client = client.CoreV1Api()
+            # Initialize client
+            k8s_client = client.CoreV1Api()
 
         # Initialize watch
         k8s_watch = watch.Watch()
@@ -145,15 +214,20 @@ class ObjectMonitor(threading.Thread):
         self._object_function = getattr(k8s_client, ObjectMap.get_subscriber_func(self._object))
         Log.info(f'Starting watch on {self._object} events: {self._object_function.__name__}')
 
+        self._publisher.start()
+
+        # Objects are listed once and watch is resumed from the last resource version seen
+        informer = Informer(self._object_function, k8s_watch, **self._kwargs['watch_args'])
+
         # While True loop to restart the watch.Watch.stream() after specified timeout
         while True:
-            # create a object of Watch.stream generator loop on it.
-            k8s_watch_stream =  k8s_watch.stream(self._object_function, **self._kwargs['watch_args'])
+            # create a object of Informer.stream generator loop on it.
+            k8s_watch_stream = informer.stream()
             # Start watching events corresponding to self._object
             for an_event in k8s_watch_stream:
 
                 # Check for the signals (SIGTERM signal)
-                self.check_for_signals(k8s_watch, k8s_watch_stream)
+                self.check_for_signals(informer, k8s_watch_stream)
 
                 # Due to SIGTERM signal stopping further event processing
                 if self._stop_event_processing:
@@ -161,81 +235,40 @@ class ObjectMonitor(threading.Thread):
                     break
 
                 Log.debug(f"Received event {an_event}")
-                alert, event = EventParser.parse(self._object, an_event, self._object_state, \
-                    self._kwargs.get('resource_id_map', None))
-                if alert is None:
+                handler = LabelHandler.get_handler(self._label_handlers, \
+                    an_event[K8SEventsConst.RAW_OBJECT][K8SEventsConst.METADATA].get(K8SEventsConst.LABELS))
+                if handler is None:
+                    continue
+                k8s_alert = EventParser.parse(self._object, an_event, handler.object_state, \
+                    handler.resource_id_map)
+                if k8s_alert is None:
                     continue
                 if self._starting_up:
                     if an_event[K8SEventsConst.TYPE] == EventStates.ADDED:
-                        spec_info = {'is_status': 'True'}
-                        event.set_specific_info(spec_info)
-                        alert = event.json
+                        k8s_alert = k8s_alert._replace(is_status=True)
                     else:
                         self._starting_up = False
 
-                if self._is_published_alert(alert):
+                # Decoded once for duplicate check and queueing
+                alert = json.loads(k8s_alert.to_health_event().json)
+                if self._published_alerts.is_published(alert):
                     continue
 
-                # Write to message bus
-                self.publish_alert(alert)
+                # Queue for the publisher thread to write to message bus
+                alerts = [alert] if self._flap_damper is None else self._flap_damper.offer(alert)
+                for an_alert in alerts:
+                    self._alert_queue.put(ObjectMonitor._get_resource_key(an_alert), an_alert)
 
+            Log.debug(f"{self._object}_monitor published alerts: {self._published_alerts.stats()}, "
+                      f"alert queue: {self._alert_queue.stats()}, "
+                      f"flap damping: {self._flap_damper.stats() if self._flap_damper else None}")
             # If stop processing events is set then no need to retry just break the loop
             # If we don't specify timeout no need to restart the loop it will happen internally
             # as Watch.stream will be blocking call which has while True loop so no need a loop for it.
             if self._stop_event_processing or K8SClientConst.TIMEOUT_SECONDS not in self._kwargs['watch_args']:
                 break
+        # Alerts already queued are published before stopping
+        self._alert_queue.close()
+        self._publisher.join()
+        self._confstore.unwatch(const.CLUSTER_STOP_KEY, self._on_cluster_stop_change)
         Log.info(f"Stopping the {self.name}...")
-
-    def _is_published_alert(self, alert) -> bool:
-        """
-        Check incoming alert is already published or not.
-        If incoming alert is not found in published alerts, then
-        it is a new alert to publish.
-        Alert will be stored and mapped to its unique key,
-            self._published_alerts = { alert_key : alert }
-        Returns:
-            True if it is published already
-            False if it is a new alert
-        """
-        if isinstance(alert, str):
-            alert = json.loads(alert)
-
-        # Validation expects dictionary data type of alert
-        if not isinstance(alert, dict):
-            return False
-
-        incoming_alert = copy.deepcopy(alert)
-
-        try:
-            header = incoming_alert["header"]
-            payload = incoming_alert["payload"]
-
-            if payload["specific_info"].get("generation_id"):
-                alert_key = "%s_%s_%s" % (payload["node_id"],
-                                        payload["resource_type"],
-                                        payload["specific_info"]["generation_id"])
-            else:
-                alert_key = "%s_%s_%s" % (payload["node_id"],
-                                        payload["resource_type"],
-                                        payload["resource_id"])
-
-            # Alert which is getting repeated also has new timestamp.
-            # So timestamp field should be ignored for validation.
-            if "timestamp" in header.keys():
-                del incoming_alert["header"]["timestamp"]
-
-        except KeyError as err:
-            Log.error(f"Alert validation failed as key {err} not found")
-
-        else:
-            incoming_alert_msg = json.dumps(payload, sort_keys=True)
-            published_alert = self._published_alerts.get(alert_key)
-
-            if incoming_alert_msg == published_alert:
-                # Published already
-                return True
-            else:
-                # New alert
-                self._published_alerts[alert_key] = incoming_alert_msg
-
-        return False
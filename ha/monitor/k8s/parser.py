@@ -15,143 +15,152 @@
 # about this software or licensing, please email opensource@seagate.com or
 # cortx-questions@seagate.com.
 
+from threading import Lock
+from typing import Dict, Optional, Tuple
+
 from ha.monitor.k8s.error import NotSupportedObjectError
 from ha.monitor.k8s.const import K8SEventsConst
 from ha.monitor.k8s.const import AlertStates
 from ha.monitor.k8s.const import EventStates
+from ha.monitor.k8s.alert import K8sAlert
 
 from cortx.utils.log import Log
-from ha.fault_tolerance.const import HEALTH_EVENT_SOURCES, NOT_DEFINED
-from cortx.utils.event_framework.health import HealthAttr, HealthEvent
 
 
-class ObjectParser:
-    def __init__(self):
-        # KvPayload supports empty strings for default value if value not set.
-        # None will decode as 'null' in json.dumps in KvPayload object
-        # and may failed ast.literal_eval
-        self.payload = {HealthAttr.SOURCE.value: HEALTH_EVENT_SOURCES.MONITOR.value,
-                    HealthAttr.CLUSTER_ID.value: '',
-                    HealthAttr.SITE_ID.value: NOT_DEFINED,
-                    HealthAttr.RACK_ID.value: NOT_DEFINED,
-                    HealthAttr.STORAGESET_ID.value: NOT_DEFINED,
-                    HealthAttr.NODE_ID.value: '', HealthAttr.RESOURCE_TYPE.value: '',
-                    HealthAttr.RESOURCE_ID.value: '', HealthAttr.RESOURCE_STATUS.value: '',
-                    HealthAttr.SPECIFIC_INFO.value: {}}
-
-    def parse(self, an_event, cached_state, resource_id_map):
-        pass
+class ReadyStates:
+    """
+    Last ready state of the objects seen by a monitor, keyed by resource id.
+    State is None if the object had no ready condition. Object is evicted
+    when it is deleted. Updates are atomic so events can be parsed by
+    several threads.
+    """
 
+    __slots__ = ("_states", "_lock")
 
-class NodeEventParser(ObjectParser):
     def __init__(self):
-        super().__init__()
-        self._type = 'host'
+        self._states: Dict[str, Optional[bool]] = {}
+        self._lock = Lock()
+
+    def __contains__(self, resource_id: str) -> bool:
+        return resource_id in self._states
+
+    def __len__(self) -> int:
+        return len(self._states)
 
-    def _create_health_alert(self, res_type: str, res_name: str, health_status: str) -> dict:
+    def get(self, resource_id: str) -> Optional[bool]:
+        return self._states.get(resource_id)
+
+    def update(self, resource_id: str, ready: Optional[bool], add: bool = True) -> Tuple[bool, Optional[bool]]:
         """
-        Instantiates Event class which creates Health event object with necessary
-        attributes to pass it for further processing.
+        Set ready state of the object.
 
         Args:
-        res_type: resource_type for which event needs to be created. Ex: node, disk
-        res_name: actual resource name. Ex: machine_id in case of node alerts
-        health_status: health of that resource. Ex: online, offline
+            add (bool): add the object if not known, else only known object is updated.
+
+        Returns:
+            tuple: (object was known, its earlier state)
         """
-        self.payload[HealthAttr.RESOURCE_TYPE.value] = res_type
-        self.payload[HealthAttr.RESOURCE_ID.value] = self.payload[HealthAttr.NODE_ID.value] = res_name
-        self.payload[HealthAttr.RESOURCE_STATUS.value] = health_status
+        with self._lock:
+            known = resource_id in self._states
+            previous = self._states.get(resource_id)
+            if known or add:
+                self._states[resource_id] = ready
+            return known, previous
 
-        # Create event schema object with payload data also
-        # can change value of payload attributes with set function
-        self.event = HealthEvent(**self.payload)
-        return self.event.json
+    def evict(self, resource_id: str) -> None:
+        with self._lock:
+            self._states.pop(resource_id, None)
 
-    def parse(self, an_event, cached_state, resource_id_map):
-        resource_type = self._type
-        raw_object = an_event[K8SEventsConst.RAW_OBJECT]
 
-        if K8SEventsConst.TYPE in an_event:
-            event_type = an_event[K8SEventsConst.TYPE]
-        if K8SEventsConst.NAME in raw_object[K8SEventsConst.METADATA]:
-            resource_name = raw_object[K8SEventsConst.METADATA][K8SEventsConst.NAME]
+class ObjectParser:
+    """
+    Parser of the events of a kubernetes object type. Parsers do not keep
+    any state, state of the objects is passed to parse, so the same parser
+    can be used by any thread.
+    """
+
+    def __init__(self, resource_type: str):
+        self._type = resource_type
+
+    @staticmethod
+    def get_ready_status(raw_object: dict) -> Optional[bool]:
+        """
+        Get status of 'Ready' condition of the object, None if it has no ready condition.
+        """
+        status = raw_object.get(K8SEventsConst.STATUS) or {}
+        for a_condition in status.get(K8SEventsConst.CONDITIONS) or ():
+            if a_condition.get(K8SEventsConst.TYPE) == K8SEventsConst.READY:
+                ready_status = a_condition.get(K8SEventsConst.STATUS)
+                return None if ready_status is None else ready_status.lower() == K8SEventsConst.true
+        return None
+
+    def _get_resource(self, raw_object: dict, resource_id_map: dict) -> Tuple[str, str]:
+        """
+        Get (resource id, generation id) of the object.
+        """
+        return raw_object[K8SEventsConst.METADATA].get(K8SEventsConst.NAME), None
+
+    def parse(self, an_event: dict, cached_state: ReadyStates, resource_id_map: dict) -> Optional[K8sAlert]:
+        """
+        Parse event and update state of the object.
+
+        Args:
+            an_event (dict): event of kubernetes watch.
+            cached_state (ReadyStates): state of the objects of the monitor.
+            resource_id_map (dict): mapping of the object labels and resource id.
+
+        Returns:
+            K8sAlert: alert if object is online or offline now, else None.
+        """
+        event_type = an_event.get(K8SEventsConst.TYPE)
+        raw_object = an_event[K8SEventsConst.RAW_OBJECT]
+        resource_id, generation_id = self._get_resource(raw_object, resource_id_map)
+        if resource_id is None:
+            Log.debug(f"No resource id found for {self._type} event {event_type}")
+            return None
 
-        ready_status = None
-        try:
-            for a_condition in raw_object[K8SEventsConst.STATUS][K8SEventsConst.CONDITIONS]:
-                if a_condition[K8SEventsConst.TYPE] == K8SEventsConst.READY:
-                    ready_status = a_condition[K8SEventsConst.STATUS]
-        except Exception as e:
-            Log.debug(f"Exception received during parsing {e}")
+        if event_type == EventStates.DELETED:
+            cached_state.evict(resource_id)
+            return None
 
-        if ready_status is None:
-            Log.debug(f"ready_status is None for node resource {resource_name}")
-            cached_state[resource_name] = ready_status
-            return (None, None)
+        ready = ObjectParser.get_ready_status(raw_object)
+        if ready is None:
+            Log.debug(f"ready_status is None for {self._type} resource {resource_id}")
+            cached_state.update(resource_id, None)
+            return None
 
         if event_type == EventStates.ADDED:
-            cached_state[resource_name] = ready_status.lower()
-            if ready_status.lower() == K8SEventsConst.true:
-                event_type = AlertStates.ONLINE
-                health_alert = self._create_health_alert(resource_type, resource_name, event_type)
-                return health_alert, self.event
-            else:
-                Log.debug(f"[EventStates ADDED] No change detected for node resource {resource_name}")
-                return (None, None)
+            cached_state.update(resource_id, ready)
+            if ready:
+                return K8sAlert(self._type, resource_id, AlertStates.ONLINE, generation_id)
+            Log.debug(f"[EventStates ADDED] No change detected for {self._type} resource {resource_id}")
+            return None
 
         if event_type == EventStates.MODIFIED:
-            if resource_name in cached_state:
-                if cached_state[resource_name] != K8SEventsConst.true and ready_status.lower() == K8SEventsConst.true:
-                    cached_state[resource_name] = ready_status.lower()
-                    event_type = AlertStates.ONLINE
-                    health_alert = self._create_health_alert(resource_type, resource_name, event_type)
-                    return health_alert, self.event
-                elif cached_state[resource_name] == K8SEventsConst.true and ready_status.lower() != K8SEventsConst.true:
-                    cached_state[resource_name] = ready_status.lower()
-                    event_type = AlertStates.OFFLINE
-                    health_alert = self._create_health_alert(resource_type, resource_name, event_type)
-                    return health_alert, self.event
-                else:
-                    Log.debug(f"[EventStates MODIFIED] No change detected for node resource {resource_name}")
-                    return (None, None)
-            else:
-                Log.debug(f"[EventStates MODIFIED] No cached state detected for node resource {resource_name}")
-                return (None, None)
-
-        # Handle DELETED event - Not required for Cortx
-
-        return (None, None)
+            known, was_ready = cached_state.update(resource_id, ready, add=False)
+            if not known:
+                Log.debug(f"[EventStates MODIFIED] No cached state detected for {self._type} resource {resource_id}")
+                return None
+            if was_ready is not True and ready:
+                return K8sAlert(self._type, resource_id, AlertStates.ONLINE, generation_id)
+            if was_ready is True and not ready:
+                return K8sAlert(self._type, resource_id, AlertStates.OFFLINE, generation_id)
+            Log.debug(f"[EventStates MODIFIED] No change detected for {self._type} resource {resource_id}")
 
+        return None
 
-class PodEventParser(ObjectParser):
+
+class NodeEventParser(ObjectParser):
     def __init__(self):
-        super().__init__()
+        super().__init__('host')
+
 
+class PodEventParser(ObjectParser):
+    def __init__(self):
         # Note: The below type is not a Kubernetes 'node'.
         #       in cortx cluster the pod is called or considered as a node.
         #       hence while sending alert to cortx, below type is set to 'node'.
-        self._type = 'node'
-
-    def _create_health_alert(self, res_type, res_name, health_status, generation_id):
-        """
-        Instantiates Event class which creates Health event object with necessary
-        attributes to pass it for further processing.
-
-        Args:
-        res_type: resource_type for which event needs to be created. Ex: node, disk
-        res_name: actual resource name. Ex: machine_id in case of node alerts
-        health_status: health of that resource. Ex: online, offline
-        generation_id: name of the node in case of node alert
-        """
-        self.payload[HealthAttr.RESOURCE_TYPE.value] = res_type
-        self.payload[HealthAttr.RESOURCE_ID.value] = res_name
-        self.payload[HealthAttr.NODE_ID.value] = res_name
-        self.payload[HealthAttr.RESOURCE_STATUS.value] = health_status
-        # Create event schema object with payload data also
-        # can change value of payload attributes with set function
-        self.event = HealthEvent(**self.payload)
-        self.event.set_specific_info({"generation_id": generation_id})
-        return self.event.json
+        super().__init__('node')
 
     @staticmethod
     def _get_resource_id(labels: dict, resource_id_map: dict) -> str:
@@ -189,66 +198,12 @@ class PodEventParser(ObjectParser):
 
         return resource_id
 
-    def parse(self, an_event, cached_state, resource_id_map):
-        resource_type = self._type
-        raw_object = an_event[K8SEventsConst.RAW_OBJECT]
-
-        resource_id = PodEventParser._get_resource_id(raw_object[K8SEventsConst.METADATA][K8SEventsConst.LABELS],\
-            resource_id_map)
-
-        if K8SEventsConst.TYPE in an_event:
-            event_type = an_event[K8SEventsConst.TYPE]
+    def _get_resource(self, raw_object: dict, resource_id_map: dict) -> Tuple[str, str]:
         # Actual physical host information is not needed now.
         # If required, can be available in K8SEventsConst.SPEC.
-        # So, removing it from now.
-        if K8SEventsConst.NAME in raw_object[K8SEventsConst.METADATA]:
-            generation_id = raw_object[K8SEventsConst.METADATA][K8SEventsConst.NAME]
-
-        ready_status = None
-        try:
-            for a_condition in raw_object[K8SEventsConst.STATUS][K8SEventsConst.CONDITIONS]:
-                if a_condition[K8SEventsConst.TYPE] == K8SEventsConst.READY:
-                    ready_status = a_condition[K8SEventsConst.STATUS]
-        except Exception as e:
-            Log.debug(f"Exception received during parsing {e}")
-
-        if ready_status is None:
-            Log.debug(f"ready_status is None for pod resource {resource_id}")
-            cached_state[resource_id] = ready_status
-            return (None, None)
-
-        if an_event[K8SEventsConst.TYPE] == EventStates.ADDED:
-            cached_state[resource_id] = ready_status.lower()
-            if ready_status.lower() != K8SEventsConst.true:
-                Log.debug(f"[EventStates ADDED] No change detected for pod resource {resource_id}")
-                return (None, None)
-            else:
-                event_type = AlertStates.ONLINE
-                health_alert = self._create_health_alert(resource_type, resource_id, event_type, generation_id)
-                return health_alert, self.event
-
-        if event_type == EventStates.MODIFIED:
-            if resource_id in cached_state:
-                if cached_state[resource_id] != K8SEventsConst.true and ready_status.lower() == K8SEventsConst.true:
-                    cached_state[resource_id] = ready_status.lower()
-                    event_type = AlertStates.ONLINE
-                    health_alert = self._create_health_alert(resource_type, resource_id, event_type, generation_id)
-                    return health_alert, self.event
-                elif cached_state[resource_id] == K8SEventsConst.true and ready_status.lower() != K8SEventsConst.true:
-                    cached_state[resource_id] = ready_status.lower()
-                    event_type = AlertStates.OFFLINE
-                    health_alert = self._create_health_alert(resource_type, resource_id, event_type, generation_id)
-                    return health_alert, self.event
-                else:
-                    Log.debug(f"[EventStates MODIFIED] No change detected for pod resource {resource_id}")
-                    return (None, None)
-            else:
-                Log.debug(f"[EventStates MODIFIED] No cached state detected for pod resource {resource_id}")
-                return (None, None)
-
-        # Handle DELETED event - Not required for Cortx
-
-        return (None, None)
+        metadata = raw_object[K8SEventsConst.METADATA]
+        resource_id = PodEventParser._get_resource_id(metadata.get(K8SEventsConst.LABELS) or {}, resource_id_map or {})
+        return resource_id, metadata.get(K8SEventsConst.NAME)
 
 
 class EventParser:
@@ -258,7 +213,7 @@ class EventParser:
     }
 
     @staticmethod
-    def parse(k_object, an_event, cached_state, resource_id_map):
+    def parse(k_object, an_event, cached_state, resource_id_map) -> Optional[K8sAlert]:
         if k_object in EventParser.parser_map:
             object_event_parser = EventParser.parser_map[k_object]
             return object_event_parser.parse(an_event, cached_state, resource_id_map)
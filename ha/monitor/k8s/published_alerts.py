@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import hashlib
+import json
+import sys
+import time
+from collections import OrderedDict
+from typing import Callable
+
+from cortx.utils.log import Log
+from ha.monitor.k8s.const import PublishedAlertConst
+
+class PublishedAlerts:
+    """
+    Fingerprints of the alerts published by a k8s object monitor, used to
+    drop alerts repeated by the watch (ex. ADDED events sent again when the
+    watch is restarted).
+
+    Only a 128 bit hash of the payload is kept per resource, entries are
+    dropped once max_alerts is reached, least recently seen first, or when
+    not seen for ttl seconds, so memory does not grow with pods getting
+    recreated with new generation ids.
+    """
+
+    def __init__(self, max_alerts: int = PublishedAlertConst.MAX_ALERTS,
+                 ttl: float = PublishedAlertConst.TTL, clock: Callable[[], float] = time.monotonic):
+        """
+        Init method.
+
+        Args:
+            max_alerts (int): max alerts remembered.
+            ttl (float): seconds an alert is remembered after it was last seen.
+            clock (Callable): time source, seconds.
+        """
+        self._max_alerts = max_alerts
+        self._ttl = ttl
+        self._clock = clock
+        # {alert_key: (fingerprint, expiry)}, least recently seen first.
+        self._alerts = OrderedDict()
+        self._duplicates = 0
+        self._evicted = 0
+        self._expired = 0
+
+    @staticmethod
+    def _get_key(payload: dict) -> str:
+        if payload["specific_info"].get("generation_id"):
+            resource = payload["specific_info"]["generation_id"]
+        else:
+            resource = payload["resource_id"]
+        return f"{payload['node_id']}_{payload['resource_type']}_{resource}"
+
+    @staticmethod
+    def fingerprint(payload: dict) -> bytes:
+        """
+        Get 128 bit hash of the payload, same for same values in any key order.
+        """
+        normalized = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.blake2b(normalized.encode('utf-8'), digest_size=16).digest()
+
+    def is_published(self, alert) -> bool:
+        """
+        Check if alert is already published and remember it if not. Alert
+        timestamp is not compared as a repeated alert has a new timestamp.
+
+        Args:
+            alert (dict/str): health event or its json.
+
+        Returns:
+            True if it is published already
+            False if it is a new alert
+        """
+        if isinstance(alert, str):
+            alert = json.loads(alert)
+        # Validation expects dictionary data type of alert
+        if not isinstance(alert, dict):
+            return False
+        try:
+            payload = alert["payload"]
+            alert_key = PublishedAlerts._get_key(payload)
+        except KeyError as err:
+            Log.error(f"Alert validation failed as key {err} not found")
+            return False
+
+        fingerprint = PublishedAlerts.fingerprint(payload)
+        now = self._clock()
+        self._expire(now)
+        published = self._alerts.get(alert_key)
+        self._alerts[alert_key] = (fingerprint, now + self._ttl)
+        self._alerts.move_to_end(alert_key)
+        if published is not None and published[0] == fingerprint:
+            self._duplicates += 1
+            return True
+        while len(self._alerts) > self._max_alerts:
+            self._alerts.popitem(last=False)
+            self._evicted += 1
+        return False
+
+    def _expire(self, now: float) -> None:
+        """
+        Drop alerts not seen for ttl, they are the oldest ones.
+        """
+        while self._alerts:
+            _, (_, expiry) = next(iter(self._alerts.items()))
+            if expiry > now:
+                break
+            self._alerts.popitem(last=False)
+            self._expired += 1
+
+    def __len__(self) -> int:
+        return len(self._alerts)
+
+    def stats(self) -> dict:
+        """
+        Get counters and approximate memory used, in bytes.
+        """
+        memory = sys.getsizeof(self._alerts)
+        for alert_key, value in self._alerts.items():
+            memory += sys.getsizeof(alert_key) + sys.getsizeof(value) + sys.getsizeof(value[0]) + sys.getsizeof(value[1])
+        return {"alerts": len(self._alerts), "duplicates": self._duplicates,
+                "evicted": self._evicted, "expired": self._expired, "memory": memory}
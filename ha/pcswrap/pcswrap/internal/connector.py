@@ -16,6 +16,8 @@
 import logging
 import re
 from subprocess import PIPE, Popen
+from threading import Lock
+from time import monotonic
 from typing import Any, Dict, List, Match, Optional, Tuple
 
 import defusedxml.ElementTree as ET
@@ -23,13 +25,19 @@ from pcswrap.exception import CliException, PcsNoStatusException
 from pcswrap.types import Node, PcsConnector, Resource, StonithResource
 
 
+# Max age of the parsed cluster status reused by CliConnector, seconds.
+# Kept below the Waiter pause so that every poll sees a new status.
+STATUS_TTL_SECONDS = 1
+
+
 def _to_bool(value: str) -> bool:
     return 'true' == value
 
 
 class CliExecutor:
     def get_full_status_xml(self) -> str:
-        return self._execute(['pcs', 'status', '--full', 'xml'])
+        return self._execute(
+            ['crm_mon', '--one-shot', '--inactive', '--output-as=xml'])
 
     def get_status_text(self) -> str:
         return self._execute(['pcs', 'status'])
@@ -129,8 +137,31 @@ class StonithParser:
 
 
 class CliConnector(PcsConnector):
-    def __init__(self, executor: CliExecutor = None):
+    def __init__(self,
+                 executor: CliExecutor = None,
+                 status_ttl: float = STATUS_TTL_SECONDS):
         self.executor: CliExecutor = executor or CliExecutor()
+        self._status_ttl = status_ttl
+        self._status_lock = Lock()
+        self._status: Any = None
+        self._status_time = 0.0
+
+    def _get_status(self) -> Any:
+        # Status is read once per ttl and shared by all the getters.
+        # Concurrent callers wait on the lock for the read in progress
+        # instead of running crm_mon again.
+        with self._status_lock:
+            now = monotonic()
+            if self._status is None or \
+                    now - self._status_time > self._status_ttl:
+                xml_str = self.executor.get_full_status_xml()
+                self._status = self._parse_xml(xml_str)
+                self._status_time = now
+            return self._status
+
+    def _invalidate_status(self) -> None:
+        with self._status_lock:
+            self._status = None
 
     def get_nodes(self) -> List[Node]:
         b = _to_bool
@@ -142,8 +173,7 @@ class CliConnector(PcsConnector):
                         standby=b(tag.attrib['standby']),
                         resources_running=int(tag.attrib['resources_running']))
 
-        xml_str = self.executor.get_full_status_xml()
-        xml = self._parse_xml(xml_str)
+        xml = self._get_status()
 
         result: List[Node] = [
             to_node(tag) for tag in xml.findall('./nodes/node')
@@ -169,18 +199,23 @@ class CliConnector(PcsConnector):
 
     def standby_node(self, node_name: str) -> None:
         self.executor.standby_node(node_name)
+        self._invalidate_status()
 
     def unstandby_node(self, node_name: str) -> None:
         self.executor.unstandby_node(node_name)
+        self._invalidate_status()
 
     def standby_all(self) -> None:
         self.executor.standby_all()
+        self._invalidate_status()
 
     def unstandby_all(self) -> None:
         self.executor.unstandby_all()
+        self._invalidate_status()
 
     def shutdown_node(self, node_name: str) -> None:
         self.executor.shutdown_node(node_name)
+        self._invalidate_status()
 
     def get_resources(self) -> List[Resource]:
         return self._get_all_resources()
@@ -207,13 +242,14 @@ class CliConnector(PcsConnector):
 
     def disable_resource(self, resource: Resource) -> None:
         self.executor.set_enabled(resource.id, False)
+        self._invalidate_status()
 
     def enable_resource(self, resource: Resource) -> None:
         self.executor.set_enabled(resource.id, True)
+        self._invalidate_status()
 
     def _get_all_resources(self) -> List[Resource]:
-        xml_str = self.executor.get_full_status_xml()
-        xml = self._parse_xml(xml_str)
+        xml = self._get_status()
 
         def to_resource(tag):
             b = _to_bool
@@ -253,6 +289,7 @@ class CliConnector(PcsConnector):
 
         self.executor.shutdown_by_ipmi(node_name, resource.login,
                                        resource.passwd, resource.ipaddr)
+        self._invalidate_status()
 
     def ensure_shutdown_possible(self, node_name: str) -> None:
         resource = self.get_fence_resource_for_node(node_name)
@@ -261,8 +298,7 @@ class CliConnector(PcsConnector):
                 f'No stonith resource is found for node {node_name}.')
 
     def _get_resources_configured_tag(self) -> Any:
-        xml_str = self.executor.get_full_status_xml()
-        xml = self._parse_xml(xml_str)
+        xml = self._get_status()
         return xml.find('./summary/resources_configured')
 
     def get_stopped_resource_count(self) -> int:
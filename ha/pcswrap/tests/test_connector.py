@@ -136,6 +136,19 @@ class PcsExecutorTest(unittest.TestCase):
         self.assertEqual(['c-259.stonith', 'c-260.stonith'],
                          [x.id for x in resources])
 
+    def test_status_read_once_per_ttl(self):
+        stub_executor = CliExecutor()
+        stub_executor.get_full_status_xml = MagicMock(return_value=GOOD_XML)
+        stub_executor.standby_node = MagicMock()
+        connector = CliConnector(executor=stub_executor)
+        connector.get_nodes()
+        connector.get_resources()
+        connector.get_eligible_resource_count()
+        self.assertEqual(1, stub_executor.get_full_status_xml.call_count)
+        connector.standby_node('node01')
+        connector.get_nodes()
+        self.assertEqual(2, stub_executor.get_full_status_xml.call_count)
+
 
 class RealXmlParseTestV21(unittest.TestCase):
     def test_get_nodes_works(self):
@@ -23,8 +23,8 @@ import re
 from typing import Callable, List, NamedTuple, Union, Optional
 from xml.etree import ElementTree
 from xml.etree.ElementTree import Element
+from ha.core.controllers.pcs.pcs_status import PcsStatusProvider
 from ha.core.error import SetupError
-from ha.execute import SimpleCommand
 from ha.setup.cluster_validator.pcs_const import COMMNANDS
 from ha.setup.cluster_validator.pcs_const import CLUSTER_ATTRIBUTES
 from ha.setup.cluster_validator.pcs_const import RESOURCE_ATTRIBUTES
@@ -84,9 +84,13 @@ class ClusterStatusPcs():
     """Implementation of interface for pcs status --xml command."""
 
     def __init__(self, executor: Callable[[str], tuple] = None):
-        """Call `pcs status` and init XML object for further parsing"""
+        """
+        Init XML object for further parsing. Without executor the shared
+        pacemaker status snapshot is used.
+        """
         if not executor:
-            executor = SimpleCommand().run_cmd
+            self.tree = PcsStatusProvider.get_instance().get().tree
+            return
         output, _, _ = executor(COMMNANDS.PCS_STATUS_XML)
         self.tree = ElementTree.fromstring(output)
 
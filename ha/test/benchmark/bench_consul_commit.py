@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+"""
+ ****************************************************************************
+ Description:       Benchmark ConsulKvStore.commit against the in process
+                    consul stand-in. Compares sequential transactions with
+                    transactions sent in parallel.
+
+ Usage:             python3 bench_consul_commit.py --keys 10000 --parallel 1 4 8
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..'))
+from cortx.utils.log import Log
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.test.unit.fake_consul import FakeConsul
+
+def _time_commit(store: ConsulKvStore, num_keys: int, parallel: int) -> float:
+    for i in range(num_keys):
+        store._payload[store._prepare_key(f"node{HA_DELIM}n{i}{HA_DELIM}health")] = f"online-{parallel}"
+    start = time.perf_counter()
+    store.commit(parallel=parallel)
+    return time.perf_counter() - start
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ConsulKvStore.commit")
+    parser.add_argument("--keys", type=int, default=10000, help="Number of keys per commit")
+    parser.add_argument("--parallel", type=int, nargs="+", default=[1, 4, 8],
+                        help="Transactions sent together")
+    parser.add_argument("--delay", type=float, default=0.002,
+                        help="Simulated consul latency(sec) per request")
+    args = parser.parse_args(argv)
+
+    Log.init(service_name="bench_consul_commit", log_path="/tmp", level="ERROR", console_output=False)
+    with FakeConsul(delay=args.delay) as fake:
+        store = ConsulKvStore(f"cortx{HA_DELIM}ha{HA_DELIM}v2", host="127.0.0.1", port=fake.port, enable_batch=True)
+        print(f"{'keys':>10} {'parallel':>10} {'commit (s)':>12} {'speedup':>10}")
+        baseline = None
+        for parallel in args.parallel:
+            elapsed = _time_commit(store, args.keys, parallel)
+            baseline = baseline or elapsed
+            print(f"{args.keys:>10} {parallel:>10} {elapsed:>12.4f} {baseline / elapsed:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+"""
+ ****************************************************************************
+ Description:       Benchmark decoding of k8s monitor alerts in fault
+                    tolerance. Compares one decode_event of the canonical
+                    json message with the earlier ast.literal_eval, json
+                    dumps and loads done by both filter and parser.
+
+ Usage:             python3 bench_event_decode.py --messages 100000
+ ****************************************************************************
+"""
+
+import argparse
+import ast
+import json
+import os
+import pathlib
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..'))
+from ha.util.event_codec import decode_event, encode_event
+
+ALERT = {
+    "header": {"event_id": "16600000001234", "timestamp": "1660000000", "version": "1.0"},
+    "payload": {"source": "monitor", "cluster_id": "", "site_id": "1", "rack_id": "1",
+                "storageset_id": "1", "node_id": "n1", "resource_type": "node",
+                "resource_id": "n1", "resource_status": "online",
+                "specific_info": {"generation_id": "cortx-data-0"}}
+}
+
+def legacy_decode(message: bytes) -> dict:
+    msg = message.decode('utf-8')
+    # filter_event and parse_event each decoded the message.
+    json.loads(json.dumps(ast.literal_eval(msg)))
+    return json.loads(json.dumps(ast.literal_eval(msg)))
+
+def _time_decode(num_messages: int, message: bytes, decode) -> float:
+    start = time.perf_counter()
+    for _ in range(num_messages):
+        decode(message)
+    return (time.perf_counter() - start) / num_messages
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark k8s monitor alert decoding")
+    parser.add_argument("--messages", type=int, default=100000, help="Number of messages")
+    args = parser.parse_args(argv)
+
+    canonical = _time_decode(args.messages, encode_event(ALERT).encode('utf-8'), decode_event)
+    legacy = _time_decode(args.messages, str(ALERT).encode('utf-8'), legacy_decode)
+    print(f"{'messages':>10} {'decode_event (us)':>18} {'literal_eval (us)':>18} {'speedup':>10}")
+    print(f"{args.messages:>10} {canonical * 1e6:>18.2f} {legacy * 1e6:>18.2f} {legacy / canonical:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
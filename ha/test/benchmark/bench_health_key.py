@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+"""
+ ****************************************************************************
+ Description:       Benchmark health key building done per health event.
+                    Compares the compiled key templates and memoised
+                    component lookup with the earlier regex templating and
+                    resource list scan.
+
+ Usage:             python3 bench_health_key.py --events 100000
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import pathlib
+import re
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..'))
+from ha import const
+from ha.core.system_health.health_evaluators.element_health_evaluator import ElementHealthEvaluator
+from ha.core.system_health.system_health_metadata import SystemHealthComponents
+
+RESOURCE_TYPES = ["node:fru:disk", "node:os:memory_usage", "node:sw:os_service", "enclosure:hw:psu",
+                  "node", "cvg", "disk", "cluster"]
+
+def legacy_prepare_key(component: str, **kwargs) -> str:
+    key = SystemHealthComponents.get_key(component)
+    if "comp_id" in kwargs:
+        key = key.replace(f"${component}_id", kwargs["comp_id"])
+    subs = re.findall(r"\$\w+", key)
+    for sub in subs:
+        argument = re.split(r"\$", sub)
+        if argument[1] in kwargs:
+            key = re.sub(r"\$\w+", kwargs[argument[1]], key, 1)
+        else:
+            key = re.split(r"\$", key)
+            key = key[0]
+            break
+    return key
+
+def legacy_get_component(resource_type: str) -> str:
+    for key in SystemHealthComponents._components:
+        for item in SystemHealthComponents._components[key][const.RESOURCE_LIST]:
+            if item in resource_type:
+                return key
+    return None
+
+def _time_events(num_events: int, get_component, prepare_key) -> float:
+    kwargs = {"cluster_id": "c1", "site_id": "1", "rack_id": "1", "storageset_id": "1",
+              "node_id": "node-1", "server_id": "node-1", "storage_id": "node-1",
+              "comp_type": "disk", "comp_id": "/dev/sda", "cvg_id": "cvg-1"}
+    start = time.perf_counter()
+    for i in range(num_events):
+        component = get_component(RESOURCE_TYPES[i % len(RESOURCE_TYPES)])
+        # Key of the element and of its parents up to the cluster
+        for element in (component, "node", "rack", "site", "cluster"):
+            prepare_key(element, **kwargs)
+    return (time.perf_counter() - start) / num_events
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark health key building per event")
+    parser.add_argument("--events", type=int, default=100000, help="Number of events")
+    args = parser.parse_args(argv)
+
+    compiled = _time_events(args.events, SystemHealthComponents.get_component, ElementHealthEvaluator.prepare_key)
+    legacy = _time_events(args.events, legacy_get_component, legacy_prepare_key)
+    print(f"{'events':>10} {'compiled (us)':>15} {'regex (us)':>12} {'speedup':>10}")
+    print(f"{args.events:>10} {compiled * 1e6:>15.2f} {legacy * 1e6:>12.2f} {legacy / compiled:>9.1f}x")
+
+if __name__ == "__main__":
+    main()
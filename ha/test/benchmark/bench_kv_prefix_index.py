@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+"""
+ ****************************************************************************
+ Description:       Benchmark the ConsulKvStore batch payload lookups done
+                    while batching health keys(set checks key_exists first).
+                    Compares KvPrefixIndex with the earlier startswith scan
+                    of a dict.
+
+ Usage:             python3 bench_kv_prefix_index.py --keys 10000 50000
+ ****************************************************************************
+"""
+
+import argparse
+import os
+import pathlib
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..'))
+from ha.const import HA_DELIM
+from ha.util.kv_prefix_index import KvPrefixIndex
+
+CVG_PER_NODE = 2
+DISK_PER_CVG = 12
+
+def generate_keys(num_keys: int) -> list:
+    """
+    Generate about num_keys health keys, in the order ConfigCmd adds them.
+    """
+    prefix = HA_DELIM.join(["cortx", "ha", "v2", "cortx", "ha", "system", "cluster", "c1", "site", "1", "rack", "1"])
+    keys = []
+    node = 0
+    while len(keys) < num_keys:
+        node_key = f"{prefix}{HA_DELIM}node{HA_DELIM}node-{node}"
+        keys.append(f"{node_key}{HA_DELIM}health")
+        for cvg in range(CVG_PER_NODE):
+            cvg_key = f"{node_key}{HA_DELIM}cvg{HA_DELIM}cvg-{cvg}"
+            keys.append(f"{cvg_key}{HA_DELIM}health")
+            for disk in range(DISK_PER_CVG):
+                keys.append(f"{cvg_key}{HA_DELIM}disk{HA_DELIM}/dev/sd{cvg}{disk}{HA_DELIM}health")
+        node += 1
+    return keys[:num_keys]
+
+def _batch_indexed(keys: list) -> float:
+    start = time.perf_counter()
+    payload = KvPrefixIndex()
+    for key in keys:
+        if not payload.has_prefix(key):
+            payload[key] = "online"
+    payload.items_with_prefix(keys[0].rsplit(HA_DELIM, 3)[0])
+    return time.perf_counter() - start
+
+def _batch_scan(keys: list) -> float:
+    start = time.perf_counter()
+    payload = {}
+    for key in keys:
+        if not [name for name in payload if name.startswith(key)]:
+            payload[key] = "online"
+    prefix = keys[0].rsplit(HA_DELIM, 3)[0]
+    {name: val for name, val in payload.items() if name.startswith(prefix)}
+    return time.perf_counter() - start
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark ConsulKvStore batch payload lookups")
+    parser.add_argument("--keys", type=int, nargs="+", default=[10000, 50000],
+                        help="Number of batched keys")
+    parser.add_argument("--scan-limit", type=int, default=20000,
+                        help="Skip the startswith scan for more keys than this")
+    args = parser.parse_args(argv)
+
+    print(f"{'keys':>10} {'indexed (s)':>14} {'scan (s)':>12} {'speedup':>10}")
+    for num_keys in args.keys:
+        keys = generate_keys(num_keys)
+        indexed = _batch_indexed(keys)
+        if num_keys <= args.scan_limit:
+            scan = _batch_scan(keys)
+            print(f"{num_keys:>10} {indexed:>14.4f} {scan:>12.4f} {scan / indexed:>9.1f}x")
+        else:
+            print(f"{num_keys:>10} {indexed:>14.4f} {'skipped':>12} {'-':>10}")
+
+if __name__ == "__main__":
+    main()
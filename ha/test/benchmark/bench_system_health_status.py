@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+"""
+ ****************************************************************************
+ Description:       Benchmark SystemHealth.get_status on synthetic health stores.
+                    Compares the indexed health tree builder with the earlier
+                    per component regex scan of the health keys.
+
+ Usage:             python3 bench_system_health_status.py --keys 10000 100000
+ ****************************************************************************
+"""
+
+import argparse
+import json
+import os
+import pathlib
+import re
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..'))
+from cortx.utils.log import Log
+from ha import const
+from ha.const import HA_DELIM
+from ha.core.system_health.system_health import SystemHealth
+from ha.core.system_health.system_health_hierarchy import HealthHierarchy
+from ha.core.system_health.model.health_status import StatusOutput
+from ha.core.system_health.system_health_index import HealthIndexEntry
+
+CVG_PER_NODE = 2
+DISK_PER_CVG = 12
+HIERARCHY_FILE = os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..',
+                              'conf', 'etc', 'v2', 'system_health_hierarchy.json')
+
+def generate_store(num_keys: int) -> dict:
+    """
+    Generate health keys for a cluster with about num_keys keys.
+    """
+    value = json.dumps({"events": [{"status": "online", "created_timestamp": "1650000000"}]})
+    prefix = HA_DELIM.join([const.CLUSTER_CONFSTORE_PREFIX.strip(HA_DELIM), "cortx", "ha", "system", "cluster", "c1"])
+    rack = HA_DELIM.join([prefix, "site", "1", "rack", "1"])
+    store = {f"{prefix}{HA_DELIM}health": value,
+             f"{prefix}{HA_DELIM}site{HA_DELIM}1{HA_DELIM}health": value,
+             f"{rack}{HA_DELIM}health": value}
+    keys_per_node = 1 + CVG_PER_NODE * (1 + DISK_PER_CVG)
+    for node in range(max(1, num_keys // keys_per_node)):
+        node_key = f"{rack}{HA_DELIM}node{HA_DELIM}node-{node}"
+        store[f"{node_key}{HA_DELIM}health"] = value
+        for cvg in range(CVG_PER_NODE):
+            cvg_key = f"{node_key}{HA_DELIM}cvg{HA_DELIM}cvg-{cvg}"
+            store[f"{cvg_key}{HA_DELIM}health"] = value
+            for disk in range(DISK_PER_CVG):
+                store[f"{cvg_key}{HA_DELIM}disk{HA_DELIM}/dev/sd{cvg}{disk}{HA_DELIM}health"] = value
+    return dict(sorted(store.items()))
+
+class BenchSystemHealth(SystemHealth):
+    """
+    SystemHealth reading from the synthetic store instead of consul.
+    """
+
+    def __init__(self, store: dict):
+        self._store = store
+
+    def get_status_raw(self, component: str, component_id: str=None, **kwargs):
+        return dict(self._store)
+
+class LegacySystemHealth(BenchSystemHealth):
+    """
+    Health tree builder scanning all keys with a regex per visited element.
+    """
+
+    def _prepare_status(self, component, component_id: str = None, start_level: int = 1, current_level: int = 1, depth: int = 1, parent: object = None, entries: list = None):
+        if isinstance(parent, StatusOutput):
+            self._status_dict = self.get_status_raw(component)
+        if current_level == depth:
+            if component_id is not None:
+                status_key = self._is_status_present(component, component_id = component_id)
+                if status_key is None:
+                    self._id_not_found = True
+                    return
+                parent.add_health(self._legacy_component_status(component, status_key))
+            else:
+                while True:
+                    status_key = self._is_status_present(component)
+                    if status_key is None:
+                        break
+                    component_status = self._legacy_component_status(component, status_key)
+                    if current_level == start_level:
+                        parent.add_health(component_status)
+                    else:
+                        parent.add_resource(component_status)
+                    del self._status_dict[status_key]
+        else:
+            found_any_components = False
+            while True:
+                status_key = self._is_status_present(component, component_id = component_id)
+                if status_key is None:
+                    break
+                found_any_components = True
+                component_status = self._legacy_component_status(component, status_key)
+                if current_level == start_level:
+                    parent.add_health(component_status)
+                else:
+                    parent.add_resource(component_status)
+                del self._status_dict[status_key]
+                for value in HealthHierarchy.get_next_components(component):
+                    self._prepare_status(value, start_level = start_level, current_level = current_level + 1, depth = depth, parent = component_status)
+                if component_id is not None:
+                    break
+            if not found_any_components:
+                if component_id is not None:
+                    self._id_not_found = True
+                else:
+                    self._partial_status = True
+
+    def _is_status_present(self, component, component_id: str = None) -> str:
+        if component_id is not None:
+            for key in self._status_dict:
+                if re.search(f"{component}{HA_DELIM}{component_id}{HA_DELIM}health", key):
+                    return key
+            return None
+        for key in self._status_dict:
+            if re.search(f"{component}{HA_DELIM}.+{HA_DELIM}health", key):
+                if component == re.split(HA_DELIM, key)[-3]:
+                    return key
+        return None
+
+    def _legacy_component_status(self, component: str, key: str):
+        entry = HealthIndexEntry(component, re.split(HA_DELIM, key)[-2])
+        entry.key = key
+        entry.value = self._status_dict[key]
+        return self._prapare_component_status(component, entry)
+
+def _time_get_status(health: SystemHealth, runs: int) -> float:
+    start = time.perf_counter()
+    for _ in range(runs):
+        health.get_status(depth=0)
+    return (time.perf_counter() - start) / runs
+
+def main(argv: list = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SystemHealth.get_status")
+    parser.add_argument("--keys", type=int, nargs="+", default=[10000, 100000],
+                        help="Number of health keys in the synthetic store")
+    parser.add_argument("--runs", type=int, default=3, help="Runs per implementation")
+    parser.add_argument("--legacy-limit", type=int, default=20000,
+                        help="Skip the regex scan for stores larger than this")
+    args = parser.parse_args(argv)
+
+    Log.init(service_name="bench_system_health", log_path="/tmp", level="ERROR", console_output=False)
+    with open(HIERARCHY_FILE, "r") as fi:
+        HealthHierarchy.SCHEMA = json.load(fi)
+
+    print(f"{'keys':>10} {'indexed (s)':>14} {'regex scan (s)':>16} {'speedup':>10}")
+    for num_keys in args.keys:
+        store = generate_store(num_keys)
+        indexed = _time_get_status(BenchSystemHealth(store), args.runs)
+        if len(store) <= args.legacy_limit:
+            legacy = _time_get_status(LegacySystemHealth(store), 1)
+            print(f"{len(store):>10} {indexed:>14.4f} {legacy:>16.4f} {legacy / indexed:>9.1f}x")
+        else:
+            print(f"{len(store):>10} {indexed:>14.4f} {'skipped':>16} {'-':>10}")
+
+if __name__ == "__main__":
+    main()
@@ -116,18 +116,18 @@ if __name__ == "__main__":
         pod_alert = MockAlert.get_pod_alert()
 
         # Check the alert is a new alert
-        assert monitor._is_published_alert(host_alert) == False, "Failed to publish new alert"
-        assert monitor._is_published_alert(pod_alert) == False, "Failed to publish new alert"
+        assert monitor._published_alerts.is_published(host_alert) == False, "Failed to publish new alert"
+        assert monitor._published_alerts.is_published(pod_alert) == False, "Failed to publish new alert"
 
         # Publish
         mock_producer.publish(host_alert)
         mock_producer.publish(pod_alert)
 
         # Check the alert is already published
-        assert monitor._is_published_alert(host_alert) == True, "Duplicate host alert is published"
-        assert monitor._is_published_alert(pod_alert) == True, "Duplicate pod alert is published"
+        assert monitor._published_alerts.is_published(host_alert) == True, "Duplicate host alert is published"
+        assert monitor._published_alerts.is_published(pod_alert) == True, "Duplicate pod alert is published"
 
-        # Check alert is not getting modified by is_published_alert validation
+        # Check alert is not getting modified by is_published validation
         actual_pod_alert = MockAlert.get_pod_alert()
         assert pod_alert == actual_pod_alert
 
@@ -136,7 +136,7 @@ if __name__ == "__main__":
         mock_producer.publish(pod_alert)
 
         # Check the alert is already published
-        assert monitor._is_published_alert(pod_alert) == False, "Failed to publish new alert"
+        assert monitor._published_alerts.is_published(pod_alert) == False, "Failed to publish new alert"
         print("Successfully verified the alert.")
 
         # we are exiting here so no needs to join the thread
@@ -0,0 +1,226 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+"""
+ ****************************************************************************
+ Description:       In process stand-in for the consul HTTP KV and txn API,
+                    used by unit tests and benchmarks of the consul clients.
+ ****************************************************************************
+"""
+
+import json
+import re
+import threading
+from base64 import b64decode, b64encode
+from collections import Counter
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlparse
+
+TXN_MAX_OPS = 64
+
+def _parse_wait(wait: str) -> float:
+    match = re.fullmatch(r"(\d+)(ms|s|m)?", wait or "")
+    if not match:
+        return 300.0
+    value, unit = int(match.group(1)), match.group(2) or "s"
+    return {"ms": value / 1000, "s": value, "m": value * 60}[unit]
+
+class FakeConsul:
+    """
+    Consul KV stand-in. Keeps keys in memory and serves the subset of the
+    HTTP API used by python-consul: kv get (recurse, keys, separator and
+    blocking index/wait), put (cas), delete (recurse) and txn.
+
+    Example:
+        with FakeConsul() as fake:
+            store = ConsulKvStore("cortx>ha", host="127.0.0.1", port=fake.port)
+    """
+
+    def __init__(self, port: int = 0, delay: float = 0):
+        self.data = {}
+        self.index = 1
+        self.requests = Counter()
+        self.delay = delay
+        self._cond = threading.Condition()
+        self._stopped = False
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            disable_nagle_algorithm = True
+
+            def log_message(self, *args):
+                pass
+
+            def do_GET(self):
+                fake._handle(self, "GET")
+
+            def do_PUT(self):
+                fake._handle(self, "PUT")
+
+            def do_DELETE(self):
+                fake._handle(self, "DELETE")
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), Handler)
+        self._server.daemon_threads = True
+        self.port = self._server.server_address[1]
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        # Blocking queries in progress return, so watches can be stopped without waiting
+        with self._cond:
+            self._stopped = True
+            self._cond.notify_all()
+        self._server.shutdown()
+        self._server.server_close()
+
+    def put(self, key: str, value) -> None:
+        """
+        Write a key directly, as another consul client would.
+        """
+        with self._cond:
+            self._set(key, value)
+            self._cond.notify_all()
+
+    def _set(self, key: str, value) -> None:
+        self.index += 1
+        if isinstance(value, str):
+            value = value.encode()
+        entry = self.data.get(key)
+        create_index = entry["CreateIndex"] if entry else self.index
+        self.data[key] = {"Key": key, "Value": value, "CreateIndex": create_index,
+                          "ModifyIndex": self.index, "LockIndex": 0, "Flags": 0}
+
+    def _entry_json(self, entry: dict) -> dict:
+        value = entry["Value"]
+        return dict(entry, Value=b64encode(value).decode() if value is not None else None)
+
+    def _reply(self, handler, code: int, body, index: int = None) -> None:
+        payload = json.dumps(body).encode() if not isinstance(body, bytes) else body
+        handler.send_response(code)
+        handler.send_header("Content-Type", "application/json")
+        handler.send_header("Content-Length", str(len(payload)))
+        handler.send_header("X-Consul-Index", str(index if index is not None else self.index))
+        handler.send_header("X-Consul-Knownleader", "true")
+        handler.send_header("X-Consul-Lastcontact", "0")
+        handler.end_headers()
+        handler.wfile.write(payload)
+
+    def _handle(self, handler, method: str) -> None:
+        url = urlparse(handler.path)
+        params = {k: v[-1] for k, v in parse_qs(url.query, keep_blank_values=True).items()}
+        length = int(handler.headers.get("Content-Length") or 0)
+        body = handler.rfile.read(length) if length else None
+        if self.delay:
+            threading.Event().wait(self.delay)
+        if url.path.startswith("/v1/kv/"):
+            self.requests[f"{method} kv"] += 1
+            if "recurse" in params:
+                self.requests[f"{method} kv recurse"] += 1
+            key = unquote(url.path[len("/v1/kv/"):])
+            getattr(self, f"_kv_{method.lower()}")(handler, key, params, body)
+        elif url.path == "/v1/txn" and method == "PUT":
+            self.requests["PUT txn"] += 1
+            self._txn(handler, json.loads(body or b"[]"))
+        else:
+            self._reply(handler, 404, b"")
+
+    def _kv_get(self, handler, key: str, params: dict, body) -> None:
+        with self._cond:
+            if "index" in params and int(params["index"]) >= self.index:
+                self._cond.wait_for(lambda: self._stopped or self.index > int(params["index"]),
+                                    timeout=_parse_wait(params.get("wait")))
+            if "recurse" in params or "keys" in params:
+                entries = [self.data[k] for k in sorted(self.data) if k.startswith(key)]
+            else:
+                entries = [self.data[key]] if key in self.data else []
+            if not entries:
+                self._reply(handler, 404, b"")
+                return
+            if "keys" in params:
+                separator = params.get("separator")
+                keys = []
+                for entry in entries:
+                    name = entry["Key"]
+                    if separator and separator in name[len(key):]:
+                        name = name[:len(key) + name[len(key):].index(separator) + len(separator)]
+                    if name not in keys:
+                        keys.append(name)
+                self._reply(handler, 200, keys)
+                return
+            self._reply(handler, 200, [self._entry_json(e) for e in entries])
+
+    def _kv_put(self, handler, key: str, params: dict, body) -> None:
+        with self._cond:
+            if "cas" in params:
+                cas = int(params["cas"])
+                entry = self.data.get(key)
+                if (cas == 0 and entry) or (cas != 0 and (not entry or entry["ModifyIndex"] != cas)):
+                    self._reply(handler, 200, False)
+                    return
+            self._set(key, body)
+            self._cond.notify_all()
+            self._reply(handler, 200, True)
+
+    def _kv_delete(self, handler, key: str, params: dict, body) -> None:
+        with self._cond:
+            keys = [k for k in self.data if k.startswith(key)] if "recurse" in params else [key]
+            for k in keys:
+                self.data.pop(k, None)
+            self.index += 1
+            self._cond.notify_all()
+            self._reply(handler, 200, True)
+
+    def _txn(self, handler, operations: list) -> None:
+        if len(operations) > TXN_MAX_OPS:
+            self._reply(handler, 413, f"Transaction contains too many operations "
+                                      f"({len(operations)} > {TXN_MAX_OPS})".encode())
+            return
+        with self._cond:
+            snapshot, index = dict(self.data), self.index
+            results = []
+            for op_index, operation in enumerate(operations):
+                kv = operation["KV"]
+                key, verb = kv["Key"], kv["Verb"]
+                if verb == "cas":
+                    entry = self.data.get(key)
+                    if (entry["ModifyIndex"] if entry else 0) != int(kv.get("Index", 0)):
+                        self.data, self.index = snapshot, index
+                        self._reply(handler, 409, {"Results": None, "Errors": [
+                            {"OpIndex": op_index, "What": f"failed to set key \"{key}\", index is stale"}]})
+                        return
+                if verb in ("set", "cas"):
+                    value = kv.get("Value")
+                    self._set(key, b64decode(value) if value is not None else None)
+                    results.append({"KV": dict(self._entry_json(self.data[key]), Value=None)})
+                elif verb == "delete":
+                    self.data.pop(key, None)
+                elif verb == "get" and key in self.data:
+                    results.append({"KV": self._entry_json(self.data[key])})
+            self._cond.notify_all()
+            self._reply(handler, 200, {"Results": results, "Errors": None})
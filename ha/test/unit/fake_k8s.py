@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+"""
+ ****************************************************************************
+ Description:       In process stand-in for the kubernetes api server list
+                    and watch of pods and nodes, used by unit tests of the
+                    k8s monitor.
+ ****************************************************************************
+"""
+
+import copy
+import json
+from collections import Counter
+
+class FakeApiException(Exception):
+    """
+    Same as kubernetes.client.rest.ApiException raised for error events.
+    """
+
+    def __init__(self, status: int, reason: str = None):
+        super().__init__(f"({status}) Reason: {reason}")
+        self.status = status
+
+class _Response:
+    def __init__(self, data: dict):
+        self.data = json.dumps(data).encode('utf-8')
+
+class FakeK8sApi:
+    """
+    Keeps objects and the events changing them in memory. Every change gets
+    the next resource version, events older than compact() are forgotten and
+    watch from them fails with 410 Gone.
+
+    Example:
+        api = FakeK8sApi()
+        api.put("cortx-data-0", ready="True", labels={...})
+        informer = Informer(api.list_pod_for_all_namespaces, FakeWatch(api))
+    """
+
+    def __init__(self):
+        self.objects = {}
+        self.events = []
+        self.version = 0
+        self.compacted = 0
+        self.requests = Counter()
+
+    def _add_event(self, event_type: str, raw_object: dict) -> None:
+        self.version += 1
+        raw_object = copy.deepcopy(raw_object)
+        raw_object["metadata"]["resourceVersion"] = str(self.version)
+        if event_type != "DELETED":
+            self.objects[raw_object["metadata"]["name"]] = raw_object
+        self.events.append((self.version, {"type": event_type, "raw_object": raw_object}))
+
+    def put(self, name: str, ready: str = "True", labels: dict = None, namespace: str = "default") -> None:
+        """
+        Create or update a pod.
+        """
+        event_type = "MODIFIED" if name in self.objects else "ADDED"
+        self._add_event(event_type, {
+            "metadata": {"name": name, "namespace": namespace, "labels": labels or {}},
+            "status": {"conditions": [{"type": "Ready", "status": ready}]}
+        })
+
+    def delete(self, name: str) -> None:
+        self._add_event("DELETED", self.objects.pop(name))
+
+    def compact(self) -> None:
+        """
+        Forget all the events till now.
+        """
+        self.compacted = self.version
+
+    @staticmethod
+    def _matches(raw_object: dict, label_selector: str) -> bool:
+        if not label_selector:
+            return True
+        key, _, value = label_selector.partition("=")
+        return raw_object["metadata"]["labels"].get(key) == value
+
+    def list_pod_for_all_namespaces(self, label_selector: str = None, _preload_content: bool = True, **kwargs):
+        self.requests["list"] += 1
+        items = [copy.deepcopy(o) for o in self.objects.values() if FakeK8sApi._matches(o, label_selector)]
+        return _Response({"metadata": {"resourceVersion": str(self.version)}, "items": items})
+
+class FakeWatch:
+    """
+    Same as kubernetes.watch.Watch, a stream returns the events after the
+    resource version and a bookmark, then ends as if timed out.
+    """
+
+    def __init__(self, api: FakeK8sApi, raise_gone: bool = False):
+        """
+        Args:
+            raise_gone (bool): raise FakeApiException for 410 instead of
+                sending the error event, same as the newer clients.
+        """
+        self._api = api
+        self._raise_gone = raise_gone
+        self.calls = []
+
+    def stop(self) -> None:
+        pass
+
+    def stream(self, func, resource_version: str = None, label_selector: str = None,
+               allow_watch_bookmarks: bool = False, **kwargs):
+        self.calls.append(resource_version)
+        self._api.requests["watch"] += 1
+        version = int(resource_version or 0)
+        if version < self._api.compacted:
+            if self._raise_gone:
+                raise FakeApiException(410, "Expired")
+            yield {"type": "ERROR", "raw_object": {"kind": "Status", "code": 410, "reason": "Expired"}}
+            return
+        for event_version, event in self._api.events:
+            if event_version > version and FakeK8sApi._matches(event["raw_object"], label_selector):
+                yield copy.deepcopy(event)
+        if allow_watch_bookmarks:
+            yield {"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": str(self._api.version)}}}
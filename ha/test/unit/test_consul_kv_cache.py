@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import time
+import unittest
+from unittest import mock
+
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.util.consul_kv_cache import ConsulKvCache
+from ha.core.system_health.system_health_manager import SystemHealthManager
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+HEALTH = f"cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}c1"
+
+def _wait_for(condition, timeout: float = 5) -> bool:
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+class TestConsulKvCache(unittest.TestCase):
+    """
+    Unit test for consul kv cache against a fake consul server
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        self.store.set(f"{HEALTH}{HA_DELIM}node{HA_DELIM}n1{HA_DELIM}health", "online")
+        self.store.set(f"{HEALTH}{HA_DELIM}node{HA_DELIM}n2{HA_DELIM}health", "online")
+        self.cache = ConsulKvCache(self.store, f"cortx{HA_DELIM}ha{HA_DELIM}system", wait="1s")
+        self.cache.start()
+
+    def tearDown(self):
+        self.cache.stop()
+        SystemHealthManager.stop_cache()
+        self.consul.stop()
+
+    def test_reads_served_from_memory(self):
+        self.consul.requests.clear()
+        key = f"{HEALTH}{HA_DELIM}node{HA_DELIM}n1{HA_DELIM}health"
+        self.assertEqual(self.cache.get_value(key), "online")
+        self.assertTrue(self.cache.key_exists(f"{HEALTH}{HA_DELIM}node"))
+        self.assertFalse(self.cache.key_exists(f"{HEALTH}{HA_DELIM}node{HA_DELIM}n3"))
+        self.assertEqual(len(self.cache.get(f"{HEALTH}{HA_DELIM}node")), 2)
+        # Only the background blocking query may have hit consul.
+        self.assertEqual(self.consul.requests["PUT kv"], 0)
+        self.assertLessEqual(self.consul.requests["GET kv"], 1)
+
+    def test_write_through(self):
+        key = f"{HEALTH}{HA_DELIM}node{HA_DELIM}n1{HA_DELIM}health"
+        self.consul.requests.clear()
+        self.assertTrue(self.cache.update(key, "offline"))
+        self.assertFalse(self.cache.update(key, "offline"))
+        self.assertEqual(self.consul.requests["PUT kv"], 1)
+        self.assertEqual(self.cache.get_value(key), "offline")
+        self.assertEqual(self.consul.data[f"{PREFIX}{HA_DELIM}{key}"]["Value"], b"offline")
+
+    def test_other_writer_picked_up(self):
+        key = f"{PREFIX}{HA_DELIM}{HEALTH}{HA_DELIM}node{HA_DELIM}n3{HA_DELIM}health"
+        index = self.cache.index
+        self.consul.put(key, "failed")
+        self.assertTrue(_wait_for(lambda: self.cache.get_value(key.replace(f"{PREFIX}{HA_DELIM}", "")) == "failed"))
+        self.assertGreater(self.cache.index, index)
+
+    def test_changes_applied(self):
+        n1 = f"{HEALTH}{HA_DELIM}node{HA_DELIM}n1{HA_DELIM}health"
+        n3 = f"{HEALTH}{HA_DELIM}node{HA_DELIM}n3{HA_DELIM}health"
+        # Watch started from the cache index has no earlier keys, first change has all the values
+        self.consul.put(f"{PREFIX}{HA_DELIM}{n3}", "failed")
+        self.assertTrue(_wait_for(lambda: self.cache.get_value(n3) == "failed"))
+        index = self.cache.index
+        with mock.patch.object(self.cache, "_apply", wraps=self.cache._apply) as apply:
+            self.consul.put(f"{PREFIX}{HA_DELIM}{n3}", "online")
+            self.assertTrue(_wait_for(lambda: self.cache.get_value(n3) == "online"))
+            self.store.delete(n1)
+            self.assertTrue(_wait_for(lambda: self.cache.get_value(n1) is None))
+        # Only the changed keys are applied, cached values are not replaced
+        apply.assert_not_called()
+        self.assertGreater(self.cache.index, index)
+        self.assertEqual(len(self.cache.get(f"{HEALTH}{HA_DELIM}node")), 2)
+
+    def test_health_manager_uses_cache(self):
+        SystemHealthManager.init_cache(self.store)
+        manager = SystemHealthManager(self.store)
+        key = f"{HA_DELIM}{HEALTH}{HA_DELIM}node{HA_DELIM}n2{HA_DELIM}health"
+        self.consul.requests.clear()
+        self.assertEqual(manager.get_key(key), "online")
+        self.assertTrue(manager.key_exists(key))
+        manager.set_key(key, "online")
+        manager.set_key(key, "offline")
+        self.assertEqual(manager.get_key(key), "offline")
+        self.assertEqual(self.consul.requests["PUT kv"], 1)
+        self.assertEqual(sorted(manager.parse_key("node", {"cluster": "c1"}, f"{PREFIX}{HA_DELIM}{HEALTH}")), ["n1", "n2"])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest.mock import patch
+
+from requests.exceptions import ConnectionError
+
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore, ConsulTxnException, CONSUL_TXN_MAX_OPS
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+
+class TestConsulKvCommit(unittest.TestCase):
+    """
+    Unit test for chunked parallel commit against a fake consul server
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port, enable_batch=True)
+
+    def tearDown(self):
+        self.consul.stop()
+
+    def test_commit_in_parallel_chunks(self):
+        for i in range(1000):
+            self.store.set(f"key{i}", f"value{i}")
+        self.consul.requests.clear()
+        results = self.store.commit(parallel=4)
+        self.assertEqual(len(results), -(-1000 // CONSUL_TXN_MAX_OPS))
+        self.assertTrue(all(result.success and result.attempts == 1 for result in results))
+        self.assertEqual(self.consul.requests["PUT txn"], len(results))
+        self.assertEqual(self.consul.data[f"{PREFIX}{HA_DELIM}key999"]["Value"], b"value999")
+        self.assertEqual(self.store.commit(), [])
+
+    def test_cas_conflict_keeps_payload(self):
+        self.consul.put(f"{PREFIX}{HA_DELIM}old", "v1")
+        index = self.consul.data[f"{PREFIX}{HA_DELIM}old"]["ModifyIndex"]
+        self.consul.put(f"{PREFIX}{HA_DELIM}old", "v2")
+        for i in range(CONSUL_TXN_MAX_OPS):
+            self.store.set(f"key{i}", "value")
+        self.store.update("old", "v3")
+        self.store.set("new", "value")
+        with self.assertRaises(ConsulTxnException) as error:
+            self.store.commit(cas={"old": index, "new": 0}, retry_delay=0)
+        failed = [result for result in error.exception.results if not result.success]
+        self.assertEqual(len(failed), 1)
+        self.assertEqual(failed[0].attempts, 1)
+        self.assertEqual(self.consul.data[f"{PREFIX}{HA_DELIM}old"]["Value"], b"v2")
+        # Keys of the failed transaction are left for the next commit.
+        self.assertIn(f"{PREFIX}{HA_DELIM}old", self.store._payload)
+        self.assertEqual(len(self.store._payload), len(failed[0].keys))
+
+    def test_retry_on_connection_error(self):
+        self.store.set("key", "value")
+        with patch.object(self.store._consul.txn, "put", side_effect=ConnectionError("refused")), \
+             self.assertRaises(ConsulTxnException) as error:
+            self.store.commit(retries=2, retry_delay=0)
+        self.assertEqual(error.exception.results[0].attempts, 3)
+        self.assertIn(f"{PREFIX}{HA_DELIM}key", self.store._payload)
+
+if __name__ == "__main__":
+    unittest.main()
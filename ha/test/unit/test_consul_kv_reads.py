@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+NODE = f"cluster{HA_DELIM}c1{HA_DELIM}node{HA_DELIM}n1"
+
+class TestConsulKvReads(unittest.TestCase):
+    """
+    Unit test for exact key, key names and existence reads of consul kv store
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        self.store.set(f"{NODE}{HA_DELIM}health", "online")
+        self.store.set(f"{NODE}1{HA_DELIM}health", "offline")
+        for disk in range(10):
+            self.store.set(f"{NODE}{HA_DELIM}disk{HA_DELIM}d{disk}{HA_DELIM}health", "online")
+        self.consul.requests.clear()
+
+    def tearDown(self):
+        ConsulKvStore._keys.clear()
+        self.consul.stop()
+
+    def test_get_value_reads_exact_key(self):
+        self.assertEqual(self.store.get_value(f"{NODE}{HA_DELIM}health"), "online")
+        self.assertIsNone(self.store.get_value(NODE))
+        self.assertIsNone(self.store.get_value(f"{NODE}{HA_DELIM}heal"))
+        self.assertEqual(self.consul.requests["GET kv recurse"], 0)
+
+    def test_existence(self):
+        self.assertTrue(self.store.key_exists(NODE))
+        self.assertFalse(self.store.exact_key_exists(NODE))
+        self.assertTrue(self.store.exact_key_exists(f"{NODE}{HA_DELIM}health"))
+        self.assertFalse(self.store.key_exists(f"{NODE}{HA_DELIM}cvg"))
+        self.assertEqual(self.consul.requests["GET kv recurse"], 0)
+
+    def test_key_names(self):
+        names = self.store.get_key_names(NODE, separator=HA_DELIM)
+        self.assertEqual(sorted(names), [f"{PREFIX}{HA_DELIM}{NODE}{HA_DELIM}disk{HA_DELIM}",
+                                         f"{PREFIX}{HA_DELIM}{NODE}{HA_DELIM}health"])
+        self.assertEqual(len(self.store.get_key_names(NODE)), 11)
+        self.assertEqual(self.consul.requests["GET kv recurse"], 0)
+
+    def test_batch_payload_merged(self):
+        store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port, enable_batch=True)
+        store.update(f"{NODE}{HA_DELIM}health", "offline")
+        store.update(f"{NODE}{HA_DELIM}cvg{HA_DELIM}c1{HA_DELIM}health", "online")
+        self.assertEqual(store.get_value(f"{NODE}{HA_DELIM}health"), "offline")
+        self.assertTrue(store.exact_key_exists(f"{NODE}{HA_DELIM}cvg{HA_DELIM}c1{HA_DELIM}health"))
+        names = store.get_key_names(NODE, separator=HA_DELIM)
+        self.assertEqual(len(names), 3)
+
+    def test_get_keys_invalidated_on_write(self):
+        prefix = f"{PREFIX}{HA_DELIM}{NODE}{HA_DELIM}disk"
+        self.assertEqual(len(self.store.get_keys(prefix)), 10)
+        self.consul.requests.clear()
+        self.assertEqual(len(self.store.get_keys(prefix)), 10)
+        self.assertEqual(self.consul.requests["GET kv"], 0)
+        self.store.set(f"{NODE}{HA_DELIM}disk{HA_DELIM}d10{HA_DELIM}health", "online")
+        self.assertEqual(len(self.store.get_keys(prefix)), 11)
+        self.store.delete(f"{NODE}{HA_DELIM}disk", recurse=True)
+        self.assertEqual(self.store.get_keys(prefix), [])
+
+    def test_get_keys_ttl(self):
+        prefix = f"{PREFIX}{HA_DELIM}{NODE}1"
+        self.assertEqual(len(self.store.get_keys(prefix, ttl=0)), 1)
+        # Written by another process, picked up after ttl.
+        self.consul.put(f"{prefix}{HA_DELIM}cvg", "c1")
+        self.assertEqual(len(self.store.get_keys(prefix, ttl=0)), 2)
+
+if __name__ == "__main__":
+    unittest.main()
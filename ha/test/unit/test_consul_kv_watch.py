@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import time
+import unittest
+
+from ha import const
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.util.consul_kv_watch import ConsulKvWatch
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+STOP_KEY = f"{PREFIX}{HA_DELIM}{const.CLUSTER_STOP_KEY}"
+
+def _wait_for(condition, timeout: float = 5) -> bool:
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+class TestConsulKvWatch(unittest.TestCase):
+    """
+    Unit test for consul kv watch against a fake consul server
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        self.updates = []
+
+    def tearDown(self):
+        for key in list(self.store._watches):
+            self.store._watches[key].stop()
+        self.consul.stop()
+
+    def _callback(self, index, data):
+        self.updates.append(data)
+
+    def test_initial_value_pushed(self):
+        self.store.set(const.CLUSTER_STOP_KEY, const.CLUSTER_STOP_VAL_ENABLE)
+        self.store.watch(const.CLUSTER_STOP_KEY, self._callback, wait="1s")
+        self.assertEqual(self.updates, [{STOP_KEY: const.CLUSTER_STOP_VAL_ENABLE}])
+
+    def test_changes_pushed(self):
+        self.store.watch(const.CLUSTER_STOP_KEY, self._callback, wait="1s")
+        self.assertEqual(self.updates, [None])
+        self.consul.put(STOP_KEY, const.CLUSTER_STOP_VAL_ENABLE)
+        self.assertTrue(_wait_for(lambda: self.updates[-1] == {STOP_KEY: const.CLUSTER_STOP_VAL_ENABLE}))
+        self.store.delete(const.CLUSTER_STOP_KEY, recurse=True)
+        self.assertTrue(_wait_for(lambda: self.updates[-1] is None))
+
+    def test_shared_watch(self):
+        other = []
+        watch = self.store.watch(const.CLUSTER_STOP_KEY, self._callback, wait="1s")
+        self.assertIs(self.store.watch(const.CLUSTER_STOP_KEY, lambda i, d: other.append(d), wait="1s"), watch)
+        self.assertEqual(other, [None])
+        self.consul.requests.clear()
+        # Idle watch only sends blocking queries, one at a time.
+        time.sleep(0.5)
+        self.assertLessEqual(self.consul.requests["GET kv"], 1)
+        self.store.unwatch(const.CLUSTER_STOP_KEY, self._callback)
+        self.assertIn(self.store._prepare_key(const.CLUSTER_STOP_KEY), self.store._watches)
+        self.consul.put(STOP_KEY, "x")
+        self.assertTrue(_wait_for(lambda: other[-1] == {STOP_KEY: "x"}))
+        self.assertEqual(self.updates, [None])
+
+    def test_unwatch_stops_thread(self):
+        watch = self.store.watch(const.CLUSTER_STOP_KEY, self._callback, wait="1s")
+        # Blocking query is in progress
+        time.sleep(0.2)
+        self.store.unwatch(const.CLUSTER_STOP_KEY, self._callback)
+        self.assertFalse(watch._thread.is_alive())
+        self.consul.put(STOP_KEY, "x")
+        time.sleep(0.2)
+        self.assertEqual(self.updates, [None])
+        self.assertEqual(ConsulKvWatch._get_seconds("500ms"), 0.5)
+        self.assertEqual(ConsulKvWatch._get_seconds("5m"), 300)
+
+    def test_delta_subscriber(self):
+        changes = []
+        other_key = f"{STOP_KEY}_other"
+        self.consul.put(other_key, "1")
+        self.store.watch(const.CLUSTER_STOP_KEY, lambda *change: changes.append(change[1:]), wait="1s", delta=True)
+        # First call has all the values
+        self.assertEqual(changes, [({other_key: "1"}, None)])
+        self.consul.put(STOP_KEY, const.CLUSTER_STOP_VAL_ENABLE)
+        self.assertTrue(_wait_for(lambda: len(changes) == 2))
+        self.assertEqual(changes[-1], ({STOP_KEY: const.CLUSTER_STOP_VAL_ENABLE}, []))
+        self.store.delete(f"{const.CLUSTER_STOP_KEY}_other")
+        self.assertTrue(_wait_for(lambda: len(changes) == 3))
+        self.assertEqual(changes[-1], ({}, [other_key]))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.util.consul_transport import ConsulTransport
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+
+class TestConsulTransport(unittest.TestCase):
+    """
+    Unit test for the consul transport shared by all the stores of a process
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+
+    def tearDown(self):
+        self.consul.stop()
+
+    def test_stores_share_connections(self):
+        store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        other = ConsulKvStore(PREFIX, host="127.0.0.1", port=str(self.consul.port))
+        self.assertIs(store._consul, other._consul)
+        before = ConsulTransport.stats()
+        for i in range(50):
+            store.update(f"key{i}", "value")
+            other.get_value(f"key{i}")
+        stats = ConsulTransport.stats()
+        self.assertEqual(stats["requests"] - before["requests"], 100)
+        # Sequential requests reuse one kept-alive connection.
+        self.assertLessEqual(stats["connections_created"] - before["connections_created"], 1)
+        self.assertGreaterEqual(stats["idle_connections"], 1)
+        self.assertEqual(stats["in_flight"], 0)
+
+    def test_request_timeouts(self):
+        session = ConsulTransport._get_session()
+        connect, read = session._timeout("http://127.0.0.1:8500/v1/kv/key?index=10&wait=32s")
+        self.assertEqual(connect, ConsulTransport._connect_timeout)
+        self.assertEqual(read, ConsulTransport._read_timeout + 34)
+        self.assertEqual(session._timeout("http://127.0.0.1:8500/v1/kv/key")[1], ConsulTransport._read_timeout)
+
+    def test_configure_moves_clients(self):
+        store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        pool_size = ConsulTransport._pool_size
+        ConsulTransport.configure(pool_size=pool_size + 1)
+        self.addCleanup(ConsulTransport.configure, pool_size)
+        self.assertIs(store._consul.http.session, ConsulTransport._session)
+        self.assertEqual(ConsulTransport.stats()["pool_size"], pool_size + 1)
+        store.update("key", "value")
+        self.assertEqual(store.get_value("key"), "value")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import json
+import unittest
+
+from ha import const
+from ha.util.event_codec import decode_event, encode_event
+from ha.util.sharded_dispatcher import resource_key
+
+ALERT = {
+    "header": {"event_id": "16600000001234", "timestamp": "1660000000", "version": "1.0"},
+    "payload": {"source": "monitor", "cluster_id": "", "site_id": "1", "rack_id": "1",
+                "storageset_id": "1", "node_id": "n1", "resource_type": "node",
+                "resource_id": "n1", "resource_status": "online",
+                "specific_info": {"generation_id": "cortx-data-0", "is_status": True}}
+}
+
+class TestEventCodec(unittest.TestCase):
+    """
+    Unit test for the k8s monitor event wire format
+    """
+
+    def test_round_trip(self):
+        message = encode_event(ALERT)
+        self.assertEqual(json.loads(message)[const.EVENT_WIRE_VERSION_KEY], const.EVENT_WIRE_VERSION)
+        self.assertEqual(decode_event(message), ALERT)
+        self.assertEqual(decode_event(message.encode('utf-8')), ALERT)
+        # Canonical, same event gives same message whatever the key order.
+        reordered = dict(reversed(list(ALERT.items())))
+        self.assertEqual(encode_event(reordered), message)
+        self.assertEqual(encode_event(json.dumps(ALERT)), message)
+
+    def test_legacy_messages(self):
+        # Earlier monitor published HealthEvent.json or str(dict)
+        self.assertEqual(decode_event(json.dumps(ALERT)), ALERT)
+        self.assertEqual(decode_event(str(ALERT).encode('utf-8')), ALERT)
+        self.assertIs(decode_event(ALERT), ALERT)
+
+    def test_invalid_messages(self):
+        for message in ("not an event", "[1, 2]", json.dumps({const.EVENT_WIRE_VERSION_KEY: const.EVENT_WIRE_VERSION + 1})):
+            with self.assertRaises(ValueError):
+                decode_event(message)
+
+    def test_resource_key(self):
+        self.assertEqual(resource_key(encode_event(ALERT).encode('utf-8')), ("node", "n1"))
+        self.assertEqual(resource_key(str(ALERT).encode('utf-8')), ("node", "n1"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import json
+import unittest
+from unittest import mock
+
+from ha import const
+from ha.util import event_codec
+from ha.util.message_bus import CONSUMER_STATUS
+from ha.core.event_analyzer.event_envelope import EventEnvelope
+from ha.core.event_analyzer.filter.filter import AlertFilter
+from ha.core.event_analyzer.parser.parser import Parser
+from ha.core.event_analyzer.subscriber import Subscriber
+from ha.core.event_analyzer.watcher.watcher import Watcher
+
+ALERT = {
+    "message": {
+        "sensor_response_type": {
+            "alert_id": "16600000001234",
+            "alert_type": "fault",
+            "info": {"resource_type": "node:fru:disk", "resource_id": "disk-1"},
+            "specific_info": {"serial": "s1"}
+        }
+    }
+}
+
+class _ResourceParser(Parser):
+    def __init__(self):
+        pass
+
+    def parse_event(self, msg):
+        return EventEnvelope.wrap(msg).get("message", "sensor_response_type", "info", "resource_id")
+
+class _Subscriber(Subscriber):
+    def __init__(self):
+        self.events = []
+
+    def process_event(self, event):
+        self.events.append(event)
+
+class TestEventEnvelope(unittest.TestCase):
+    """
+    Unit test for the event decoded once and shared by watcher, filter and parser
+    """
+
+    def test_lazy_read_only_fields(self):
+        with mock.patch.object(event_codec.json, "loads", wraps=json.loads) as loads:
+            event = EventEnvelope(json.dumps(ALERT).encode('utf-8'))
+            self.assertEqual(loads.call_count, 0)
+            self.assertEqual(event.get("message", "sensor_response_type", "alert_type"), "fault")
+            self.assertEqual(event.get("message", "sensor_response_type", "info", "resource_type"), "node:fru:disk")
+            self.assertIsNone(event.get("message", "actuator_response_type"))
+            self.assertEqual(event.get("message", "missing", default="none"), "none")
+            self.assertEqual(loads.call_count, 1)
+        with self.assertRaises(TypeError):
+            event.data["message"] = {}
+        self.assertIs(EventEnvelope.wrap(event), event)
+        self.assertEqual(str(event), json.dumps(ALERT))
+
+    def test_invalid_message(self):
+        event = EventEnvelope(b"not an event")
+        with self.assertRaises(ValueError):
+            event.get("message")
+
+    def test_watcher_decodes_once(self):
+        event_filter = AlertFilter.__new__(AlertFilter)
+        event_filter.filter_type = const.INCLUSION
+        event_filter.resource_types_list = ["node:fru:disk"]
+        watcher = Watcher.__new__(Watcher)
+        watcher.filter, watcher.parser, watcher.subscriber = event_filter, _ResourceParser(), _Subscriber()
+        with mock.patch.object(event_codec.json, "loads", wraps=json.loads) as loads:
+            status = watcher.process_message(json.dumps(ALERT).encode('utf-8'))
+        self.assertEqual(status, CONSUMER_STATUS.SUCCESS)
+        self.assertEqual(watcher.subscriber.events, ["disk-1"])
+        self.assertEqual(loads.call_count, 1)
+        # String entry points are kept
+        self.assertTrue(event_filter.filter_event(json.dumps(ALERT)))
+        self.assertEqual(watcher.parser.parse_event(json.dumps(ALERT)), "disk-1")
+
+if __name__ == "__main__":
+    unittest.main()
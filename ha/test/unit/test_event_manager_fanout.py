@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import time
+import unittest
+from unittest import mock
+
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.util.message_bus import MessageBus
+from ha.core.config.config_manager import ConfigManager
+from ha.core.event_manager.event_manager import EventManager
+from ha.core.event_manager.subscribe_event import SubscribeEvent
+from ha.test.unit.fake_consul import FakeConsul
+from cortx.utils.event_framework.event import EventAttr
+from cortx.utils.event_framework.health import HealthAttr
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+
+class _ActionEvent(dict):
+    """
+    Action event stand-in, same access as the event framework HealthEvent.
+    """
+
+    def __init__(self, resource_type: str, state: str, functional_type: str = None):
+        specific_info = {"functional_type": functional_type} if functional_type else {}
+        super().__init__({EventAttr.EVENT_PAYLOAD.value: {
+            HealthAttr.RESOURCE_TYPE.value: resource_type,
+            HealthAttr.RESOURCE_STATUS.value: state,
+            HealthAttr.SOURCE.value: "monitor",
+            HealthAttr.SPECIFIC_INFO.value: specific_info}})
+        self.resource_type = resource_type
+
+    @property
+    def json(self):
+        return json.dumps({"resource_type": self.resource_type})
+
+class TestEventManagerFanout(unittest.TestCase):
+    """
+    Unit test for EventManager.publish using the cached fan-out table
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        self.producers = {}
+        def get_producer(producer_id, message_type, *args, **kwargs):
+            self.producers[producer_id] = self.producers.get(producer_id, mock.MagicMock())
+            return self.producers[producer_id]
+        patchers = [mock.patch.object(ConfigManager, "get_confstore", return_value=self.store),
+                    mock.patch.object(MessageBus, "init"),
+                    mock.patch.object(MessageBus, "register"),
+                    mock.patch.object(MessageBus, "deregister"),
+                    mock.patch.object(MessageBus, "get_producer", side_effect=get_producer)]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        EventManager._EventManager__instance = None
+        self.event_manager = EventManager.get_instance(default_log_enable=False)
+        self.event_manager.subscribe("hare", [SubscribeEvent("node", ["failed"], ["server"])])
+
+    def tearDown(self):
+        EventManager._EventManager__instance = None
+        self.consul.stop()
+        for watch in self.store._watches.values():
+            watch.stop()
+
+    def test_publish_without_consul_reads(self):
+        self.event_manager.publish(_ActionEvent("node", "failed", "server"))
+        self.consul.requests.clear()
+        for _ in range(50):
+            self.event_manager.publish(_ActionEvent("node", "failed", "server"))
+            self.event_manager.publish(_ActionEvent("node", "online", "server"))
+        self.assertLessEqual(self.consul.requests["GET kv"], 1)
+        self.assertEqual(MessageBus.get_producer.call_count, 1)
+        self.assertEqual(self.producers["ha_event_manager_hare"].publish.call_count, 51)
+
+    def test_subscription_changes(self):
+        self.event_manager.publish(_ActionEvent("node", "failed", "server"))
+        self.event_manager.subscribe("motr", [SubscribeEvent("node", ["failed"], ["server"])])
+        self.event_manager.publish(_ActionEvent("node", "failed", "server"))
+        self.assertEqual(self.producers["ha_event_manager_motr"].publish.call_count, 1)
+        self.event_manager.unsubscribe("motr", [SubscribeEvent("node", ["failed"], ["server"])])
+        self.event_manager.publish(_ActionEvent("node", "failed", "server"))
+        self.assertEqual(self.producers["ha_event_manager_motr"].publish.call_count, 1)
+        self.assertEqual(self.producers["ha_event_manager_hare"].publish.call_count, 3)
+        # Subscription by another process is picked up by the watch
+        self.consul.put(f"{PREFIX}{HA_DELIM}message_type{HA_DELIM}s3", "ha_event_s3")
+        self.consul.put(f"{PREFIX}{HA_DELIM}events{HA_DELIM}node{HA_DELIM}server{HA_DELIM}failed",
+                        json.dumps(["hare", "s3"]))
+        end = time.time() + 5
+        while "ha_event_manager_s3" not in self.producers and time.time() < end:
+            self.event_manager.publish(_ActionEvent("node", "failed", "server"))
+            time.sleep(0.05)
+        self.assertIn("ha_event_manager_s3", self.producers)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import os
+import pathlib
+import unittest
+
+from ha import const
+from ha.const import HA_DELIM
+from ha.core.system_health.health_evaluators.element_health_evaluator import ElementHealthEvaluator
+from ha.core.system_health.system_health_hierarchy import HealthHierarchy
+from ha.core.system_health.system_health_metadata import SystemHealthComponents
+
+HIERARCHY_FILE = os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..',
+                              'conf', 'etc', 'v2', 'system_health_hierarchy.json')
+CLUSTER = f"{HA_DELIM}cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}c1"
+
+class TestHealthKeySchema(unittest.TestCase):
+    """
+    Unit test for compiled health key templates and component lookups
+    """
+
+    def test_prepare_key(self):
+        disk = ElementHealthEvaluator.prepare_key("disk", comp_id="/dev/sda", cluster_id="c1", site_id="1",
+                                                  rack_id="1", node_id="n1", cvg_id="cvg-1")
+        self.assertEqual(disk, f"{CLUSTER}{HA_DELIM}site{HA_DELIM}1{HA_DELIM}rack{HA_DELIM}1{HA_DELIM}node{HA_DELIM}n1"
+                               f"{HA_DELIM}cvg{HA_DELIM}cvg-1{HA_DELIM}disk{HA_DELIM}/dev/sda{HA_DELIM}health")
+        # Key till the first missing argument.
+        self.assertEqual(ElementHealthEvaluator.prepare_key("node", cluster_id="c1", rack_id="1"),
+                         f"{CLUSTER}{HA_DELIM}site{HA_DELIM}")
+        hw = ElementHealthEvaluator.prepare_key(const.COMPONENTS.SERVER_HARDWARE.value, comp_type="fan", comp_id="f1",
+                                                cluster_id="c1", site_id="1", rack_id="1", node_id="n1", server_id="n1")
+        self.assertTrue(hw.endswith(f"server{HA_DELIM}n1{HA_DELIM}hw{HA_DELIM}fan{HA_DELIM}f1{HA_DELIM}health"))
+        self.assertEqual(ElementHealthEvaluator.prepare_key(const.COMPONENTS.NODE_MAP.value, node_id="n1"),
+                         f"{HA_DELIM}cortx{HA_DELIM}ha{HA_DELIM}system{HA_DELIM}cluster{HA_DELIM}node_map{HA_DELIM}n1")
+
+    def test_get_component(self):
+        self.assertEqual(SystemHealthComponents.get_component("node:fru:disk"), const.COMPONENTS.SERVER_HARDWARE.value)
+        self.assertEqual(SystemHealthComponents.get_component("node:fru:disk"), const.COMPONENTS.SERVER_HARDWARE.value)
+        self.assertEqual(SystemHealthComponents.get_component("cvg"), const.COMPONENTS.CVG.value)
+        self.assertIn("node:fru:disk", SystemHealthComponents._resource_components)
+
+    def test_hierarchy_index(self):
+        self.addCleanup(setattr, HealthHierarchy, "SCHEMA", HealthHierarchy.SCHEMA)
+        with open(HIERARCHY_FILE, "r") as fi:
+            HealthHierarchy.SCHEMA = json.load(fi)
+        self.assertEqual(HealthHierarchy.get_component_level("cluster"), 1)
+        self.assertEqual(HealthHierarchy.get_component_level("disk"), 6)
+        self.assertEqual(HealthHierarchy.get_next_components("node"), ["cvg"])
+        self.assertEqual(HealthHierarchy.get_next_components("disk"), [])
+        with self.assertRaises(Exception):
+            HealthHierarchy.get_component_level("fan")
+        # Replaced schema is indexed again.
+        HealthHierarchy.SCHEMA = {"components": ["cluster", "node"]}
+        self.assertEqual(HealthHierarchy.get_next_components("cluster"), ["node"])
+
+if __name__ == "__main__":
+    unittest.main()
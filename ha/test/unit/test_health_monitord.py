@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import threading
+import unittest
+from unittest import mock
+
+from ha.util.message_bus import CONSUMER_STATUS
+from ha.core.health_monitor.health_monitord import HealthMonitorService
+
+WORKERS = 4
+
+class TestHealthMonitorService(unittest.TestCase):
+    """
+    Unit test for the dispatcher workers of the health monitor
+    """
+
+    def setUp(self):
+        conf = {"workers": WORKERS, "batch_size": 1}
+        self.managers = []
+        patches = {
+            "signal": mock.Mock(),
+            "ConfigManager": mock.Mock(),
+            "MessageBus": mock.Mock(),
+            "HealthEvent": mock.Mock(),
+            "MonitorRulesManager": mock.Mock(side_effect=self._create_manager),
+            "Conf": mock.Mock(**{"get.side_effect": lambda index, key, default=None:
+                                 conf.get(key.split(">")[-1], default)}),
+        }
+        for name, value in patches.items():
+            patcher = mock.patch(f"ha.core.health_monitor.health_monitord.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.addCleanup(setattr, HealthMonitorService, "_HealthMonitorService__instance", None)
+        self.service = HealthMonitorService.get_instance()
+        self.addCleanup(self.service._dispatcher.stop)
+
+    def _create_manager(self):
+        manager = mock.Mock(threads=set())
+        manager.evaluate.side_effect = lambda event: manager.threads.add(threading.current_thread().name)
+        self.managers.append(manager)
+        return manager
+
+    def test_rules_manager_per_worker(self):
+        # One for the consumer callback and one for each worker
+        self.assertEqual(len(self.managers), WORKERS + 1)
+        events = [f'{{"resource_type": "node", "resource_id": "n{i}"}}'.encode() for i in range(50)]
+        self.assertEqual(self.service._dispatcher.dispatch(events), CONSUMER_STATUS.SUCCESS)
+        self.assertEqual(sum(manager.evaluate.call_count for manager in self.managers), len(events))
+        # Rules manager of a worker is used only by its thread
+        used = [manager for manager in self.managers if manager.threads]
+        self.assertGreater(len(used), 1)
+        for manager in used:
+            self.assertEqual(len(manager.threads), 1)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import threading
+import time
+import unittest
+
+from ha.monitor.k8s.alert_queue import AlertQueue
+from ha.monitor.k8s.const import AlertQueueConst
+
+class TestAlertQueue(unittest.TestCase):
+    """
+    Unit test for the queue between k8s watch reader and publisher
+    """
+
+    def _drain(self, queue: AlertQueue) -> list:
+        queue.close()
+        alerts = []
+        while True:
+            alert = queue.get()
+            if alert is None:
+                return alerts
+            alerts.append(alert)
+
+    def test_coalesce(self):
+        queue = AlertQueue(size=2, policy=AlertQueueConst.COALESCE)
+        queue.put(("node", "n1"), "n1-offline")
+        queue.put(("node", "n2"), "n2-offline")
+        queue.put(("node", "n1"), "n1-online")
+        stats = queue.stats()
+        self.assertEqual((stats["depth"], stats["coalesced"]), (2, 1))
+        # Latest alert of a resource keeps the place of the first one
+        self.assertEqual(self._drain(queue), ["n1-online", "n2-offline"])
+
+    def test_coalesce_keeps_transitions_when_not_full(self):
+        queue = AlertQueue(size=1000, policy=AlertQueueConst.COALESCE)
+        queue.put(("node", "n1"), "n1-offline")
+        queue.put(("node", "n1"), "n1-online")
+        self.assertEqual(queue.stats()["coalesced"], 0)
+        self.assertEqual(self._drain(queue), ["n1-offline", "n1-online"])
+
+    def test_drop_oldest(self):
+        queue = AlertQueue(size=3, policy=AlertQueueConst.DROP_OLDEST)
+        for i in range(5):
+            queue.put(("node", "n1"), i)
+        self.assertEqual(queue.stats()["dropped"], 2)
+        self.assertEqual(self._drain(queue), [2, 3, 4])
+
+    def test_block(self):
+        queue = AlertQueue(size=1, policy=AlertQueueConst.BLOCK)
+        queue.put(("node", "n1"), 1)
+        writer = threading.Thread(target=queue.put, args=(("node", "n1"), 2))
+        writer.start()
+        writer.join(0.1)
+        self.assertTrue(writer.is_alive())
+        time.sleep(0.05)
+        self.assertEqual(queue.get(), 1)
+        writer.join(5)
+        self.assertFalse(writer.is_alive())
+        self.assertEqual(queue.get(), 2)
+        stats = queue.stats()
+        self.assertEqual(stats["max_depth"], 1)
+        self.assertGreaterEqual(stats["max_lag"], 0.1)
+
+    def test_slow_publisher_does_not_block_reader(self):
+        queue = AlertQueue(size=10, policy=AlertQueueConst.COALESCE)
+        published = []
+        def publish():
+            while True:
+                alert = queue.get()
+                if alert is None:
+                    return
+                time.sleep(0.01)
+                published.append(alert)
+        publisher = threading.Thread(target=publish)
+        publisher.start()
+        start = time.monotonic()
+        for i in range(1000):
+            queue.put(("node", f"n{i % 5}"), (i % 5, i))
+        self.assertLess(time.monotonic() - start, 1)
+        queue.close()
+        publisher.join(5)
+        # Last alert of every resource is published
+        last = {}
+        for resource, i in published:
+            last[resource] = i
+        self.assertEqual(last, {r: 995 + r for r in range(5)})
+
+    def test_get_timeout_and_policy(self):
+        self.assertIsNone(AlertQueue().get(timeout=0.01))
+        with self.assertRaises(ValueError):
+            AlertQueue(policy="unknown")
+
+if __name__ == "__main__":
+    unittest.main()
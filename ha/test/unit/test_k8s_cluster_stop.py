@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import time
+import unittest
+from unittest import mock
+
+from ha import const
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.monitor.k8s.object_monitor import ObjectMonitor
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+STOP_KEY = f"{PREFIX}{HA_DELIM}{const.CLUSTER_STOP_KEY}"
+
+def _wait_for(condition, timeout: float = 5) -> bool:
+    end = time.time() + timeout
+    while time.time() < end:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return False
+
+class TestK8sClusterStop(unittest.TestCase):
+    """
+    Unit test for cluster stop key watched by the k8s object monitor
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        patcher = mock.patch("ha.monitor.k8s.object_monitor.ConfigManager")
+        patcher.start().get_confstore.return_value = self.store
+        self.addCleanup(patcher.stop)
+        self.monitor = ObjectMonitor(mock.Mock(), "pod", watch_args={})
+
+    def tearDown(self):
+        self.consul.stop()
+        for watch in self.store._watches.values():
+            watch.stop()
+
+    def test_exact_key(self):
+        # Keys sharing the prefix of cluster stop key are ignored
+        self.consul.put(f"{STOP_KEY}_old", const.CLUSTER_STOP_VAL_ENABLE)
+        time.sleep(0.2)
+        self.assertTrue(self.monitor.is_publish_enable())
+        self.consul.put(STOP_KEY, const.CLUSTER_STOP_VAL_ENABLE)
+        self.assertTrue(_wait_for(lambda: not self.monitor.is_publish_enable()))
+
+if __name__ == "__main__":
+    unittest.main()
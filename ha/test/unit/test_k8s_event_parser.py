@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import threading
+import unittest
+
+from ha.monitor.k8s.alert import K8sAlert
+from ha.monitor.k8s.const import AlertStates, K8SEventsConst
+from ha.monitor.k8s.parser import EventParser, ObjectParser, ReadyStates
+
+def _event(event_type: str, name: str, ready: str = "True", labels: dict = None) -> dict:
+    return {"type": event_type, "raw_object": {
+        "metadata": {"name": name, "labels": labels or {}},
+        "status": {"conditions": [{"type": "Initialized", "status": "True"}, {"type": "Ready", "status": ready}]}}}
+
+class TestK8sEventParser(unittest.TestCase):
+    """
+    Unit test for k8s node and pod event parsers
+    """
+
+    def test_ready_status(self):
+        self.assertTrue(ObjectParser.get_ready_status(_event("ADDED", "n1")["raw_object"]))
+        self.assertFalse(ObjectParser.get_ready_status(_event("ADDED", "n1", ready="false")["raw_object"]))
+        self.assertIsNone(ObjectParser.get_ready_status({"metadata": {}}))
+        self.assertIsNone(ObjectParser.get_ready_status({"status": {"conditions": None}}))
+        self.assertIsNone(ObjectParser.get_ready_status({"status": {"conditions": [{"type": "Ready"}]}}))
+
+    def test_node_transitions(self):
+        states = ReadyStates()
+        self.assertEqual(EventParser.parse("node", _event("ADDED", "n1"), states, None),
+                         K8sAlert("host", "n1", AlertStates.ONLINE))
+        self.assertIsNone(EventParser.parse("node", _event("MODIFIED", "n1"), states, None))
+        self.assertEqual(EventParser.parse("node", _event("MODIFIED", "n1", "False"), states, None).status,
+                         AlertStates.OFFLINE)
+        # State of unknown object is not added on MODIFIED
+        self.assertIsNone(EventParser.parse("node", _event("MODIFIED", "n2"), states, None))
+        self.assertNotIn("n2", states)
+        self.assertIsNone(EventParser.parse("node", _event("DELETED", "n1", "False"), states, None))
+        self.assertEqual(len(states), 0)
+
+    def test_pod_resource_id(self):
+        states = ReadyStates()
+        labels = {K8SEventsConst.LABEL_PODNAME: "cortx-data-0"}
+        alert = EventParser.parse("pod", _event("ADDED", "cortx-data-0", labels=labels), states, {"cortx-data-0": "m1"})
+        self.assertEqual(alert, K8sAlert("node", "m1", AlertStates.ONLINE, "cortx-data-0"))
+        self.assertTrue(alert._replace(is_status=True).is_status)
+        self.assertIsNone(EventParser.parse("pod", _event("ADDED", "other-0", labels={}), states, {"cortx-data-0": "m1"}))
+
+    def test_concurrent_parse(self):
+        states = ReadyStates()
+        errors = []
+        def parse(thread: int):
+            for i in range(200):
+                name = f"pod-{thread}-{i}"
+                labels = {K8SEventsConst.LABEL_PODNAME: name}
+                id_map = {name: f"r-{thread}-{i}"}
+                expected = [AlertStates.ONLINE, AlertStates.OFFLINE, AlertStates.ONLINE]
+                events = [_event("ADDED", name, "True", labels), _event("MODIFIED", name, "False", labels),
+                          _event("MODIFIED", name, "True", labels)]
+                for an_event, status in zip(events, expected):
+                    alert = EventParser.parse("pod", an_event, states, id_map)
+                    if alert != K8sAlert("node", f"r-{thread}-{i}", status, name):
+                        errors.append((thread, i, alert))
+                if i % 2:
+                    alert = EventParser.parse("pod", _event("DELETED", name, "True", labels), states, id_map)
+                    if alert is not None:
+                        errors.append((thread, i, alert))
+        def run(thread: int):
+            # Exception in a thread is not seen by the test, it is collected as error
+            try:
+                parse(thread)
+            except Exception as e:
+                errors.append((thread, e))
+        threads = [threading.Thread(target=run, args=(t,)) for t in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(30)
+        self.assertFalse([thread for thread in threads if thread.is_alive()])
+        self.assertEqual(errors, [])
+        self.assertEqual(len(states), 8 * 100)
+
+if __name__ == "__main__":
+    unittest.main()
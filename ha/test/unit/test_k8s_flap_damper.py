@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import unittest
+
+from ha.monitor.k8s.flap_damper import FlapDamper
+
+def _alert(status: str, resource_id: str = "n1") -> dict:
+    return {"header": {}, "payload": {"resource_type": "node", "resource_id": resource_id,
+                                      "resource_status": status, "specific_info": {}}}
+
+def _statuses(alerts: list) -> list:
+    return [(a["payload"]["resource_id"], a["payload"]["resource_status"],
+             a["payload"]["specific_info"].get("flap_count")) for a in alerts]
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestFlapDamper(unittest.TestCase):
+    """
+    Unit test for flap damping of k8s monitor alerts
+    """
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.damper = FlapDamper(window=10, max_hold_down=40, clock=self.clock)
+
+    def test_first_failure_not_delayed(self):
+        self.assertEqual(_statuses(self.damper.offer(_alert("offline"))), [("n1", "offline", None)])
+        # Other resources are not damped
+        self.assertEqual(len(self.damper.offer(_alert("offline", "n2"))), 1)
+
+    def test_crash_loop_collapsed(self):
+        self.damper.offer(_alert("offline"))
+        for status in ("online", "offline", "online", "offline"):
+            self.clock.now += 1
+            self.assertEqual(self.damper.offer(_alert(status)), [])
+        self.assertEqual(self.damper.poll(), [])
+        self.clock.now = 10
+        # Back to the status published, nothing to publish
+        self.assertEqual(self.damper.poll(), [])
+        self.damper.offer(_alert("online"))
+        self.damper.offer(_alert("offline"))
+        self.damper.offer(_alert("online"))
+        # Window is doubled for flapping resource
+        self.clock.now = 29
+        self.assertEqual(self.damper.poll(), [])
+        self.clock.now = 30
+        self.assertEqual(_statuses(self.damper.poll()), [("n1", "online", 3)])
+        self.assertEqual(self.damper.stats()["damped"], 7)
+
+    def test_hold_down_reset(self):
+        self.damper.offer(_alert("offline"))
+        self.damper.offer(_alert("online"))
+        # Window is 20, 40 and capped to 40
+        for now in (10, 30, 70):
+            self.clock.now = now
+            self.damper.offer(_alert("offline"))
+            self.damper.offer(_alert("online"))
+            self.damper.poll()
+        self.clock.now = 109
+        self.assertEqual(self.damper.offer(_alert("offline")), [])
+        self.damper.offer(_alert("online"))
+        self.clock.now = 110
+        self.assertEqual(self.damper.poll(), [])
+        # Window without alerts
+        self.clock.now = 150
+        self.assertEqual(self.damper.poll(), [])
+        self.assertEqual(self.damper.stats()["resources"], 0)
+        # Stable again, published right away
+        self.assertEqual(len(self.damper.offer(_alert("offline"))), 1)
+
+    def test_flush(self):
+        self.damper.offer(_alert("offline"))
+        self.damper.offer(_alert("online"))
+        self.assertEqual(_statuses(self.damper.poll(flush=True)), [("n1", "online", 1)])
+
+if __name__ == "__main__":
+    unittest.main()
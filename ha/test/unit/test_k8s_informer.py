@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import unittest
+
+from ha.monitor.k8s.informer import Informer
+from ha.test.unit.fake_k8s import FakeK8sApi, FakeWatch
+
+LABELS = {"app": "cortx"}
+
+def _events(informer: Informer) -> list:
+    return [(event["type"], event["raw_object"]["metadata"]["name"]) for event in informer.stream()]
+
+class TestInformer(unittest.TestCase):
+    """
+    Unit test for k8s list and watch against a fake api server
+    """
+
+    def setUp(self):
+        self.api = FakeK8sApi()
+        for i in range(3):
+            self.api.put(f"data-{i}", labels=LABELS)
+        self.api.put("other", labels={"app": "other"})
+        self.watch = FakeWatch(self.api)
+        self.informer = Informer(self.api.list_pod_for_all_namespaces, self.watch,
+                                 label_selector="app=cortx", timeout_seconds=5)
+
+    def test_list_then_watch(self):
+        self.assertEqual(_events(self.informer), [("ADDED", "data-0"), ("ADDED", "data-1"), ("ADDED", "data-2")])
+        self.assertEqual(self.watch.calls, ["4"])
+        self.api.put("data-1", ready="False", labels=LABELS)
+        self.api.delete("data-2")
+        self.assertEqual(_events(self.informer), [("MODIFIED", "data-1"), ("DELETED", "data-2")])
+        # Nothing changed, watch resumes from the bookmark without listing again
+        self.api.put("other", ready="False", labels={"app": "other"})
+        self.assertEqual(_events(self.informer), [])
+        self.assertEqual(self.informer.resource_version, "7")
+        self.assertEqual(_events(self.informer), [])
+        self.assertEqual(self.api.requests["list"], 1)
+        self.assertEqual(self.watch.calls, ["4", "4", "6", "7"])
+        self.assertEqual(sorted(o["metadata"]["name"] for o in self.informer.list()), ["data-0", "data-1"])
+        status = self.informer.get("default/data-1")["status"]["conditions"][0]["status"]
+        self.assertEqual(status, "False")
+
+    def _check_relist(self, informer: Informer):
+        _events(informer)
+        self.api.put("data-0", ready="False", labels=LABELS)
+        self.api.delete("data-1")
+        self.api.put("data-3", labels=LABELS)
+        self.api.compact()
+        # Watch from a compacted version, objects are listed and diffed with the store
+        self.assertEqual(_events(informer), [])
+        self.assertIsNone(informer.resource_version)
+        self.assertEqual(sorted(_events(informer)),
+                         [("ADDED", "data-3"), ("DELETED", "data-1"), ("MODIFIED", "data-0")])
+        self.assertEqual(self.api.requests["list"], 2)
+
+    def test_relist_on_gone(self):
+        self._check_relist(self.informer)
+
+    def test_relist_on_gone_exception(self):
+        informer = Informer(self.api.list_pod_for_all_namespaces, FakeWatch(self.api, raise_gone=True),
+                            label_selector="app=cortx")
+        self._check_relist(informer)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import unittest
+from unittest import mock
+
+from ha.monitor.k8s.const import K8SEventsConst
+from ha.monitor.k8s.label_handler import LabelHandler
+from ha.monitor.k8s.object_monitor import ObjectMonitor
+
+MACHINE_IDS = {"m1": "r1", "m2": "r2"}
+POD_NAMES = {"cortx-data-0": "r1", "cortx-data-1": "r2"}
+
+class TestLabelHandler(unittest.TestCase):
+    """
+    Unit test for label dispatch of the shared pod watch
+    """
+
+    def setUp(self):
+        self.machine_ids = LabelHandler(K8SEventsConst.LABEL_MACHINEID, MACHINE_IDS)
+        self.pod_names = LabelHandler(K8SEventsConst.LABEL_PODNAME, POD_NAMES)
+        self.handlers = [self.machine_ids, self.pod_names]
+
+    def test_dispatch(self):
+        get_handler = LabelHandler.get_handler
+        self.assertIs(get_handler(self.handlers, {K8SEventsConst.LABEL_MACHINEID: "m2"}), self.machine_ids)
+        self.assertIs(get_handler(self.handlers, {K8SEventsConst.LABEL_PODNAME: "cortx-data-0"}), self.pod_names)
+        self.assertIsNone(get_handler(self.handlers, {K8SEventsConst.LABEL_PODNAME: "cortx-control-0"}))
+        self.assertIsNone(get_handler(self.handlers, None))
+        # Handler without label, ex. node monitor, handles every object
+        handler = LabelHandler()
+        self.assertIs(get_handler([handler], {}), handler)
+        # Handlers keep their own state
+        self.assertIsNot(self.machine_ids.object_state, self.pod_names.object_state)
+
+    def test_selector(self):
+        self.assertEqual(self.pod_names.get_selector(),
+                         f"{K8SEventsConst.LABEL_PODNAME} in (cortx-data-0, cortx-data-1)")
+        self.assertEqual(self.machine_ids.get_selector(), f"{K8SEventsConst.LABEL_MACHINEID} in (m1, m2)")
+        self.assertIsNone(LabelHandler().get_selector())
+        # Long selector is replaced by label exists
+        pods = LabelHandler(K8SEventsConst.LABEL_PODNAME, {f"cortx-data-{i}": i for i in range(1000)})
+        self.assertEqual(pods.get_selector(max_length=4096), K8SEventsConst.LABEL_PODNAME)
+
+    @mock.patch("ha.monitor.k8s.object_monitor.ConfigManager")
+    def test_monitor_shares_handlers(self, _config_manager):
+        monitor = ObjectMonitor(mock.Mock(), "pod", watch_args={}, label_handlers=[self.pod_names])
+        # Handlers hold locked state, they are used as given and not copied
+        self.assertIs(monitor._label_handlers[0], self.pod_names)
+
+if __name__ == "__main__":
+    unittest.main()
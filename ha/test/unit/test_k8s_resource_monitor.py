@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+from unittest import mock
+
+from ha.monitor.k8s.const import K8SClientConst, K8SEventsConst
+from ha.monitor.k8s.monitor import ResourceMonitor
+
+MACHINE_IDS = {"m1": "r1", "m2": "r2"}
+POD_NAMES = {"cortx-data-0": "r1", "cortx-data-1": "r2"}
+
+class TestResourceMonitor(unittest.TestCase):
+    """
+    Unit test for the monitors started by the k8s resource monitor
+    """
+
+    def setUp(self):
+        self.k8s_client = mock.Mock()
+        patches = {
+            "signal": mock.Mock(),
+            "ConfigManager": mock.Mock(),
+            "MessageBus": mock.Mock(),
+            "config": mock.Mock(),
+            "client": mock.Mock(**{"CoreV1Api.return_value": self.k8s_client}),
+            "Conf": mock.Mock(**{"get.side_effect": lambda index, key, default=None: default}),
+            "ConftStoreSearch": mock.Mock(**{"return_value.get_cluster_cardinality.return_value":
+                                             (2, MACHINE_IDS, POD_NAMES)}),
+        }
+        for name, value in patches.items():
+            patcher = mock.patch(f"ha.monitor.k8s.monitor.{name}", value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = mock.patch("ha.monitor.k8s.monitor.ObjectMonitor")
+        self.object_monitor = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _list_pods(self, label: str):
+        def list_pods(label_selector: str, limit: int):
+            return mock.Mock(items=[mock.Mock()] if label_selector.startswith(label) else [])
+        return list_pods
+
+    def _get_pod_monitors(self) -> list:
+        return [call for call in self.object_monitor.call_args_list if call.args[1] == K8SClientConst.POD]
+
+    def test_one_pod_watch(self):
+        # Both maps are stored in confstore, the pods carry only the pod name label
+        self.k8s_client.list_pod_for_all_namespaces.side_effect = self._list_pods(K8SEventsConst.LABEL_PODNAME)
+        ResourceMonitor()
+        pod_monitors = self._get_pod_monitors()
+        self.assertEqual(len(pod_monitors), 1)
+        handlers = pod_monitors[0].kwargs["label_handlers"]
+        self.assertEqual([handler.label for handler in handlers], [K8SEventsConst.LABEL_PODNAME])
+        self.assertTrue(pod_monitors[0].kwargs["watch_args"][K8SClientConst.LABEL_SELECTOR]
+                        .startswith(K8SEventsConst.LABEL_PODNAME))
+
+    def test_no_labeled_pods(self):
+        self.k8s_client.list_pod_for_all_namespaces.return_value = mock.Mock(items=[])
+        ResourceMonitor()
+        pod_monitors = self._get_pod_monitors()
+        self.assertEqual(len(pod_monitors), 1)
+        self.assertEqual(pod_monitors[0].kwargs["label_handlers"][0].label, K8SEventsConst.LABEL_MACHINEID)
+
+if __name__ == "__main__":
+    unittest.main()
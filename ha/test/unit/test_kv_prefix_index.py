@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import random
+import unittest
+
+from ha.const import HA_DELIM
+from ha.util.kv_prefix_index import KvPrefixIndex
+
+def _key(*parts) -> str:
+    return HA_DELIM.join(parts)
+
+class TestKvPrefixIndex(unittest.TestCase):
+    """
+    Unit test for prefix lookups of KvPrefixIndex against str.startswith
+    """
+
+    def setUp(self):
+        self.index = KvPrefixIndex()
+        self.data = {}
+        for node in ("n1", "n10", "n2"):
+            for disk in ("d1", "d2"):
+                key = _key("cortx", "node", node, "disk", disk, "health")
+                self.index[key] = self.data[key] = f"{node}-{disk}"
+            key = _key("cortx", "node", node)
+            self.index[key] = self.data[key] = node
+
+    def _expected(self, prefix: str) -> list:
+        return sorted(key for key in self.data if key.startswith(prefix))
+
+    def test_same_as_startswith(self):
+        prefixes = ["", "cortx", "cor", _key("cortx", "node", "n1"), _key("cortx", "node", "n1", ""),
+                    _key("cortx", "node", "n1", "disk", "d"), _key("cortx", "nodes"), _key("x", "y")]
+        for prefix in prefixes:
+            self.assertEqual(sorted(self.index.keys_with_prefix(prefix)), self._expected(prefix), prefix)
+            self.assertEqual(self.index.has_prefix(prefix), bool(self._expected(prefix)), prefix)
+        self.assertEqual(dict(self.index.items_with_prefix("cortx")), self.data)
+
+    def test_delete(self):
+        keys = list(self.data)
+        random.Random(1).shuffle(keys)
+        for key in keys[:5]:
+            del self.index[key]
+            del self.data[key]
+        deleted = self.index.delete_prefix(_key("cortx", "node", "n1"))
+        self.assertEqual(sorted(deleted), self._expected(_key("cortx", "node", "n1")))
+        for key in deleted:
+            del self.data[key]
+        self.assertEqual(sorted(self.index.keys_with_prefix("")), sorted(self.data))
+        self.assertEqual(sorted(self.index.keys_with_prefix("c")), sorted(self.data))
+        self.assertEqual(self.index.pop("missing", None), None)
+        self.index.clear()
+        self.assertFalse(self.index.has_prefix("cortx"))
+        self.assertEqual(len(self.index), 0)
+
+if __name__ == "__main__":
+    unittest.main()
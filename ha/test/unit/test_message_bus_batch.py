@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import time
+import unittest
+from unittest import mock
+
+from ha.util.message_bus import MessageBus, MessageBusProducer, CONSUMER_STATUS
+from ha.test.unit.fake_message_bus import FakeMessageBus
+
+MESSAGE_TYPE = "test_ha"
+
+class TestMessageBusBatch(unittest.TestCase):
+    """
+    Unit test for batched message bus consumer and producer
+    """
+
+    def setUp(self):
+        self.bus = FakeMessageBus()
+        patchers = [mock.patch("ha.util.message_bus.MessageProducer", self.bus.producer),
+                    mock.patch("ha.util.message_bus.MessageConsumer", self.bus.consumer)]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.received = []
+
+    def _consume(self, count: int, **kwargs):
+        consumer = MessageBus.get_consumer(consumer_id="1", consumer_group="test", message_type=MESSAGE_TYPE,
+                                           callback=self._callback, **kwargs)
+        consumer.start()
+        end = time.time() + 5
+        while len(self.received) < count and time.time() < end:
+            time.sleep(0.01)
+        consumer.stop()
+        consumer.join()
+
+    def _callback(self, message):
+        self.received.append(message.decode())
+        if message == b"stop":
+            return CONSUMER_STATUS.SUCCESS_STOP
+        return CONSUMER_STATUS.SUCCESS
+
+    def test_batch_acked_once(self):
+        self.bus._send(MESSAGE_TYPE, [str(i) for i in range(10)] + ["stop"])
+        self._consume(11, batch_size=20, batch_timeout=50)
+        self.assertEqual(self.received, [str(i) for i in range(10)] + ["stop"])
+        self.assertEqual(self.bus.calls["ack"], 1)
+
+    def test_batch_callback(self):
+        batches = []
+        def batch_callback(messages):
+            batches.append(list(messages))
+            self.received.extend(messages)
+            return CONSUMER_STATUS.SUCCESS_STOP if b"stop" in messages else CONSUMER_STATUS.SUCCESS
+        self.bus._send(MESSAGE_TYPE, [str(i) for i in range(5)] + ["stop"])
+        self._consume(6, batch_size=4, batch_timeout=50, batch_callback=batch_callback)
+        self.assertEqual([len(batch) for batch in batches], [4, 2])
+        self.assertEqual(self.bus.calls["ack"], 2)
+
+    def test_failed_message_retried_in_batch(self):
+        attempts = []
+        def callback(message):
+            attempts.append(message)
+            if message == b"1" and attempts.count(b"1") < 3:
+                return CONSUMER_STATUS.FAILED
+            self.received.append(message.decode())
+            return CONSUMER_STATUS.SUCCESS_STOP if message == b"stop" else CONSUMER_STATUS.SUCCESS
+        self._callback = callback
+        self.bus._send(MESSAGE_TYPE, ["0", "1", "2", "stop"])
+        self._consume(4, batch_size=10, batch_timeout=50)
+        self.assertEqual(self.received, ["0", "1", "2", "stop"])
+        self.assertEqual(attempts, [b"0", b"1", b"1", b"1", b"2", b"stop"])
+
+    def test_publish_async_and_flush(self):
+        with mock.patch.object(MessageBus, "register"):
+            producer = MessageBus.get_producer("ha", MESSAGE_TYPE, batch_size=100, batch_timeout=10000)
+        for i in range(10):
+            producer.publish_async({"id": i})
+        self.assertEqual(self.bus.messages(MESSAGE_TYPE), [])
+        producer.flush()
+        self.assertEqual(len(self.bus.messages(MESSAGE_TYPE)), 10)
+        self.assertEqual(self.bus.calls["send"], 1)
+        producer.publish_async("a")
+        producer.publish("b")
+        self.assertEqual(self.bus.messages(MESSAGE_TYPE)[-2:], [b"a", b"b"])
+
+    def test_publish_async_batch_size(self):
+        producer = MessageBusProducer("ha", MESSAGE_TYPE, 1, batch_size=5, batch_timeout=10000)
+        for i in range(5):
+            producer.publish_async(str(i))
+        end = time.time() + 5
+        while len(self.bus.messages(MESSAGE_TYPE)) < 5 and time.time() < end:
+            time.sleep(0.01)
+        self.assertEqual(self.bus.messages(MESSAGE_TYPE), [str(i).encode() for i in range(5)])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import time
+import unittest
+from unittest import mock
+
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.core.config.config_manager import ConfigManager
+from ha.core.health_monitor.monitor_rules_manager import MonitorRulesManager
+from ha.core.system_health.model.health_event import HealthEvent
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = f"cortx{HA_DELIM}ha{HA_DELIM}v2"
+
+def _event(resource_type: str, event_type: str, functional_type: str = None) -> HealthEvent:
+    specific_info = {"functional_type": functional_type} if functional_type else {}
+    return HealthEvent("monitor", "1", event_type, "warning", "1", "1", "c1", "1", "n1", "h1",
+                       resource_type, "1650000000", "r1", specific_info)
+
+class TestMonitorRulesManager(unittest.TestCase):
+    """
+    Unit test for monitor rules evaluated from the in memory rule table
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port)
+        patcher = mock.patch.object(ConfigManager, "get_confstore", return_value=self.store)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.rules = MonitorRulesManager()
+        self.rules.add_rule("node", "server", "failed", "publish")
+        self.rules.add_rule("disk", "all", "offline", "publish")
+
+    def tearDown(self):
+        self.consul.stop()
+        for watch in self.store._watches.values():
+            watch.stop()
+
+    def test_evaluate_without_consul_reads(self):
+        self.assertEqual(self.rules.evaluate(_event("node", "failed", "server")), ["publish"])
+        self.consul.requests.clear()
+        for _ in range(100):
+            self.assertEqual(self.rules.evaluate(_event("node", "failed", "server")), ["publish"])
+            self.assertEqual(self.rules.evaluate(_event("node", "online", "server")), [])
+        self.assertLessEqual(self.consul.requests["GET kv"], 1)
+
+    def test_all_functional_types_fallback(self):
+        self.assertEqual(self.rules.evaluate(_event("disk", "offline")), ["publish"])
+        self.assertEqual(self.rules.evaluate(_event("disk", "offline", "data")), ["publish"])
+        self.assertEqual(self.rules.evaluate(_event("node", "failed")), [])
+
+    def test_rules_updated(self):
+        self.rules.evaluate(_event("node", "failed", "server"))
+        self.rules.add_rule("node", "server", "failed", "ha")
+        self.assertEqual(self.rules.evaluate(_event("node", "failed", "server")), ["publish", "ha"])
+        self.rules.remove_rule("node", "server", "failed", "publish")
+        self.rules.remove_rule("node", "server", "failed", "ha")
+        self.assertEqual(self.rules.evaluate(_event("node", "failed", "server")), [])
+        # Rule added by another process is picked up by the watch
+        self.consul.put(f"{PREFIX}{HA_DELIM}action{HA_DELIM}cvg{HA_DELIM}all{HA_DELIM}failed", json.dumps(["ha"]))
+        end = time.time() + 5
+        while not self.rules.evaluate(_event("cvg", "failed")) and time.time() < end:
+            time.sleep(0.05)
+        self.assertEqual(self.rules.evaluate(_event("cvg", "failed")), ["ha"])
+
+if __name__ == "__main__":
+    unittest.main()
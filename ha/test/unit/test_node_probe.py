@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import socket
+import threading
+import time
+import unittest
+
+from ha.util.node_probe import NodeProbe, ProbeResult
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class SlowProbe(NodeProbe):
+    """
+    Probe with a fake reachability check, nodes named "down*" never answer.
+    """
+
+    def __init__(self, delay: float, **kwargs):
+        super().__init__(method="tcp", **kwargs)
+        self._probe_func = self._fake_probe
+        self.delay = delay
+        self.calls = 0
+        self._calls_lock = threading.Lock()
+
+    def _fake_probe(self, node: str) -> ProbeResult:
+        with self._calls_lock:
+            self.calls += 1
+        time.sleep(self.delay if not node.startswith("down") else 1.5)
+        return ProbeResult(True)
+
+class TestNodeProbe(unittest.TestCase):
+    """
+    Unit test for concurrent node reachability probe
+    """
+
+    def test_probes_run_concurrently(self):
+        probe = SlowProbe(0.3, timeout=1)
+        nodes = [f"srvnode-{i}" for i in range(8)]
+        start = time.monotonic()
+        results = probe.probe(nodes)
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertTrue(all(results[node].ok for node in nodes))
+
+    def test_probe_deadline(self):
+        probe = SlowProbe(0, timeout=0.2)
+        start = time.monotonic()
+        results = probe.probe(["srvnode-1", "down-1", "down-2"])
+        self.assertLess(time.monotonic() - start, 3)
+        self.assertTrue(results["srvnode-1"].ok)
+        self.assertEqual(results["down-1"], ProbeResult(False, "timed out"))
+        self.assertFalse(results["down-2"].ok)
+
+    def test_probe_cache(self):
+        clock = FakeClock()
+        probe = SlowProbe(0, cache_ttl=3, clock=clock)
+        probe.probe(["srvnode-1", "srvnode-2"])
+        probe.probe(["srvnode-1"])
+        self.assertEqual(probe.calls, 2)
+        clock.now = 4
+        probe.probe(["srvnode-1"])
+        self.assertEqual(probe.calls, 3)
+
+    def test_tcp_probe(self):
+        listener = socket.socket()
+        listener.bind(("127.0.0.1", 0))
+        listener.listen(1)
+        port = listener.getsockname()[1]
+        try:
+            probe = NodeProbe(method="tcp", timeout=1, ports=(port,))
+            self.assertEqual(probe.probe(["127.0.0.1"])["127.0.0.1"], ProbeResult(True))
+        finally:
+            listener.close()
+        # Closed port is refused, node itself is still reachable.
+        self.assertTrue(probe.probe(["127.0.0.1"])["127.0.0.1"].ok)
+
+    def test_resolve(self):
+        clock = FakeClock()
+        probe = NodeProbe(resolve_cache_ttl=300, clock=clock)
+        self.assertEqual(probe.resolve(["localhost"])["localhost"].detail, "127.0.0.1")
+        self.assertFalse(probe.resolve(["invalid.node.invalid"])["invalid.node.invalid"].ok)
+        self.assertIn("localhost", probe._resolved)
+        self.assertNotIn("invalid.node.invalid", probe._resolved)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import threading
+import unittest
+
+from ha.const import NODE_STATUSES
+from ha.core.controllers.pcs.pcs_status import PcsStatus, PcsStatusProvider
+
+STATUS_XML = """<pacemaker-result api-version="2.2" request="crm_mon --one-shot --inactive --output-as=xml">
+  <summary>
+    <nodes_configured number="4"/>
+    <resources_configured number="2" disabled="0" blocked="0"/>
+  </summary>
+  <nodes>
+    <node name="srvnode-1" online="true" standby="false" maintenance="false" resources_running="2"/>
+    <node name="srvnode-2" online="true" standby="true" maintenance="false" resources_running="1"/>
+    <node name="srvnode-3" online="true" standby="false" maintenance="true" resources_running="0"/>
+    <node name="srvnode-4" online="false" standby="false" maintenance="false" resources_running="0"/>
+  </nodes>
+  <node_history>
+    <node name="srvnode-1">
+      <resource_history id="motr-ios-1" orphan="false" migration-threshold="3" fail-count="2"/>
+      <resource_history id="s3server-1" orphan="false" migration-threshold="3"/>
+    </node>
+    <node name="srvnode-2">
+      <resource_history id="motr-ios-2" orphan="false" migration-threshold="3"/>
+    </node>
+  </node_history>
+  <status code="0" message="OK"/>
+</pacemaker-result>
+"""
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class CountingExecutor:
+    def __init__(self, output: str = STATUS_XML, release: threading.Event = None):
+        self.output = output
+        self.release = release
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def __call__(self, cmd: str) -> tuple:
+        with self._lock:
+            self.calls += 1
+        if self.release is not None:
+            self.release.wait(5)
+        return self.output, "", 0
+
+class TestPcsStatus(unittest.TestCase):
+    """
+    Unit test for pacemaker status snapshot
+    """
+
+    def test_node_status(self):
+        status = PcsStatus(STATUS_XML)
+        self.assertEqual(status.node_names(), ["srvnode-1", "srvnode-2", "srvnode-3", "srvnode-4"])
+        self.assertEqual(status.node_status("srvnode-1"), NODE_STATUSES.ONLINE.value)
+        self.assertEqual(status.node_status("SRVNODE-2"), NODE_STATUSES.STANDBY_WITH_RESOURCES_RUNNING.value)
+        self.assertEqual(status.node_status("srvnode-3"), NODE_STATUSES.MAINTENANCE.value)
+        self.assertEqual(status.node_status("srvnode-4"), NODE_STATUSES.CLUSTER_OFFLINE.value)
+        self.assertIsNone(status.node_status("srvnode-5"))
+        self.assertEqual(len(status.tree.findall("./nodes/node")), 4)
+
+    def test_fail_counts(self):
+        status = PcsStatus(STATUS_XML)
+        self.assertEqual(status.fail_counts("srvnode-1"), {"motr-ios-1": "2"})
+        self.assertEqual(status.fail_counts("srvnode-2"), {})
+        self.assertEqual(status.fail_counts("srvnode-5"), {})
+
+    def test_snapshot_reused_within_ttl(self):
+        clock = FakeClock()
+        executor = CountingExecutor()
+        provider = PcsStatusProvider(ttl=2, executor=executor, clock=clock)
+        status = provider.get()
+        clock.now = 1.5
+        self.assertIs(provider.get(), status)
+        self.assertEqual(executor.calls, 1)
+        clock.now = 2.5
+        self.assertIsNot(provider.get(), status)
+        self.assertEqual(executor.calls, 2)
+        provider.get(max_age=0)
+        self.assertEqual(executor.calls, 3)
+        provider.invalidate()
+        provider.get()
+        self.assertEqual(executor.calls, 4)
+
+    def test_failed_read_not_cached(self):
+        results = [RuntimeError("crm_mon failed"), (STATUS_XML, "", 0)]
+        def executor(cmd: str) -> tuple:
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+        provider = PcsStatusProvider(executor=executor)
+        with self.assertRaises(RuntimeError):
+            provider.get()
+        self.assertEqual(provider.get().node_status("srvnode-1"), NODE_STATUSES.ONLINE.value)
+
+    def test_concurrent_callers_share_one_read(self):
+        release = threading.Event()
+        executor = CountingExecutor(release=release)
+        provider = PcsStatusProvider(executor=executor)
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(provider.get())) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        # Let all the callers reach the read in progress before it completes.
+        threading.Timer(0.2, release.set).start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(executor.calls, 1)
+        self.assertEqual(len(results), 8)
+        self.assertTrue(all(status is results[0] for status in results))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import json
+import unittest
+
+from ha.monitor.k8s.published_alerts import PublishedAlerts
+
+def _alert(pod: str, status: str, generation_id: str = None, timestamp: str = "1660000000") -> dict:
+    return {
+        "header": {"event_id": f"{timestamp}{pod}", "timestamp": timestamp},
+        "payload": {"node_id": pod, "resource_type": "node", "resource_id": pod, "resource_status": status,
+                    "specific_info": {"generation_id": generation_id} if generation_id else {}}
+    }
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+class TestPublishedAlerts(unittest.TestCase):
+    """
+    Unit test for duplicate alert suppression of k8s monitor
+    """
+
+    def setUp(self):
+        self.clock = _Clock()
+        self.alerts = PublishedAlerts(max_alerts=100, ttl=60, clock=self.clock)
+
+    def test_duplicates(self):
+        self.assertFalse(self.alerts.is_published(_alert("n1", "online", "data-0")))
+        # Repeated alert has a new timestamp
+        self.assertTrue(self.alerts.is_published(json.dumps(_alert("n1", "online", "data-0", "1660000005"))))
+        self.assertFalse(self.alerts.is_published(_alert("n1", "offline", "data-0")))
+        self.assertFalse(self.alerts.is_published(_alert("n1", "online", "data-0")))
+        self.assertFalse(self.alerts.is_published(_alert("n2", "online")))
+        self.assertTrue(self.alerts.is_published(_alert("n2", "online")))
+        self.assertFalse(self.alerts.is_published({"header": {}}))
+        self.assertEqual(self.alerts.stats()["duplicates"], 2)
+
+    def test_fingerprint_is_normalized(self):
+        payload = _alert("n1", "online", "data-0")["payload"]
+        reordered = dict(reversed(list(payload.items())))
+        self.assertEqual(PublishedAlerts.fingerprint(payload), PublishedAlerts.fingerprint(reordered))
+        self.assertEqual(len(PublishedAlerts.fingerprint(payload)), 16)
+
+    def test_bounded(self):
+        # Pods recreated with new generation ids
+        for generation in range(1000):
+            self.assertFalse(self.alerts.is_published(_alert("n1", "online", f"data-{generation}")))
+        stats = self.alerts.stats()
+        self.assertEqual(stats["alerts"], 100)
+        self.assertEqual(stats["evicted"], 900)
+        self.assertGreater(stats["memory"], 0)
+        # Recently seen alert is kept, least recently seen one is dropped.
+        self.assertTrue(self.alerts.is_published(_alert("n1", "online", "data-999")))
+        self.assertFalse(self.alerts.is_published(_alert("n1", "online", "data-0")))
+
+    def test_ttl(self):
+        self.assertFalse(self.alerts.is_published(_alert("n1", "online")))
+        self.clock.now = 30
+        self.assertFalse(self.alerts.is_published(_alert("n2", "online")))
+        self.clock.now = 70
+        # n1 was last seen at 0, n2 at 30
+        self.assertTrue(self.alerts.is_published(_alert("n2", "online")))
+        self.assertFalse(self.alerts.is_published(_alert("n1", "online")))
+        self.assertEqual(self.alerts.stats()["expired"], 1)
+
+if __name__ == "__main__":
+    unittest.main()
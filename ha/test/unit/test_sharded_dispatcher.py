@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import random
+import threading
+import time
+import unittest
+from collections import defaultdict
+from unittest import mock
+
+from ha.util.message_bus import MessageBus, CONSUMER_STATUS
+from ha.util.sharded_dispatcher import ShardedDispatcher, resource_key
+from ha.test.unit.fake_message_bus import FakeMessageBus
+
+MESSAGE_TYPE = "health_events"
+
+class TestShardedDispatcher(unittest.TestCase):
+    """
+    Stress test for sharded event processing with an in memory message bus
+    """
+
+    def setUp(self):
+        self.bus = FakeMessageBus()
+        patcher = mock.patch("ha.util.message_bus.MessageConsumer", self.bus.consumer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.lock = threading.Lock()
+        self.processed = set()
+        self.sequences = defaultdict(list)
+        self.threads = defaultdict(set)
+        self.ack_violations = []
+
+    def _callback(self, event):
+        time.sleep(random.random() / 2000)
+        with self.lock:
+            self.sequences[(event["resource_type"], event["resource_id"])].append(event["sequence"])
+            self.threads[(event["resource_type"], event["resource_id"])].add(threading.current_thread().name)
+            self.processed.add(event["offset"])
+        if event["resource_id"] == "stop":
+            return CONSUMER_STATUS.SUCCESS_STOP
+        # First attempt of some events fails and is retried in place.
+        if event["offset"] % 97 == 0 and event["offset"] not in self.retried:
+            self.retried.add(event["offset"])
+            with self.lock:
+                self.sequences[(event["resource_type"], event["resource_id"])].pop()
+            return CONSUMER_STATUS.FAILED
+        return CONSUMER_STATUS.SUCCESS
+
+    def _check_ack(self, bus_consumer):
+        ack = bus_consumer.ack
+        def checked_ack():
+            # Everything up to the committed position must be processed.
+            with self.lock:
+                missing = [offset for offset in range(bus_consumer._position) if offset not in self.processed]
+            if missing:
+                self.ack_violations.append(missing)
+            ack()
+        return checked_ack
+
+    def test_ordering_under_load(self):
+        self.retried = set()
+        events, sequence = [], defaultdict(int)
+        resources = [("node", f"node-{i}") for i in range(10)] + [("disk", f"disk-{i}") for i in range(40)]
+        for offset in range(3000):
+            resource_type, resource_id = random.choice(resources)
+            events.append(json.dumps({"resource_type": resource_type, "resource_id": resource_id,
+                                      "sequence": sequence[resource_id], "offset": offset}))
+            sequence[resource_id] += 1
+        events.append(json.dumps({"resource_type": "node", "resource_id": "stop", "sequence": 0, "offset": 3000}))
+        self.bus._send(MESSAGE_TYPE, events)
+
+        dispatcher = ShardedDispatcher([self._callback] * 8, name="test", retry_delay=0.001)
+        self.consumer = MessageBus.get_consumer(consumer_id="1", consumer_group="test", message_type=MESSAGE_TYPE,
+                                                callback=self._callback, batch_size=64, batch_timeout=50,
+                                                batch_callback=dispatcher.dispatch)
+        self.consumer.start()
+        self.consumer.consumer.ack = self._check_ack(self.consumer.consumer)
+        self.consumer.join()
+        dispatcher.stop()
+
+        self.assertEqual(len(self.processed), 3001)
+        for resource, sequences in self.sequences.items():
+            self.assertEqual(sequences, list(range(len(sequences))), resource)
+            self.assertEqual(len(self.threads[resource]), 1, resource)
+        self.assertEqual(self.ack_violations, [])
+        self.assertEqual(self.bus.committed[("test", MESSAGE_TYPE)], 3001)
+        self.assertGreater(len(set.union(*self.threads.values())), 1)
+
+    def test_failed_stop(self):
+        dispatcher = ShardedDispatcher([lambda m: CONSUMER_STATUS.FAILED_STOP if m == b"x" else CONSUMER_STATUS.SUCCESS] * 2)
+        self.assertEqual(dispatcher.dispatch([b"a", b"x", b"b"]), CONSUMER_STATUS.FAILED_STOP)
+        self.assertEqual(dispatcher.dispatch([b"a", b"b"]), CONSUMER_STATUS.SUCCESS)
+        dispatcher.stop()
+
+    def test_dispatch_after_stop(self):
+        release = threading.Event()
+        def slow(message):
+            release.wait(5)
+            return CONSUMER_STATUS.SUCCESS
+        dispatcher = ShardedDispatcher([slow])
+        results = []
+        thread = threading.Thread(target=lambda: results.append(dispatcher.dispatch([b"a", b"b", b"c"])))
+        thread.start()
+        time.sleep(0.1)
+        # Queued messages of the running batch are given up by stop.
+        dispatcher.stop()
+        release.set()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [CONSUMER_STATUS.FAILED_STOP])
+        self.assertEqual(dispatcher.dispatch([b"a", b"b"]), CONSUMER_STATUS.FAILED_STOP)
+
+    def test_retry_raising_callback(self):
+        calls = []
+        def raising(message):
+            calls.append(time.monotonic())
+            raise RuntimeError("bad message")
+        dispatcher = ShardedDispatcher([raising], retries=3, retry_delay=0.05)
+        # Message is acked once retries are over, retries are delayed with backoff
+        self.assertEqual(dispatcher.dispatch([b"a"]), CONSUMER_STATUS.SUCCESS)
+        dispatcher.stop()
+        self.assertEqual(len(calls), 4)
+        delays = [later - earlier for earlier, later in zip(calls, calls[1:])]
+        self.assertGreaterEqual(delays[0], 0.05)
+        self.assertGreaterEqual(delays[2], 0.2)
+
+    def test_stop_during_retry(self):
+        dispatcher = ShardedDispatcher([mock.Mock(side_effect=RuntimeError)], retry_delay=10)
+        results = []
+        thread = threading.Thread(target=lambda: results.append(dispatcher.dispatch([b"a"])))
+        thread.start()
+        time.sleep(0.1)
+        dispatcher.stop()
+        thread.join(2)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [CONSUMER_STATUS.FAILED_STOP])
+
+    def test_resource_key(self):
+        self.assertEqual(resource_key(b'{"resource_type": "node", "resource_id": "n1"}'), ("node", "n1"))
+        self.assertEqual(resource_key(str({"payload": {"resource_type": "disk", "resource_id": "d1"}})), ("disk", "d1"))
+        self.assertIsNone(resource_key(b"not an event"))
+
+    def test_decoded_once(self):
+        received = []
+        def callback(event):
+            received.append(event)
+            return CONSUMER_STATUS.SUCCESS
+        decode = mock.Mock(side_effect=lambda message: json.loads(message))
+        dispatcher = ShardedDispatcher([callback], decode=decode)
+        message = b'{"resource_type": "node", "resource_id": "n1"}'
+        self.assertEqual(dispatcher.dispatch([message, b"not an event"]), CONSUMER_STATUS.SUCCESS)
+        dispatcher.stop()
+        self.assertEqual(decode.call_count, 2)
+        # Invalid message is given to the callback as received.
+        self.assertEqual(received, [{"resource_type": "node", "resource_id": "n1"}, b"not an event"])
+
+if __name__ == "__main__":
+    unittest.main()
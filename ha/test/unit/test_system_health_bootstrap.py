@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import json
+import os
+import pathlib
+import unittest
+from unittest import mock
+
+from ha import const
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+from ha.util.message_bus import MessageBus
+from ha.core.config.config_manager import ConfigManager
+from ha.core.system_health.system_health import SystemHealth
+from ha.core.system_health.system_health_hierarchy import HealthHierarchy
+from ha.core.system_health.model.health_event import HealthEvent
+from ha.test.unit.fake_consul import FakeConsul
+
+PREFIX = const.CLUSTER_CONFSTORE_PREFIX
+HIERARCHY_FILE = os.path.join(os.path.dirname(pathlib.Path(__file__)), '..', '..', '..',
+                              'conf', 'etc', 'v2', 'system_health_hierarchy.json')
+
+def _event(resource_type: str, resource_id: str, node_id: str = "", specific_info: dict = None) -> HealthEvent:
+    return HealthEvent("ha", "1", "online", "informational", "1", "1", "c1", "1", node_id, None,
+                       resource_type, "1650000000", resource_id, specific_info or {})
+
+class TestSystemHealthBootstrap(unittest.TestCase):
+    """
+    Unit test for adding initial health of many resources together
+    """
+
+    def setUp(self):
+        self.consul = FakeConsul()
+        self.consul.start()
+        self.store = ConsulKvStore(PREFIX, host="127.0.0.1", port=self.consul.port, enable_batch=True)
+        # num_entity_health_events
+        patcher = mock.patch("ha.core.system_health.model.entity_health.Conf")
+        patcher.start().get.return_value = 2
+        self.addCleanup(patcher.stop)
+        with open(HIERARCHY_FILE, "r") as fi:
+            HealthHierarchy.SCHEMA = json.load(fi)
+        self.producer = mock.MagicMock()
+        with mock.patch.object(MessageBus, "get_producer", return_value=self.producer), \
+                mock.patch.object(ConfigManager, "get_confstore", return_value=self.store), \
+                mock.patch("ha.core.system_health.system_health.Conf"):
+            self.system_health = SystemHealth(self.store)
+        self.events = [_event("cluster", "c1"), _event("site", "1"), _event("rack", "1")]
+        for node in range(100):
+            self.events.append(_event("node", f"n{node}", f"n{node}", {"functional_type": "data"}))
+            for disk in range(12):
+                self.events.append(_event("disk", f"d{disk}", f"n{node}", {"cvg_id": "cvg-0"}))
+
+    def tearDown(self):
+        self.consul.stop()
+
+    def test_bootstrap(self):
+        self.consul.requests.clear()
+        timing = self.system_health.bootstrap(self.events)
+        self.assertEqual(sorted(timing), ["prepare", "publish", "read", "write"])
+        health_keys = [key for key in self.consul.data if key.endswith(f"{HA_DELIM}health")]
+        self.assertEqual(len(health_keys), len(self.events))
+        self.assertEqual(self.consul.requests["GET kv"], 1)
+        self.assertEqual(self.consul.requests["PUT txn"], -(-len(self.events) // 64))
+        disk_key = [key for key in health_keys if f"node{HA_DELIM}n5{HA_DELIM}cvg{HA_DELIM}cvg-0{HA_DELIM}disk{HA_DELIM}d3" in key]
+        self.assertEqual(len(disk_key), 1)
+        self.producer.publish_async.assert_not_called()
+
+    def test_bootstrap_again(self):
+        self.system_health.bootstrap(self.events)
+        self.consul.requests.clear()
+        self.system_health.bootstrap(self.events)
+        # Same status again, nothing to write or publish
+        self.assertEqual(self.consul.requests["PUT txn"], 0)
+        self.producer.publish_async.assert_not_called()
+
+    def test_bootstrap_commits_only_health(self):
+        # Values queued by the caller are left for its own commit
+        self.store.update("other_key", "1")
+        self.system_health.bootstrap(self.events)
+        self.assertFalse([key for key in self.consul.data if key.endswith("other_key")])
+        self.assertEqual(self.store.get_value("other_key"), "1")
+        self.store.commit()
+        self.assertEqual(len([key for key in self.consul.data if key.endswith("other_key")]), 1)
+
+    def test_bootstrap_monitor_events(self):
+        event = _event("node", "n1", "n1", {"functional_type": "data", "generation_id": "g1"})
+        event.source = "monitor"
+        with mock.patch.object(self.system_health, "process_event") as process_event:
+            self.system_health.bootstrap(self.events + [event])
+        # Pod restart is detected by process_event from generation id
+        process_event.assert_called_once_with(event)
+
+    def test_disk_cvg_map(self):
+        disk_cvg_map = {f"n{node}": {f"d{disk}": f"cvg-{disk // 6}" for disk in range(12)} for node in range(100)}
+        self.system_health.set_disk_cvg_map(disk_cvg_map)
+        self.assertEqual(len([key for key in self.consul.data if "disk_cvg_map" in key]), 100)
+        self.system_health._disk_cvg_map.clear()
+        self.consul.requests.clear()
+        self.assertEqual(self.system_health._get_disk_cvg("n5", "d7"), "cvg-1")
+        self.assertEqual(self.system_health._get_disk_cvg("n5", "d1"), "cvg-0")
+        # One exact key read per node, whatever the cluster size.
+        self.assertEqual(self.consul.requests["GET kv"], 1)
+        self.assertEqual(self.consul.requests["GET kv recurse"], 0)
+        self.assertIsNone(self.system_health._get_disk_cvg("n5", "d99"))
+        self.assertIsNone(self.system_health._get_disk_cvg("n500", "d1"))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import unittest
+
+from ha.const import HA_DELIM
+from ha.core.system_health.system_health_index import SystemHealthIndex
+
+PREFIX = HA_DELIM.join(["cortx", "ha", "v2", "cortx", "ha", "system"])
+
+def _key(*path):
+    return HA_DELIM.join([PREFIX, *path, "health"])
+
+class TestSystemHealthIndex(unittest.TestCase):
+    """
+    Unit test for system health index
+    """
+
+    def setUp(self):
+        self.status = {
+            _key("cluster", "c1"): "c1",
+            _key("cluster", "c1", "site", "1"): "s1",
+            _key("cluster", "c1", "site", "1", "rack", "1"): "r1",
+            _key("cluster", "c1", "site", "1", "rack", "1", "node", "n1"): "n1",
+            _key("cluster", "c1", "site", "1", "rack", "1", "node", "n1", "cvg", "cvg-01"): "n1-cvg",
+            _key("cluster", "c1", "site", "1", "rack", "1", "node", "n1", "cvg", "cvg-01", "disk", "/dev/sdb"): "n1-sdb",
+            _key("cluster", "c1", "site", "1", "rack", "1", "node", "n2"): "n2",
+            _key("cluster", "c1", "site", "1", "rack", "1", "node", "n2", "cvg", "cvg-01"): "n2-cvg",
+            _key("cluster", "c1", "site", "1", "rack", "1", "node", "n2", "server", "n2", "hw", "disk", "sdb"): "hw",
+        }
+        self.index = SystemHealthIndex(self.status)
+
+    def test_find(self):
+        self.assertEqual([e.value for e in self.index.find("node")], ["n1", "n2"])
+        self.assertEqual([e.value for e in self.index.find("cvg")], ["n1-cvg", "n2-cvg"])
+        self.assertEqual([e.value for e in self.index.find("node", "n2")], ["n2"])
+        self.assertEqual(self.index.find("node", "n3"), [])
+        self.assertEqual(self.index.find("enclosure"), [])
+
+    def test_children_follow_parent(self):
+        node = self.index.find("node", "n2")[0]
+        cvgs = node.get_children("cvg")
+        self.assertEqual([(e.component_id, e.value) for e in cvgs], [("cvg-01", "n2-cvg")])
+        self.assertEqual(cvgs[0].get_children("disk"), [])
+        disk = self.index.find("cvg")[0].get_children("disk")[0]
+        self.assertEqual(disk.component_id, "/dev/sdb")
+        self.assertEqual(disk.key, _key("cluster", "c1", "site", "1", "rack", "1", "node", "n1", "cvg", "cvg-01", "disk", "/dev/sdb"))
+
+    def test_non_health_keys_ignored(self):
+        index = SystemHealthIndex({f"{PREFIX}{HA_DELIM}cluster{HA_DELIM}node_map{HA_DELIM}n1": "{}",
+                                   _key("cluster", "c1", "site"): "bad"})
+        self.assertEqual(index.find("cluster"), [])
+        self.assertEqual(index.find("site"), [])
+
+    def test_missing_parent_health(self):
+        index = SystemHealthIndex({_key("cluster", "c1", "site", "1", "rack", "1"): "r1"})
+        site = index.find("site")
+        self.assertEqual(site, [])
+        self.assertEqual([e.value for e in index.find("rack")], ["r1"])
+
+if __name__ == "__main__":
+    unittest.main()
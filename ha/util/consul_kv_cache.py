@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+from threading import RLock
+
+from cortx.utils.log import Log
+from ha import const
+from ha.const import HA_DELIM
+from ha.util.consul_kv_store import ConsulKvStore
+
+class ConsulKvCache:
+    """
+    Process local write-through cache of the keys under a prefix of ConsulKvStore.
+    It is warmed with one recursive get and then kept coherent with a
+    ConsulKvStore.watch, so values written by other processes are picked up.
+    Only the keys changed or deleted are applied for each change.
+
+    Keys are relative to the store prefix, same as ConsulKvStore.
+
+    Example:
+        cache = ConsulKvCache(store, "cortx>ha>system")
+        cache.start()
+        cache.update("cortx>ha>system>cluster>c1>health", value)
+    """
+
+    def __init__(self, store: ConsulKvStore, prefix: str, wait: str = const.CONSUL_WATCH_WAIT):
+        """
+        Init method.
+
+        Args:
+            store (ConsulKvStore): store to read and write through.
+            prefix (str): keys under this prefix are cached.
+            wait (str): max wait of the consul blocking query.
+        """
+        self._store = store
+        self._prefix = prefix
+        self._key_prefix = store._prepare_key(prefix)
+        self._wait = wait
+        self._data: dict = {}
+        self._index = None
+        # Local writes not yet confirmed by a blocking query {key: (generation, value)}
+        self._pending: dict = {}
+        self._generation = 0
+        # Generation when the watch sent the query being waited on.
+        self._requested_generation = 0
+        self._lock = RLock()
+        self._watching = False
+
+    @property
+    def index(self) -> int:
+        """
+        Consul index of the cached values.
+        """
+        return self._index
+
+    def start(self) -> None:
+        """
+        Warm the cache and start watching consul for changes.
+        """
+        self.refresh()
+        self._requested_generation = self._generation
+        self._store.watch(self._prefix, self._on_change, index=self._index, wait=self._wait, delta=True)
+        self._watching = True
+        Log.info(f"Consul cache for {self._key_prefix} is loaded with {len(self._data)} keys at index {self._index}.")
+
+    def stop(self) -> None:
+        """
+        Stop watching consul. Values read after stop can be stale.
+        """
+        if self._watching:
+            self._store.unwatch(self._prefix, self._on_change)
+            self._watching = False
+
+    def refresh(self) -> None:
+        """
+        Reload all the keys under the prefix with one recursive get.
+        """
+        generation = self._generation
+        index, data = self._store.get_with_index(self._prefix)
+        self._apply(index, data, generation)
+
+    def _on_change(self, index: int, changed: dict, deleted: list) -> None:
+        """
+        Watch callback, the next blocking query is sent after it returns.
+        deleted is None if changed has all the values.
+        """
+        if deleted is None:
+            self._apply(index, changed, self._requested_generation)
+        else:
+            self._apply_changes(index, changed, deleted, self._requested_generation)
+        self._requested_generation = self._generation
+
+    def _apply(self, index: int, data: dict, generation: int) -> None:
+        """
+        Replace cached values with the consul snapshot. Local writes done after
+        the snapshot was requested may not be part of it, so they are retained.
+        """
+        data = dict(data) if data else {}
+        with self._lock:
+            for key, (write_generation, value) in list(self._pending.items()):
+                if write_generation > generation:
+                    data[key] = value
+                else:
+                    del self._pending[key]
+            self._data = data
+            self._index = index
+
+    def _apply_changes(self, index: int, changed: dict, deleted: list, generation: int) -> None:
+        """
+        Apply values changed and keys deleted after the cached index, local
+        writes done after the changes were requested are retained.
+        """
+        with self._lock:
+            retained = {}
+            for key, (write_generation, value) in list(self._pending.items()):
+                if write_generation > generation:
+                    retained[key] = value
+                else:
+                    del self._pending[key]
+            for key, value in changed.items():
+                if key not in retained:
+                    self._data[key] = value
+            for key in deleted:
+                if key not in retained:
+                    self._data.pop(key, None)
+            self._index = index
+
+    def covers(self, key: str, full_key: bool = False) -> bool:
+        """
+        Check if key is under the cached prefix.
+
+        Args:
+            key (str): key relative to the store prefix.
+            full_key (bool): key is a full consul key, ex. prefix for get_keys.
+        """
+        if not full_key:
+            key = self._store._prepare_key(key)
+        return key.startswith(self._key_prefix)
+
+    def get_value(self, key: str) -> str:
+        """
+        Get value of the exact key, None if not present.
+        """
+        with self._lock:
+            return self._data.get(self._store._prepare_key(key))
+
+    def get(self, key: str = "") -> dict:
+        """
+        Get all key val pairs under key, same as ConsulKvStore.get.
+        """
+        k = self._store._prepare_key(key)
+        with self._lock:
+            key_val = {name: self._data[name] for name in sorted(self._data) if name.startswith(k)}
+        return key_val if key_val else None
+
+    def key_exists(self, key: str) -> bool:
+        """
+        Check if any key starts with key, same as ConsulKvStore.key_exists.
+        """
+        k = self._store._prepare_key(key)
+        with self._lock:
+            if k in self._data:
+                return True
+            return any(name.startswith(k) for name in self._data)
+
+    def exact_key_exists(self, key: str) -> bool:
+        """
+        Check if exactly the key exists, same as ConsulKvStore.exact_key_exists.
+        """
+        with self._lock:
+            return self._store._prepare_key(key) in self._data
+
+    def get_key_names(self, key: str = "") -> list:
+        """
+        Get names of all the cached keys under key, same as ConsulKvStore.get_key_names.
+        """
+        k = f"{self._store._prepare_key(key)}{HA_DELIM}"
+        with self._lock:
+            return [name for name in self._data if name.startswith(k)]
+
+    def get_keys(self, prefix: str) -> list:
+        """
+        Get cached keys matching the full consul key prefix, same as ConsulKvStore.get_keys.
+        """
+        with self._lock:
+            return [name for name in self._data if name.startswith(prefix)]
+
+    def update(self, key: str, value: str) -> bool:
+        """
+        Write value to consul and the cache. Consul is not updated if the
+        cached value is same.
+
+        Return:
+            bool: True if value is written to consul.
+        """
+        k = self._store._prepare_key(key)
+        with self._lock:
+            if k in self._data and self._data[k] == value:
+                return False
+        self._store.update(key, value)
+        with self._lock:
+            self._generation += 1
+            self._pending[k] = (self._generation, value)
+            self._data[k] = value
+        return True
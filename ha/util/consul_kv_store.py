@@ -16,24 +16,49 @@
 # cortx-questions@seagate.com.
 
 from base64 import b64encode
-import consul
+from concurrent.futures import ThreadPoolExecutor
+import time
 from consul import ConsulException
 from consul.base import ClientError
 from requests.exceptions import RequestException
 from urllib3.exceptions import HTTPError
 import socket
-from ha.const import HA_DELIM
+from threading import Lock
+from ha.const import HA_DELIM, CONSUL_WATCH_WAIT
+from ha.const import CONSUL_TXN_PARALLEL, CONSUL_TXN_RETRY_COUNT, CONSUL_TXN_RETRY_DELAY
+from ha.const import CONSUL_KEYS_CACHE_TTL
+from ha.util.kv_prefix_index import KvPrefixIndex
+from ha.util.consul_transport import ConsulTransport
+from ha.util.consul_kv_watch import ConsulKvWatch
 from cortx.utils.log import Log
 from typing import Any, Dict, List, NamedTuple, Optional
 
+# Max operations consul accepts in one transaction
+CONSUL_TXN_MAX_OPS = 64
+
 TxPutKV = NamedTuple('TxPutKV', [('key', str), ('value', str),
                                  ('cas', Optional[Any])])
 
+# Result of one commit transaction
+TxResult = NamedTuple('TxResult', [('keys', List[str]), ('success', bool),
+                                   ('attempts', int), ('error', Optional[str])])
+
+class ConsulTxnException(Exception):
+    """
+    Commit failed for some of the transactions, results has TxResult of all.
+    """
+
+    def __init__(self, message: str, results: List[TxResult]):
+        super().__init__(message)
+        self.results = results
+
 #TODO: Update set/get/update function to provide blocking and non blocking function
 class ConsulKvStore:
     """ Represents a Consul kv Store """
 
+    # get_keys cache {prefix: (expiry time or None, keys)}
     _keys = {}
+    _keys_lock = Lock()
 
     def __init__(self, prefix: str, host: str="localhost", port: int=8500, enable_batch: bool=False):
         """
@@ -54,8 +79,10 @@ class ConsulKvStore:
         self._consul = self._get_connection(prefix, host, port)
         self._consul.kv.put(self._prepare_key(""), None)
         self._enable_batch_put = enable_batch
+        self._watches: Dict[str, ConsulKvWatch] = {}
+        self._watch_lock = Lock()
         if self._enable_batch_put:
-            self._payload = {}
+            self._payload = KvPrefixIndex()
 
     def _verify(self, prefix: str, host: str, port: int):
         """
@@ -79,11 +106,9 @@ class ConsulKvStore:
             port (str): consul port
 
         Return:
-            Object: Consul object.
+            Object: Consul object, shared by all the stores of the process.
         """
-        if host=="localhost" and port==8500:
-            return consul.Consul()
-        return consul.Consul(host=host, port=port)
+        return ConsulTransport.get_client(host, port)
 
     def _verify_data(self, *args):
         """
@@ -108,7 +133,8 @@ class ConsulKvStore:
 
     def key_exists(self, key: str):
         """
-        Check if key exists.
+        Check if key exists. Any key starting with key is a match.
+        Only the key names one level below key are fetched, not the values.
 
         Args:
             key (str): Consul Key.
@@ -120,16 +146,34 @@ class ConsulKvStore:
 
         # First find in cache if batch put is enabled
         Log.debug(f"[consul-op] is key exist in cache: {k}")
-        if self._enable_batch_put and [key for key in self._payload if key.startswith(k)]:
+        if self._enable_batch_put and self._payload.has_prefix(k):
             Log.debug(f"[consul-op] key {k} found in cache: True")
             return True
 
         # find in consul and check if exists
         Log.debug(f"[consul-op] is key exist: {k}")
-        _, data = self._consul.kv.get(k, recurse=True)
-        Log.debug(f"[consul-op] key {k} found in consul: True")
+        _, keys = self._consul.kv.get(k, keys=True, separator=HA_DELIM)
+        Log.debug(f"[consul-op] key {k} found in consul: {bool(keys)}")
 
-        return True if data else False
+        return True if keys else False
+
+    def exact_key_exists(self, key: str) -> bool:
+        """
+        Check if exactly the key exists, keys under it are not a match.
+        Values are not fetched.
+
+        Args:
+            key (str): Consul Key.
+
+        Return:
+            bool: True if key exists else False.
+        """
+        k = self._prepare_key(key)
+        if self._enable_batch_put and k in self._payload:
+            return True
+        Log.debug(f"[consul-op] is exact key exist: {k}")
+        _, keys = self._consul.kv.get(k, keys=True, separator=HA_DELIM)
+        return k in (keys or [])
 
     def set(self, key: str, val: str=None):
         """
@@ -146,6 +190,7 @@ class ConsulKvStore:
         if self.key_exists(key):
             raise Exception(f"Key {key} already exists in kv store.")
         k = self._prepare_key(key)
+        ConsulKvStore._invalidate_keys(k)
 
         if self._enable_batch_put:
             Log.debug(f"[consul-op] Putting key value in cache for key: {k}")
@@ -171,6 +216,7 @@ class ConsulKvStore:
         """
         self._verify_data(key)
         k = self._prepare_key(key)
+        ConsulKvStore._invalidate_keys(k)
 
         if self._enable_batch_put:
             Log.debug(f"[consul-op] Putting value in cache for key: {k}")
@@ -182,12 +228,12 @@ class ConsulKvStore:
         Log.debug(f"[consul-op] put new value for Key: {k}")
         return new_val
 
-    # TODO : Currently all keys with the matching prefix "key" are returned
-    # add additional parameter so that only the exact matching key is returned when required
     def get(self, key: str = ""):
         """
         Get values. Default it will return all keys. It is block call,
         will take some time if consul leader is not elected.
+        All the keys with the matching prefix "key" are returned, use
+        get_value for only the exact key.
 
         Args:
             key (str): Key.
@@ -200,10 +246,8 @@ class ConsulKvStore:
         # simulating consul kv get operation for _payload dict
         payload_data = None
         if self._enable_batch_put:
-            # Using dictionary comprehension + startswith()
-            # Prefix key match in dictionary
             Log.debug(f"[consul-op] searching key in cache: {k}")
-            payload_data = {key:val for key, val in self._payload.items() if key.startswith(k)}
+            payload_data = dict(self._payload.items_with_prefix(k))
 
         Log.debug(f"[consul-op] getting the value for key: {k}")
         _, data = self._consul.kv.get(k, recurse=True)
@@ -221,6 +265,138 @@ class ConsulKvStore:
 
         return key_val if key_val else None
 
+    def get_value(self, key: str) -> Optional[str]:
+        """
+        Get value of the exact key. Keys under it are not fetched.
+
+        Args:
+            key (str): Key.
+
+        Return:
+            str: value, None if key is not present.
+        """
+        k = self._prepare_key(key)
+        if self._enable_batch_put and k in self._payload:
+            val = self._payload[k]
+        else:
+            Log.debug(f"[consul-op] getting the value of exact key: {k}")
+            _, data = self._consul.kv.get(k)
+            val = data['Value'] if data else None
+        return val.decode("utf-8") if isinstance(val, bytes) else val
+
+    def get_key_names(self, key: str = "", separator: str = None) -> List[str]:
+        """
+        Get names of all the keys under key, values are not fetched.
+        With separator, names are cut after the first separator below key,
+        ex. get_key_names("events", HA_DELIM) gives the direct children.
+
+        Args:
+            key (str): Key.
+            separator (str): separator to list only one level.
+
+        Return:
+            List[str]: full key names including the store prefix.
+        """
+        k = f"{self._prepare_key(key)}{HA_DELIM}"
+        Log.debug(f"[consul-op] getting key names under: {k}")
+        _, keys = self._consul.kv.get(k, keys=True, separator=separator)
+        keys = list(keys or [])
+        if self._enable_batch_put:
+            known = set(keys)
+            for name in self._payload.keys_with_prefix(k):
+                if separator and separator in name[len(k):]:
+                    name = name[:name.index(separator, len(k)) + len(separator)]
+                if name not in known:
+                    known.add(name)
+                    keys.append(name)
+        return keys
+
+    def get_with_index(self, key: str = "", index: int = None, wait: str = None):
+        """
+        Get all the values under key along with the consul index. If index is
+        given it is a blocking query, returns once the values change after
+        index or wait time (ex. "30s") is over. Batch payload is not merged.
+
+        Args:
+            key (str): Key.
+            index (int): consul index of the last read values.
+            wait (str): maximum time to block for.
+
+        Return:
+            (int, dict): consul index, dictionary of key val pair or None.
+        """
+        index, entries = self.get_entries_with_index(key, index=index, wait=wait)
+        return index, {name: val for name, (val, _) in entries.items()} if entries else None
+
+    def get_entries_with_index(self, key: str = "", index: int = None, wait: str = None):
+        """
+        Same as get_with_index, values are given along with the consul index
+        they were last modified at, so the keys changed after an index are known.
+
+        Return:
+            (int, dict): consul index, dictionary of key (value, modify index) or None.
+        """
+        k = self._prepare_key(key)
+        Log.debug(f"[consul-op] getting the value for key: {k} index: {index}")
+        index, data = self._consul.kv.get(k, recurse=True, index=index, wait=wait)
+        entries: dict = {}
+        if data:
+            for item in data:
+                val = item['Value'].decode("utf-8") if isinstance(item['Value'], bytes) else item['Value']
+                entries[item['Key']] = (val, item['ModifyIndex'])
+        return int(index) if index is not None else None, entries if entries else None
+
+    def watch(self, key: str, callback, index: int = None, wait: str = CONSUL_WATCH_WAIT,
+              delta: bool = False) -> ConsulKvWatch:
+        """
+        Watch all the keys under key with consul blocking queries on a
+        background thread, callback(index, data) is called with the same
+        data as get(key) every time the values change. Without index the
+        callback is first called with the current values before returning.
+        One watch is shared by all the callbacks of a key.
+
+        Args:
+            key (str): Key.
+            callback (Callable[[int, dict], None]): subscriber.
+            index (int): consul index of values already known to the caller.
+            wait (str): maximum time a blocking query waits for.
+            delta (bool): callback(index, changed, deleted) gets only the
+                changes, see ConsulKvWatch.subscribe.
+
+        Return:
+            ConsulKvWatch: watch on the key.
+        """
+        k = self._prepare_key(key)
+        with self._watch_lock:
+            watch = self._watches.get(k)
+            if watch is None:
+                watch = ConsulKvWatch(self, key, wait)
+                self._watches[k] = watch
+                watch.subscribe(callback, delta)
+                Log.debug(f"[consul-op] watching key: {k} from index: {index}")
+                watch.start(index)
+                return watch
+        watch.subscribe(callback, delta)
+        return watch
+
+    def unwatch(self, key: str, callback) -> None:
+        """
+        Remove callback added by watch, watch is stopped with its last callback
+        and its thread is done when unwatch returns.
+
+        Args:
+            key (str): Key.
+            callback (Callable[[int, dict], None]): subscriber.
+        """
+        k = self._prepare_key(key)
+        with self._watch_lock:
+            watch = self._watches.get(k)
+            if watch is None or watch.unsubscribe(callback) != 0:
+                return
+            del self._watches[k]
+        # Stop waits for the watch thread, subscribers on it may need the lock
+        watch.stop()
+
     def delete(self, key: str = "", recurse: bool = False):
         """
         Delete values.
@@ -242,10 +418,8 @@ class ConsulKvStore:
         if self._enable_batch_put:
             Log.debug(f"[consul-op] deleting value for key: {k} from cache, recursively : {recurse}.")
             if recurse:
-                for key in list(self._payload.keys()):
-                    if key.startswith(k):
-                        Log.debug(f"[consul-op] deleting key: {key} from cache.")
-                        del self._payload[key]
+                deleted = self._payload.delete_prefix(k)
+                Log.debug(f"[consul-op] deleted keys: {deleted} from cache.")
                 # let it continue to delete all the matching keys from consul also
             else:
                  if k in self._payload:
@@ -254,35 +428,53 @@ class ConsulKvStore:
                 # let it continue to delete the same key from consul if exist.
 
         Log.debug(f"[consul-op] deleting key value: {k}")
+        ConsulKvStore._invalidate_keys(k, recurse)
         self._consul.kv.delete(k, recurse=recurse)
         Log.debug(f"[consul-op] deleted Key value: {data}")
         return data
 
-    def get_keys(self, prefix):
+    @staticmethod
+    def _invalidate_keys(key: str, recurse: bool = False) -> None:
+        """
+        Drop the get_keys results the key written or deleted is part of.
+
+        Args:
+            key (str): full consul key.
+            recurse (bool): all the keys under key are deleted.
+        """
+        with ConsulKvStore._keys_lock:
+            for prefix in list(ConsulKvStore._keys):
+                if key.startswith(prefix) or (recurse and prefix.startswith(key)):
+                    del ConsulKvStore._keys[prefix]
+
+    def get_keys(self, prefix, ttl: float = CONSUL_KEYS_CACHE_TTL):
         """
         Get list of values match with given prefix.
-        The requested keys will be stored with prefix for reference.
+        The requested keys will be stored with prefix for reference, until
+        a key under prefix is written or deleted through a ConsulKvStore of
+        this process or ttl is over. ttl covers writes by other processes.
         Args:
             prefix(str): Prefix that matches with keys
+            ttl(float): seconds the keys are reused for, None for no expiry.
         Return:
             List of keys
         """
-        if not ConsulKvStore._keys.get(prefix):
+        with ConsulKvStore._keys_lock:
+            expiry, keys = ConsulKvStore._keys.get(prefix, (None, None))
+        if keys is not None and (expiry is None or expiry > time.monotonic()):
+            return keys
 
-            # get cached keys if batch put is enabled
-            payload_keys = None
-            if self._enable_batch_put:
-                # Using dictionary comprehension + startswith()
-                # Prefix key match in dictionary
-                payload_keys = [key for key in self._payload if key.startswith(prefix)]
+        keys = self._consul.kv.get(prefix, keys=True)[1] or []
 
-            ConsulKvStore._keys[prefix] = self._consul.kv.get(prefix, keys=True)[1]
-
-            # Merge lists with unique values
+        # Merge cached keys if batch put is enabled
+        if self._enable_batch_put:
+            payload_keys = self._payload.keys_with_prefix(prefix)
             if payload_keys:
-                ConsulKvStore._keys[prefix] = list(set(payload_keys + ConsulKvStore._keys[prefix]))
+                keys = list(set(payload_keys + keys))
 
-        return ConsulKvStore._keys[prefix]
+        with ConsulKvStore._keys_lock:
+            ConsulKvStore._keys[prefix] = (time.monotonic() + ttl if ttl is not None else None, keys)
+        return keys
 
     def _kv_put_in_transaction(self, tx_payload: List[TxPutKV]):
         """
@@ -301,10 +493,9 @@ class ConsulKvStore:
             Returns:
                 Dict[str, Any]: consul transaction understandable dict contains inout values.
             """
-            b64: bytes = b64encode(v.value.encode())
-            b64_str = b64.decode()
+            b64_str = b64encode(v.value.encode()).decode() if v.value is not None else None
 
-            if v.cas:
+            if v.cas is not None:
                 return {
                     'KV': {
                         'Key': v.key,
@@ -327,21 +518,79 @@ class ConsulKvStore:
         except (ConsulException, HTTPError, RequestException) as e:
             raise Exception('Failed to put values in consul KV.') from e
 
-    def commit(self):
+    def _commit_chunk(self, tx_payload: List[TxPutKV], retries: int, retry_delay: float) -> TxResult:
+        """
+        Put one transaction, retried with exponential backoff on connection
+        errors. Rejected transaction(ex. CAS index mismatch) is not retried.
+        """
+        keys = [v.key for v in tx_payload]
+        attempt = 0
+        while True:
+            attempt += 1
+            try:
+                self._kv_put_in_transaction(tx_payload)
+                return TxResult(keys=keys, success=True, attempts=attempt, error=None)
+            except Exception as e:
+                if isinstance(e.__cause__, ClientError) or attempt > retries:
+                    Log.error(f"Consul transaction of {len(keys)} keys failed after {attempt} attempts: {e.__cause__ or e}")
+                    return TxResult(keys=keys, success=False, attempts=attempt, error=str(e.__cause__ or e))
+                Log.warn(f"Consul transaction of {len(keys)} keys failed, retrying. Error: {e.__cause__ or e}")
+                time.sleep(retry_delay * (2 ** (attempt - 1)))
+
+    def commit(self, cas: Dict[str, int] = None, parallel: int = CONSUL_TXN_PARALLEL,
+               retries: int = CONSUL_TXN_RETRY_COUNT, retry_delay: float = CONSUL_TXN_RETRY_DELAY,
+               keys: List[str] = None) -> List[TxResult]:
         """
         In case if _enable_batch_put is set to True
         This function put all the values from local dict to consul store
-        through transaction in one call
+        through transactions of at most CONSUL_TXN_MAX_OPS keys each, sent
+        in parallel. Transactions are not atomic together, values of failed
+        transactions are kept in local dict so commit can be called again.
+
+        Args:
+            cas (dict): {key: modify index}, keys are put only if not changed
+                after the index, 0 means key must not exist.
+            parallel (int): max transactions sent together.
+            retries (int): retries of a transaction on connection error.
+            retry_delay (float): delay(sec) before first retry, doubled for next.
+            keys (list): put only the values of these keys, other values are
+                kept in local dict. All the values are put if None.
+
+        Return:
+            List[TxResult]: result of each transaction.
 
         Raises:
-            Exception: If batch put is not enabled or failed to put key, value in consul
+            Exception: If batch put is not enabled
+            ConsulTxnException: If failed to put key, value in consul
         """
         if not self._enable_batch_put:
             raise Exception("Batch put is not enabled.")
+        cas_index = {self._prepare_key(key): index for key, index in (cas or {}).items()}
+        if keys is None:
+            payload = self._payload.items()
+        else:
+            prepared_keys = [self._prepare_key(key) for key in keys]
+            payload = [(key, self._payload[key]) for key in prepared_keys if key in self._payload]
         tx_payload = []
-        for key, val in self._payload.items():
-            tx_payload.append(TxPutKV(key=key, value=val, cas=None))
-
-        Log.debug(f"putting data in consul, key and values: {tx_payload}")
-        self._kv_put_in_transaction(tx_payload)
-        self._payload.clear()
+        for key, val in payload:
+            tx_payload.append(TxPutKV(key=key, value=val, cas=cas_index.get(key)))
+        chunks = [tx_payload[start:start + CONSUL_TXN_MAX_OPS]
+                  for start in range(0, len(tx_payload), CONSUL_TXN_MAX_OPS)]
+
+        Log.debug(f"putting data in consul with {len(chunks)} transactions, key and values: {tx_payload}")
+        if len(chunks) > 1 and parallel > 1:
+            with ThreadPoolExecutor(max_workers=min(parallel, len(chunks))) as executor:
+                results = list(executor.map(lambda chunk: self._commit_chunk(chunk, retries, retry_delay), chunks))
+        else:
+            results = [self._commit_chunk(chunk, retries, retry_delay) for chunk in chunks]
+
+        failed = [result for result in results if not result.success]
+        for result in results:
+            if result.success:
+                for key in result.keys:
+                    del self._payload[key]
+        if failed:
+            raise ConsulTxnException(f"Failed to put {sum(len(result.keys) for result in failed)} values "
+                                     f"in {len(failed)} of {len(results)} consul transactions. "
+                                     f"Error: {failed[0].error}", results)
+        return results
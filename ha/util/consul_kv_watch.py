@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+from threading import Event, Lock, Thread, current_thread
+from typing import Callable
+
+from cortx.utils.log import Log
+from ha import const
+
+class ConsulKvWatch:
+    """
+    Watch all the keys under a prefix of ConsulKvStore with consul blocking
+    queries. Runs one background thread per watched prefix and calls every
+    subscriber with (index, data) when the consul index changes, data is
+    same as the ConsulKvStore.get output. Subscribers are called on the
+    watch thread, before the next blocking query is sent.
+
+    Use ConsulKvStore.watch to create it, a prefix is watched only once per
+    store and all the subscribers share the thread.
+
+    Consul returns all the values under the prefix for every change, the
+    modify index of each value tells which ones changed, so delta
+    subscribers get only the changed and deleted keys.
+    """
+
+    def __init__(self, store, key: str, wait: str = const.CONSUL_WATCH_WAIT):
+        """
+        Init method.
+
+        Args:
+            store (ConsulKvStore): store to watch.
+            key (str): keys under this prefix are watched.
+            wait (str): max wait of the consul blocking query.
+        """
+        self._store = store
+        self._key = key
+        self._wait = wait
+        # [(callback, delta)]
+        self._callbacks: list = []
+        self._index = None
+        # {key: (value, modify index)} of the last values seen
+        self._entries: dict = {}
+        # Values in get output format, built from _entries when required
+        self._data = None
+        self._loaded = False
+        self._lock = Lock()
+        self._stop = Event()
+        self._thread = None
+
+    @property
+    def index(self) -> int:
+        """
+        Consul index of the last values seen by the watch.
+        """
+        return self._index
+
+    def subscribe(self, callback: Callable, delta: bool = False) -> None:
+        """
+        Add subscriber. If the values are already loaded it is called
+        immediately with them, so it does not have to wait for a change.
+
+        Args:
+            callback (Callable): callback(index, data), or for delta
+                callback(index, changed, deleted) where changed is {key: value}
+                and deleted the list of keys removed. deleted is None when
+                changed has all the values, which then replace the known ones.
+            delta (bool): callback gets only the changes.
+        """
+        with self._lock:
+            self._callbacks.append((callback, delta))
+            loaded, index, data = self._loaded, self._index, self._get_data()
+        if loaded:
+            if delta:
+                callback(index, data or {}, None)
+            else:
+                callback(index, data)
+
+    def unsubscribe(self, callback: Callable[[int, dict], None]) -> int:
+        """
+        Remove subscriber.
+
+        Return:
+            int: number of subscribers left.
+        """
+        with self._lock:
+            self._callbacks = [item for item in self._callbacks if item[0] != callback]
+            return len(self._callbacks)
+
+    def start(self, index: int = None) -> None:
+        """
+        Start watching. Without index the current values are read first and
+        pushed to the subscribers before start returns, with index only the
+        changes after it are pushed.
+        """
+        self._stop.clear()
+        self._index = index
+        if index is None:
+            try:
+                self._poll(None)
+            except Exception as e:
+                Log.warn(f"Consul watch on {self._key} could not load values, retrying. Error: {e}")
+        self._thread = Thread(target=self._run, name=f"consul-watch-{self._key}", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """
+        Stop watching. Waits for the blocking query in progress to return, at
+        most its wait time, so subscribers are not called after stop returns.
+        """
+        self._stop.set()
+        thread = self._thread
+        if thread is None or thread is current_thread():
+            return
+        # consul adds up to wait/16 to the wait time of a blocking query
+        wait = ConsulKvWatch._get_seconds(self._wait)
+        thread.join(wait + wait / 16 + 1)
+        if thread.is_alive():
+            Log.warn(f"Consul watch on {self._key} did not stop in time.")
+
+    @staticmethod
+    def _get_seconds(wait: str) -> float:
+        """
+        Get seconds of a consul wait time, ex. "500ms", "30s" or "5m".
+        """
+        for unit, seconds in (("ms", 0.001), ("s", 1), ("m", 60)):
+            if wait.endswith(unit):
+                return float(wait[:-len(unit)]) * seconds
+        return float(wait)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._poll(self._index, self._wait)
+            except Exception as e:
+                Log.warn(f"Consul watch on {self._key} failed, retrying. Error: {e}")
+                self._stop.wait(const.CONSUL_WATCH_RETRY_INTERVAL)
+
+    def _poll(self, index: int, wait: str = None) -> None:
+        """
+        Run one (blocking) query and notify subscribers if values changed.
+        """
+        new_index, entries = self._store.get_entries_with_index(self._key, index=index, wait=wait)
+        entries = entries or {}
+        if self._stop.is_set():
+            return
+        if new_index is not None and index is not None and new_index < index:
+            # Consul index went backwards(ex. snapshot restore), reload everything.
+            Log.info(f"Consul index for {self._key} reset from {index} to {new_index}.")
+            self._index = None
+            self._loaded = False
+            return
+        if self._loaded and new_index == self._index:
+            return
+        with self._lock:
+            if self._loaded and self._index is not None:
+                changed, deleted = ConsulKvWatch._get_changes(self._entries, self._index, entries)
+            else:
+                changed, deleted = None, None
+            self._index, self._entries, self._data, self._loaded = new_index, entries, None, True
+            callbacks = list(self._callbacks)
+            data = self._get_data() if deleted is None or not all(delta for _, delta in callbacks) else None
+        for callback, delta in callbacks:
+            try:
+                if not delta:
+                    callback(new_index, data)
+                elif deleted is None:
+                    callback(new_index, data or {}, None)
+                else:
+                    callback(new_index, changed, deleted)
+            except Exception as e:
+                Log.error(f"Consul watch subscriber for {self._key} failed. Error: {e}")
+
+    def _get_data(self) -> dict:
+        """
+        Get the last values in get output format, None if there are none.
+        """
+        if self._data is None and self._entries:
+            self._data = {key: val for key, (val, _) in self._entries.items()}
+        return self._data
+
+    @staticmethod
+    def _get_changes(previous: dict, index: int, entries: dict) -> tuple:
+        """
+        Get values modified after index and keys deleted. Keys are compared
+        with the previous ones only if the counts show that some were deleted.
+
+        Return:
+            (dict, list): {key: value} changed, list of deleted keys.
+        """
+        changed = {key: val for key, (val, modify_index) in entries.items() if modify_index > index}
+        created = sum(1 for key in changed if key not in previous)
+        if len(previous) + created == len(entries):
+            return changed, []
+        return changed, [key for key in previous if key not in entries]
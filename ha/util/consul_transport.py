@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+import re
+import time
+from threading import Lock
+from urllib.parse import parse_qs, urlparse
+
+import consul
+import requests
+from requests.adapters import HTTPAdapter
+from requests.exceptions import RequestException
+
+from cortx.utils.log import Log
+from ha import const
+
+def _wait_seconds(wait: str) -> float:
+    """
+    Convert consul wait(ex. "30s", "500ms", "5m") to seconds.
+    """
+    match = re.fullmatch(r"(\d+)(ms|s|m|h)?", wait or "")
+    if not match:
+        return 0
+    value, unit = int(match.group(1)), match.group(2) or "s"
+    return value * {"ms": 0.001, "s": 1, "m": 60, "h": 3600}[unit]
+
+class ConsulSession(requests.Session):
+    """
+    HTTP session shared by all the consul clients of the process.
+    Connections are kept alive and reused, at most pool_size idle
+    connections are kept per consul server, more connections are opened
+    when needed(ex. by blocking queries) but closed after use. Requests without timeout get
+    (connect_timeout, read_timeout), blocking queries get their wait time
+    and consul jitter(wait/16) added to the read timeout.
+    """
+
+    def __init__(self, pool_size: int, connect_timeout: float, read_timeout: float):
+        super().__init__()
+        self._pool_size = pool_size
+        self._connect_timeout = connect_timeout
+        self._read_timeout = read_timeout
+        self._adapter = HTTPAdapter(pool_connections=const.CONSUL_POOL_SERVERS, pool_maxsize=pool_size, max_retries=0)
+        self.mount("http://", self._adapter)
+        self.mount("https://", self._adapter)
+        self._lock = Lock()
+        self._requests = 0
+        self._errors = 0
+        self._in_flight = 0
+        self._max_in_flight = 0
+        self._elapsed = 0.0
+
+    def _timeout(self, url: str) -> tuple:
+        read_timeout = self._read_timeout
+        wait = parse_qs(urlparse(url).query).get("wait")
+        if wait:
+            read_timeout += _wait_seconds(wait[-1]) * 17 / 16
+        return (self._connect_timeout, read_timeout)
+
+    def request(self, method, url, *args, **kwargs):
+        if kwargs.get("timeout") is None:
+            kwargs["timeout"] = self._timeout(url)
+        with self._lock:
+            self._requests += 1
+            self._in_flight += 1
+            self._max_in_flight = max(self._max_in_flight, self._in_flight)
+        start = time.monotonic()
+        try:
+            return super().request(method, url, *args, **kwargs)
+        except RequestException:
+            with self._lock:
+                self._errors += 1
+            raise
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+                self._elapsed += time.monotonic() - start
+
+    def stats(self) -> dict:
+        """
+        Get request and connection pool statistics.
+        """
+        connections = pool_requests = idle = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            connections += pool.num_connections
+            pool_requests += pool.num_requests
+            queue = getattr(pool.pool, "queue", None)
+            if queue is not None:
+                idle += sum(1 for conn in list(queue) if conn is not None)
+        with self._lock:
+            return {"pool_size": self._pool_size, "requests": self._requests, "errors": self._errors,
+                    "in_flight": self._in_flight, "max_in_flight": self._max_in_flight,
+                    "avg_latency": self._elapsed / self._requests if self._requests else 0,
+                    "connections_created": connections, "idle_connections": idle,
+                    "pool_requests": pool_requests}
+
+class ConsulTransport:
+    """
+    Process wide consul transport. All the consul clients are created with
+    get_client and share one ConsulSession, so a TCP connection is set up
+    only when no idle kept-alive connection is available.
+
+    Example:
+        ConsulTransport.configure(pool_size=16)
+        client = ConsulTransport.get_client("consul.srv", 8500)
+        ConsulTransport.stats()
+    """
+
+    _session: ConsulSession = None
+    _clients: dict = {}
+    _lock = Lock()
+    _pool_size: int = const.CONSUL_POOL_SIZE
+    _connect_timeout: float = const.CONSUL_CONNECT_TIMEOUT
+    _read_timeout: float = const.CONSUL_READ_TIMEOUT
+
+    @staticmethod
+    def configure(pool_size: int = None, connect_timeout: float = None, read_timeout: float = None) -> None:
+        """
+        Set pool size and timeouts. Clients already created are moved to a
+        new session if anything changed.
+
+        Args:
+            pool_size (int): max idle connections kept per consul server.
+            connect_timeout (float): seconds to wait for a connection.
+            read_timeout (float): seconds to wait for a response, in addition
+                to the wait time of blocking queries.
+        """
+        with ConsulTransport._lock:
+            config = (pool_size or ConsulTransport._pool_size,
+                      connect_timeout or ConsulTransport._connect_timeout,
+                      read_timeout or ConsulTransport._read_timeout)
+            if config == (ConsulTransport._pool_size, ConsulTransport._connect_timeout, ConsulTransport._read_timeout):
+                return
+            ConsulTransport._pool_size, ConsulTransport._connect_timeout, ConsulTransport._read_timeout = config
+            old_session = ConsulTransport._session
+            if old_session is not None:
+                ConsulTransport._session = ConsulSession(*config)
+                for client in ConsulTransport._clients.values():
+                    client.http.session = ConsulTransport._session
+        Log.info(f"Consul transport pool size: {config[0]}, timeouts(sec) connect: {config[1]} read: {config[2]}")
+        if old_session is not None:
+            old_session.close()
+
+    @staticmethod
+    def _get_session() -> ConsulSession:
+        if ConsulTransport._session is None:
+            ConsulTransport._session = ConsulSession(ConsulTransport._pool_size,
+                                                     ConsulTransport._connect_timeout,
+                                                     ConsulTransport._read_timeout)
+        return ConsulTransport._session
+
+    @staticmethod
+    def get_client(host: str = "localhost", port: int = 8500) -> consul.Consul:
+        """
+        Get consul client of host and port, created once per process.
+        Default localhost:8500 also honours CONSUL_HTTP_ADDR.
+        """
+        key = (host, str(port))
+        with ConsulTransport._lock:
+            client = ConsulTransport._clients.get(key)
+            if client is None:
+                if host == "localhost" and str(port) == "8500":
+                    client = consul.Consul()
+                else:
+                    client = consul.Consul(host=host, port=port)
+                client.http.session.close()
+                client.http.session = ConsulTransport._get_session()
+                ConsulTransport._clients[key] = client
+        return client
+
+    @staticmethod
+    def stats() -> dict:
+        """
+        Get request and connection pool statistics of the shared session.
+        """
+        with ConsulTransport._lock:
+            session = ConsulTransport._get_session()
+        return session.stats()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import ast
+import json
+
+from ha import const
+
+def encode_event(event) -> str:
+    """
+    Encode event to the canonical wire format, compact json with sorted keys
+    and the wire format version at top level.
+
+    Args:
+        event (dict/str): event dict or its json, ex. HealthEvent.json.
+
+    Return:
+        str: message to be published.
+    """
+    if isinstance(event, (str, bytes)):
+        event = decode_event(event)
+    message = dict(event)
+    message[const.EVENT_WIRE_VERSION_KEY] = const.EVENT_WIRE_VERSION
+    return json.dumps(message, sort_keys=True, separators=(",", ":"))
+
+def decode_event(message) -> dict:
+    """
+    Decode event published by encode_event. Messages of the earlier monitor,
+    json without version or str(dict), are accepted as well so the monitor
+    and fault tolerance can be upgraded in any order. A decoded dict is
+    returned as it is, so it can be passed instead of the message.
+
+    Args:
+        message (str/bytes/dict): message received from message bus.
+
+    Raises:
+        ValueError: message is not an event or its version is not supported.
+
+    Return:
+        dict: event without the version key.
+    """
+    if isinstance(message, dict):
+        return message
+    if isinstance(message, bytes):
+        message = message.decode('utf-8')
+    try:
+        event = json.loads(message)
+    except ValueError:
+        # Earlier k8s monitor published str(dict)
+        try:
+            event = ast.literal_eval(message)
+        except (ValueError, SyntaxError) as e:
+            raise ValueError(f"Invalid event message. Error: {e}")
+    if not isinstance(event, dict):
+        raise ValueError(f"Invalid event message, expected dict got {type(event).__name__}")
+    version = event.pop(const.EVENT_WIRE_VERSION_KEY, 0)
+    if not isinstance(version, int) or version > const.EVENT_WIRE_VERSION:
+        raise ValueError(f"Event wire format version {version} is not supported, "
+                         f"max supported version is {const.EVENT_WIRE_VERSION}")
+    return event
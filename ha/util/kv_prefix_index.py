@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+from typing import Any, Iterator, List, Tuple
+
+from ha.const import HA_DELIM
+
+class _Node:
+    """
+    Trie node for one part of the key.
+    """
+    __slots__ = ("children", "key", "count")
+
+    def __init__(self):
+        self.children: dict = {}
+        # Full key if a key ends at this node
+        self.key: str = None
+        # Number of keys ending at this node or below
+        self.count: int = 0
+
+class KvPrefixIndex:
+    """
+    Dictionary of key values with prefix lookups. Keys are indexed in a trie
+    of their delimiter separated parts, so a prefix lookup visits only the
+    keys under the prefix instead of scanning all of them.
+
+    Prefix match is same as str.startswith, ex. "node>n1" matches
+    "node>n1>health" and "node>n10>health".
+
+    Example:
+        index = KvPrefixIndex()
+        index["cortx>ha>node>n1>health"] = "online"
+        index.keys_with_prefix("cortx>ha>node")
+    """
+
+    def __init__(self, delim: str = HA_DELIM):
+        self._delim = delim
+        self._data: dict = {}
+        self._root = _Node()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._data
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        if key not in self._data:
+            node = self._root
+            node.count += 1
+            for part in key.split(self._delim):
+                child = node.children.get(part)
+                if child is None:
+                    child = node.children[part] = _Node()
+                child.count += 1
+                node = child
+            node.key = key
+        self._data[key] = value
+
+    def __delitem__(self, key: str) -> None:
+        del self._data[key]
+        path = [self._root]
+        for part in key.split(self._delim):
+            path.append(path[-1].children[part])
+        path[-1].key = None
+        for node in path:
+            node.count -= 1
+        parts = key.split(self._delim)
+        for depth in range(len(parts), 0, -1):
+            if path[depth].count == 0:
+                del path[depth - 1].children[parts[depth - 1]]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return self._data.get(key, default)
+
+    def pop(self, key: str, *default) -> Any:
+        if key in self._data:
+            value = self._data[key]
+            del self[key]
+            return value
+        if default:
+            return default[0]
+        raise KeyError(key)
+
+    def keys(self):
+        return self._data.keys()
+
+    def items(self):
+        return self._data.items()
+
+    def clear(self) -> None:
+        self._data.clear()
+        self._root = _Node()
+
+    def _prefix_nodes(self, prefix: str) -> List[_Node]:
+        """
+        Get the trie nodes having all the keys starting with prefix.
+        """
+        parts = prefix.split(self._delim)
+        node = self._root
+        for part in parts[:-1]:
+            node = node.children.get(part)
+            if node is None:
+                return []
+        last = parts[-1]
+        if not last:
+            # Prefix ends with delimiter, keys below node but not node itself.
+            return list(node.children.values())
+        return [child for name, child in node.children.items() if name.startswith(last)]
+
+    def has_prefix(self, prefix: str) -> bool:
+        """
+        Check if any key starts with prefix.
+        """
+        if not prefix:
+            return bool(self._data)
+        return any(node.count for node in self._prefix_nodes(prefix))
+
+    def keys_with_prefix(self, prefix: str) -> List[str]:
+        """
+        Get all the keys starting with prefix.
+        """
+        if not prefix:
+            return list(self._data)
+        keys = []
+        stack = self._prefix_nodes(prefix)
+        while stack:
+            node = stack.pop()
+            if node.key is not None:
+                keys.append(node.key)
+            stack.extend(node.children.values())
+        return keys
+
+    def items_with_prefix(self, prefix: str) -> List[Tuple[str, Any]]:
+        """
+        Get (key, value) of all the keys starting with prefix.
+        """
+        return [(key, self._data[key]) for key in self.keys_with_prefix(prefix)]
+
+    def delete_prefix(self, prefix: str) -> List[str]:
+        """
+        Delete all the keys starting with prefix.
+
+        Return:
+            List[str]: deleted keys.
+        """
+        keys = self.keys_with_prefix(prefix)
+        for key in keys:
+            del self[key]
+        return keys
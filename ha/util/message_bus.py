@@ -18,7 +18,7 @@
 import json
 import time
 from typing import Callable
-from threading import Thread, Event
+from threading import Condition, Event, Lock, Thread
 from cortx.utils.conf_store.conf_store import Conf
 from cortx.utils.log import Log
 from cortx.utils.message_bus import MessageBusAdmin
@@ -32,17 +32,39 @@ from ha.k8s_setup.const import MESSAGE_BUS_RETRY_COUNT, MESSAGE_BUS_SLEEP_TIME
 class MessageBusProducer:
     PRODUCER_METHOD = "sync"
 
-    def __init__(self, producer_id: str, message_type: str, partitions: int):
+    def __init__(self, producer_id: str, message_type: str, partitions: int,
+                 batch_size: int = const.MESSAGE_BUS_BATCH_SIZE, batch_timeout: int = const.MESSAGE_BUS_BATCH_TIMEOUT):
         """
         Register message types with message bus.
         Args:
             producer_id (str): producer id.
             message_types (str): Message type.
             partitions (int, optional): No. of partitions. Defaults to 1.
+            batch_size (int, optional): Max messages sent together by publish_async.
+            batch_timeout (int, optional): Max time(ms) publish_async holds a message.
         Raises:
             MessageBusError: Message bus error.
         """
         self.producer = MessageProducer(producer_id=producer_id, message_type=message_type, method=MessageBusProducer.PRODUCER_METHOD)
+        self.message_type = message_type
+        self._batch_size = batch_size
+        self._batch_timeout = batch_timeout / 1000
+        self._pending: list = []
+        # _send_lock is held while taking and sending a batch, so batches are
+        # sent in order. _pending_cond protects _pending only.
+        self._send_lock = Lock()
+        self._pending_cond = Condition()
+        self._flush_thread = None
+
+    @staticmethod
+    def _to_list(message: any) -> list:
+        if isinstance(message, dict):
+            return [json.dumps(message)]
+        elif isinstance(message, str):
+            return [message]
+        elif isinstance(message, list):
+            return message
+        raise Exception(f"Invalid type of message {message}")
 
     def publish(self, message: any):
         """
@@ -53,14 +75,60 @@ class MessageBusProducer:
             If msg is string then it will be send directly.
             If message is list, it should have all string element, all items will be published.
         """
-        if isinstance(message, dict):
-            self.producer.send([json.dumps(message)])
-        elif isinstance(message, str):
-            self.producer.send([message])
-        elif isinstance(message, list):
-            self.producer.send(message)
-        else:
-            raise Exception(f"Invalid type of message {message}")
+        messages = MessageBusProducer._to_list(message)
+        with self._send_lock:
+            # Keep order with messages queued by publish_async
+            self._send_pending()
+            self.producer.send(messages)
+
+    def publish_async(self, message: any):
+        """
+        Queue message and return, queued messages are sent together once
+        batch_size messages are queued or batch_timeout is over.
+        Use flush to wait for them to be sent.
+        Args:
+            message (any): Message, same as publish.
+        """
+        messages = MessageBusProducer._to_list(message)
+        with self._pending_cond:
+            self._pending.extend(messages)
+            if self._flush_thread is None:
+                self._flush_thread = Thread(target=self._run_flush, name=f"{self.message_type}-producer-thread", daemon=True)
+                self._flush_thread.start()
+            if len(self._pending) >= self._batch_size:
+                self._pending_cond.notify()
+
+    def flush(self):
+        """
+        Send all the messages queued by publish_async before returning.
+        Raises:
+            MessageBusError: Message bus error, messages are kept queued.
+        """
+        with self._send_lock:
+            self._send_pending()
+
+    def _send_pending(self):
+        with self._pending_cond:
+            messages, self._pending = self._pending, []
+        if not messages:
+            return
+        try:
+            self.producer.send(messages)
+        except Exception:
+            with self._pending_cond:
+                self._pending[:0] = messages
+            raise
+
+    def _run_flush(self):
+        while True:
+            with self._pending_cond:
+                self._pending_cond.wait_for(lambda: len(self._pending) > 0)
+                self._pending_cond.wait_for(lambda: len(self._pending) >= self._batch_size, timeout=self._batch_timeout)
+            try:
+                self.flush()
+            except Exception as e:
+                Log.error(f"Failed to publish {self.message_type} messages, retrying. Error: {e}")
+                time.sleep(self._batch_timeout)
 
 class CONSUMER_STATUS:
     SUCCESS = "success"
@@ -71,7 +139,9 @@ class CONSUMER_STATUS:
 class MessageBusConsumer:
 
     def __init__(self, consumer_id: int, consumer_group: str, message_type: str,
-                callback: Callable, auto_ack: bool, offset: str, timeout: int):
+                callback: Callable, auto_ack: bool, offset: str, timeout: int,
+                batch_size: int = 1, batch_timeout: int = const.MESSAGE_BUS_BATCH_TIMEOUT,
+                batch_callback: Callable = None):
         """
         Initalize consumer.
         Args:
@@ -81,8 +151,15 @@ class MessageBusConsumer:
             callback (Callable): function to get message.
             auto_ack (bool, optional): Check auto ack. Defaults to False.
             offset (str, optional): Offset for messages. Defaults to "earliest".
+            batch_size (int, optional): Max messages received before ack. 1 disables batching.
+            batch_timeout (int, optional): Max time(ms) to wait for a batch to fill.
+            batch_callback (Callable, optional): function to get list of messages.
+                Defaults to calling callback for each message of the batch.
         """
         self.callback = callback
+        self.batch_callback = batch_callback if batch_callback is not None else self._process_batch
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout / 1000
         self._stop = Event()
         self.flush_on_exit = False
         self.consumer_id = consumer_id
@@ -110,7 +187,18 @@ class MessageBusConsumer:
 
         As self.consumer.receive(timeout) is block call t1.join() will not stop thread.
         Stop thread by completing work as per above cases.
+
+        With batch_size > 1 the batch callback gets a list of messages and its
+        status applies to the whole batch, which is acked once.
         """
+        if self.batch_size > 1:
+            self._run_batch()
+        else:
+            self._run()
+        if self.flush_on_exit:
+            self._flush()
+
+    def _run(self):
         retry = False
         while not self._stop.is_set():
             try:
@@ -142,22 +230,100 @@ class MessageBusConsumer:
             except Exception as e:
                 Log.error(f"Supressing exception from message bus {e}")
                 retry = False
-        if self.flush_on_exit:
-            # we do not expect any messages to be present in the message bus at this point
-            # since previously received cluster stop would have ensured that message bus is empty
-            # here we are makeing sure that messages in message bus are flushed,
-            # so when next time consumer starts it will not read stale messages.
-            Log.info(f"flush pending messages of type {self.message_type}.")
-            while True:
-                # needs to set minimum feasible timeout but,
-                # setting 0 will block the call for indefinite time,
-                # hence setting to 1.
-                message = self.consumer.receive(timeout=1)
-                if message is None:
+
+    def _receive_batch(self) -> list:
+        """
+        Receive up to batch_size messages, waits at most batch_timeout
+        for more messages once the first one is received.
+        """
+        # setting some default timeout as 0 will block the call for indefinite time
+        message = self.consumer.receive(timeout=const.CORTX_HA_WAIT_TIMEOUT)
+        if message is None:
+            return []
+        batch = [message]
+        deadline = time.monotonic() + self.batch_timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            message = self.consumer.receive(timeout=remaining)
+            if message is None:
+                break
+            batch.append(message)
+        return batch
+
+    def _run_batch(self):
+        """
+        Same as _run but for a batch of messages. As all the messages of the
+        batch are acked together, messages received after the one returning
+        SUCCESS_STOP are acked without processing.
+        """
+        batch = []
+        while not self._stop.is_set():
+            try:
+                if not batch:
+                    batch = self._receive_batch()
+                    if not batch:
+                        continue
+                # Stop may be requested while waiting for messages, batch is
+                # left unacked so it is received again after restart.
+                if self._stop.is_set():
                     break
-                else:
-                    Log.info(f"flushing message: {message}.")
+                try:
+                    status = self.batch_callback(batch)
+                except Exception as e:
+                    Log.error(f"Caught exception from caller: {e}. retry again ...")
+                    continue
+                if status == CONSUMER_STATUS.SUCCESS:
+                    self.consumer.ack()
+                elif status == CONSUMER_STATUS.FAILED_STOP:
+                    break
+                elif status == CONSUMER_STATUS.SUCCESS_STOP:
                     self.consumer.ack()
+                    break
+                else:
+                    continue
+                batch = []
+            except Exception as e:
+                Log.error(f"Supressing exception from message bus {e}")
+                batch = []
+
+    def _process_batch(self, batch: list) -> str:
+        """
+        Default batch callback, calls callback for each message in order.
+        Message returning FAILED is retried before moving to the next one,
+        messages already processed are not given to callback again on retry.
+        """
+        while batch:
+            if self._stop.is_set():
+                return CONSUMER_STATUS.FAILED_STOP
+            try:
+                status = self.callback(batch[0])
+            except Exception as e:
+                Log.error(f"Caught exception from caller: {e}. retry again ...")
+                continue
+            if status in (CONSUMER_STATUS.FAILED_STOP, CONSUMER_STATUS.SUCCESS_STOP):
+                return status
+            if status == CONSUMER_STATUS.SUCCESS:
+                del batch[0]
+        return CONSUMER_STATUS.SUCCESS
+
+    def _flush(self):
+        # we do not expect any messages to be present in the message bus at this point
+        # since previously received cluster stop would have ensured that message bus is empty
+        # here we are makeing sure that messages in message bus are flushed,
+        # so when next time consumer starts it will not read stale messages.
+        Log.info(f"flush pending messages of type {self.message_type}.")
+        while True:
+            # needs to set minimum feasible timeout but,
+            # setting 0 will block the call for indefinite time,
+            # hence setting to 1.
+            message = self.consumer.receive(timeout=1)
+            if message is None:
+                break
+            else:
+                Log.info(f"flushing message: {message}.")
+                self.consumer.ack()
 
     def start(self):
         """
@@ -205,7 +371,9 @@ class MessageBus:
 
     @staticmethod
     def get_consumer(consumer_id: int, consumer_group: str, message_type: str,
-                callback: Callable, auto_ack: bool = False, offset: str = "earliest", timeout: int = 0) -> MessageBusConsumer:
+                callback: Callable, auto_ack: bool = False, offset: str = "earliest", timeout: int = 0,
+                batch_size: int = 1, batch_timeout: int = const.MESSAGE_BUS_BATCH_TIMEOUT,
+                batch_callback: Callable = None) -> MessageBusConsumer:
         """
         Get consumer.
         Args:
@@ -216,22 +384,30 @@ class MessageBus:
             auto_ack (bool, optional): Check auto ack. Defaults to False.
             offset (str, optional): Offset for messages. Defaults to "earliest".
             timeout (int, optional): Max wait time for thread to wait for a message. Default: timeout is 0 and so call is blocking
+            batch_size (int, optional): Max messages received and acked together. Default: 1, no batching.
+            batch_timeout (int, optional): Max time(ms) to wait for a batch to fill.
+            batch_callback (Callable, optional): callback function to process list of messages.
         """
-        return MessageBusConsumer(consumer_id, consumer_group, message_type, callback, auto_ack, offset, timeout)
+        return MessageBusConsumer(consumer_id, consumer_group, message_type, callback, auto_ack, offset, timeout,
+                                  batch_size, batch_timeout, batch_callback)
 
     @staticmethod
-    def get_producer(producer_id: str, message_type: str, partitions: int = 1) -> MessageBusProducer:
+    def get_producer(producer_id: str, message_type: str, partitions: int = 1,
+                     batch_size: int = const.MESSAGE_BUS_BATCH_SIZE,
+                     batch_timeout: int = const.MESSAGE_BUS_BATCH_TIMEOUT) -> MessageBusProducer:
         """
         Register message types with message bus. and get Producer.
         Args:
             producer_id (str): producer id.
             message_types (str): Message type.
             partitions (int, optional): No. of partitions. Defaults to 1.
+            batch_size (int, optional): Max messages sent together by publish_async.
+            batch_timeout (int, optional): Max time(ms) publish_async holds a message.
         Raises:
             MessageBusError: Message bus error.
         """
         MessageBus.register(message_type, partitions)
-        return MessageBusProducer(producer_id, message_type, partitions)
+        return MessageBusProducer(producer_id, message_type, partitions, batch_size, batch_timeout)
 
     @staticmethod
     def register(message_type: str, partitions: int = 1):
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+
+import math
+import socket
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from threading import Lock
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from cortx.utils.log import Log
+from ha import const
+
+class ProbeResult(NamedTuple):
+    """
+    Result of probing a node. detail is the resolved address, or the
+    reason if the probe failed.
+    """
+    ok: bool
+    detail: str = ""
+
+class NodeProbe:
+    """
+    Check reachability of nodes and resolve node names concurrently.
+    Every probe has its own deadline, so probing N unreachable nodes takes
+    about one timeout instead of N. Results can be cached, reachability
+    for cache_ttl and successful name resolution for resolve_cache_ttl.
+
+    Reachability is checked with one ICMP echo(ping) or with a tcp
+    connect to the given ports. A refused connection also proves the
+    node is up.
+
+    Example:
+        results = NodeProbe.get_instance().probe(["srvnode-1", "srvnode-2"])
+        if not results["srvnode-1"].ok:
+            ...
+    """
+
+    _instance = None
+    _instance_lock = Lock()
+
+    def __init__(self, method: str = const.NODE_PROBE_METHOD, timeout: float = const.NODE_PROBE_TIMEOUT,
+                 ports: Tuple[int, ...] = (const.PCSD_PORT,), parallel: int = const.NODE_PROBE_PARALLEL,
+                 cache_ttl: float = 0, resolve_cache_ttl: float = const.NODE_RESOLVE_CACHE_TTL,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Init method.
+
+        Args:
+            method (str): "icmp" or "tcp".
+            timeout (float): deadline(sec) of a single probe.
+            ports (tuple): ports tried by the tcp probe.
+            parallel (int): max probes running together.
+            cache_ttl (float): reachability cache ttl(sec), 0 disables it.
+            resolve_cache_ttl (float): name resolution cache ttl(sec), 0 disables it.
+            clock (Callable): monotonic clock, used by tests.
+        """
+        if method not in ("icmp", "tcp"):
+            raise ValueError(f"Invalid node probe method {method}")
+        self._probe_func = self._icmp_probe if method == "icmp" else self._tcp_probe
+        self._timeout = timeout
+        self._ports = ports
+        self._parallel = parallel
+        self._cache_ttl = cache_ttl
+        self._resolve_cache_ttl = resolve_cache_ttl
+        self._clock = clock
+        self._lock = Lock()
+        # {node: (result, expiry)}
+        self._reachable: Dict[str, Tuple[ProbeResult, float]] = {}
+        self._resolved: Dict[str, Tuple[ProbeResult, float]] = {}
+
+    @classmethod
+    def get_instance(cls) -> "NodeProbe":
+        """
+        Get probe shared by the process, reachability is cached for
+        NODE_PROBE_CACHE_TTL.
+        """
+        with cls._instance_lock:
+            if cls._instance is None:
+                cls._instance = NodeProbe(cache_ttl=const.NODE_PROBE_CACHE_TTL)
+            return cls._instance
+
+    def probe(self, nodes: List[str]) -> Dict[str, ProbeResult]:
+        """
+        Check if nodes are reachable.
+
+        Returns:
+            dict: {node: ProbeResult}
+        """
+        return self._run(self._probe_func, nodes, self._reachable, self._cache_ttl, cache_failed=True)
+
+    def resolve(self, hosts: List[str]) -> Dict[str, ProbeResult]:
+        """
+        Resolve host names to IPv4 addresses. Failures are not cached,
+        so a node added to DNS is picked up on the next call.
+
+        Returns:
+            dict: {host: ProbeResult}, detail is the address if resolved.
+        """
+        return self._run(self._resolve, hosts, self._resolved, self._resolve_cache_ttl, cache_failed=False)
+
+    def _run(self, func: Callable[[str], ProbeResult], nodes: List[str], cache: dict,
+             ttl: float, cache_failed: bool) -> Dict[str, ProbeResult]:
+        results: Dict[str, ProbeResult] = {}
+        now = self._clock()
+        with self._lock:
+            for node in nodes:
+                cached = cache.get(node)
+                if cached is not None and now < cached[1]:
+                    results[node] = cached[0]
+        pending = [node for node in dict.fromkeys(nodes) if node not in results]
+        if not pending:
+            return results
+        workers = min(self._parallel, len(pending))
+        # Probes queued behind the running ones get their own timeout too.
+        deadline = self._timeout * math.ceil(len(pending) / workers) + 1
+        pool = ThreadPoolExecutor(max_workers=workers)
+        try:
+            futures = {pool.submit(func, node): node for node in pending}
+            done, _ = wait(futures, timeout=deadline)
+        finally:
+            # Do not wait for the probes that missed the deadline.
+            pool.shutdown(wait=False)
+        expiry = self._clock() + ttl
+        with self._lock:
+            for future, node in futures.items():
+                if future not in done:
+                    results[node] = ProbeResult(False, "timed out")
+                    continue
+                try:
+                    results[node] = future.result()
+                except Exception as e:
+                    results[node] = ProbeResult(False, str(e))
+                if ttl > 0 and (cache_failed or results[node].ok):
+                    cache[node] = (results[node], expiry)
+        Log.debug(f"Probed {pending}: {results}")
+        return results
+
+    def _icmp_probe(self, node: str) -> ProbeResult:
+        cmd = ["ping", "-c", "1", "-W", str(max(1, math.ceil(self._timeout))), node]
+        try:
+            proc = subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+                                  timeout=self._timeout + 1)
+        except subprocess.TimeoutExpired:
+            return ProbeResult(False, "timed out")
+        if proc.returncode != 0:
+            return ProbeResult(False, f"ping failed with rc {proc.returncode}")
+        return ProbeResult(True)
+
+    def _tcp_probe(self, node: str) -> ProbeResult:
+        reason = "timed out"
+        end = time.monotonic() + self._timeout
+        for port in self._ports:
+            timeout = end - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                with socket.create_connection((node, port), timeout=timeout):
+                    return ProbeResult(True)
+            except ConnectionRefusedError:
+                # Node answered with reset, it is up but nothing listens on port.
+                return ProbeResult(True, f"port {port} refused")
+            except OSError as e:
+                reason = f"port {port}: {e}"
+        return ProbeResult(False, reason)
+
+    def _resolve(self, host: str) -> ProbeResult:
+        try:
+            return ProbeResult(True, socket.gethostbyname(host))
+        except (socket.gaierror, socket.herror) as e:
+            return ProbeResult(False, str(e))
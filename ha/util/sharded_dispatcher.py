@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+
+# Copyright (c) 2022 Seagate Technology LLC and/or its Affiliates
+#
+# This program is free software: you can redistribute it and/or modify it under the
+# terms of the GNU Affero General Public License as published by the Free Software
+# Foundation, either version 3 of the License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful, but WITHOUT ANY
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A
+# PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License along
+# with this program. If not, see <https://www.gnu.org/licenses/>. For any questions
+# about this software or licensing, please email opensource@seagate.com or
+# cortx-questions@seagate.com.
+
+from queue import Empty, Queue
+from threading import Condition, Event, Lock, Thread
+from typing import Callable, List
+
+from cortx.utils.log import Log
+from ha import const
+from ha.util.event_codec import decode_event
+from ha.util.message_bus import CONSUMER_STATUS
+
+def resource_key(message) -> tuple:
+    """
+    Get (resource_type, resource_id) of a message bus event or of an event
+    decoded by decode_event. Health events have them at top level and k8s
+    monitor alerts under payload. Returns None if the message can not be parsed.
+    """
+    try:
+        event = decode_event(message)
+        payload = event.get("payload", event)
+        return payload.get("resource_type"), payload.get("resource_id")
+    except Exception:
+        return None
+
+class _Batch:
+    """
+    Tracks the messages of one batch given to workers.
+    """
+
+    def __init__(self, count: int):
+        self.pending = count
+        self.statuses = set()
+        self._cond = Condition()
+
+    @property
+    def stopped(self) -> bool:
+        return CONSUMER_STATUS.FAILED_STOP in self.statuses
+
+    def done(self, status: str) -> None:
+        with self._cond:
+            self.statuses.add(status)
+            self.pending -= 1
+            if self.pending == 0:
+                self._cond.notify_all()
+
+    def wait(self) -> str:
+        with self._cond:
+            self._cond.wait_for(lambda: self.pending == 0)
+        if CONSUMER_STATUS.FAILED_STOP in self.statuses:
+            return CONSUMER_STATUS.FAILED_STOP
+        if CONSUMER_STATUS.SUCCESS_STOP in self.statuses:
+            return CONSUMER_STATUS.SUCCESS_STOP
+        return CONSUMER_STATUS.SUCCESS
+
+class ShardedDispatcher:
+    """
+    Process messages of a message bus batch on a pool of worker threads.
+    Each message is given to the worker selected by hash of its key, so
+    messages of a resource are processed in order by the same worker while
+    messages of other resources are processed in parallel.
+
+    dispatch is used as batch callback of MessageBusConsumer, it returns
+    once all the messages of the batch are done, so the batch is acked
+    only after all earlier messages are processed.
+
+    Each message is decoded once by dispatch, the key and the callback get the
+    decoded event. Message which can not be decoded is given as received, so
+    the callback can ack it as invalid.
+
+    Example:
+        callbacks = [self._get_callback(MonitorRulesManager()) for _ in range(4)]
+        dispatcher = ShardedDispatcher(callbacks, name="health_monitor")
+        MessageBus.get_consumer(..., batch_size=100, batch_callback=dispatcher.dispatch)
+    """
+
+    def __init__(self, callbacks: List[Callable], key: Callable = resource_key, name: str = "dispatcher",
+                 decode: Callable = decode_event, retries: int = const.DISPATCHER_RETRY_COUNT,
+                 retry_delay: float = const.DISPATCHER_RETRY_DELAY):
+        """
+        Init method.
+
+        Args:
+            callbacks (list): per worker callback to process message, returns CONSUMER_STATUS.
+                Workers do not share state through it unless the same callback is given.
+            key (Callable): get key of a message, messages with same key are processed in order.
+            name (str): name prefix for worker threads.
+            decode (Callable): decode a message, raises ValueError if it is invalid.
+            retries (int): retries of a message whose callback raises, it is acked after them.
+            retry_delay (float): delay(sec) before first retry of a message, doubled for next.
+        """
+        self._callbacks = callbacks
+        self._key = key
+        self._decode = decode
+        self._retries = retries
+        self._retry_delay = retry_delay
+        self._stop = Event()
+        # Orders dispatch with stop, so no batch is queued after workers are stopped.
+        self._lock = Lock()
+        self._queues = [Queue() for _ in callbacks]
+        self._threads = []
+        for index, queue in enumerate(self._queues):
+            thread = Thread(target=self._run, args=(callbacks[index], queue),
+                            name=f"{name}-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    @property
+    def workers(self) -> int:
+        return len(self._queues)
+
+    def shard(self, message) -> int:
+        """
+        Get index of the worker processing message, message is decoded or as received.
+        """
+        return hash(self._key(message)) % len(self._queues)
+
+    def decode(self, message):
+        """
+        Get decoded event of message, message is returned as it is if it is invalid.
+        """
+        try:
+            return self._decode(message)
+        except ValueError:
+            return message
+
+    def dispatch(self, messages: list) -> str:
+        """
+        Process messages and wait for all of them to complete.
+
+        Return:
+            str: FAILED_STOP if any message returned it or dispatcher is stopped,
+                SUCCESS_STOP if any message returned it, else SUCCESS.
+        """
+        batch = _Batch(len(messages))
+        events = [self.decode(message) for message in messages]
+        items = [(self.shard(event), event) for event in events]
+        with self._lock:
+            if self._stop.is_set():
+                return CONSUMER_STATUS.FAILED_STOP
+            for shard, message in items:
+                self._queues[shard].put((message, batch))
+        return batch.wait()
+
+    def stop(self) -> None:
+        """
+        Stop workers, message being retried is given up and the queued
+        messages are skipped, so dispatch waiting for them returns FAILED_STOP.
+        """
+        with self._lock:
+            self._stop.set()
+            for queue in self._queues:
+                while True:
+                    try:
+                        item = queue.get_nowait()
+                    except Empty:
+                        break
+                    if item is not None:
+                        item[1].done(CONSUMER_STATUS.FAILED_STOP)
+                queue.put(None)
+
+    def _run(self, callback: Callable, queue: Queue) -> None:
+        while True:
+            item = queue.get()
+            if item is None:
+                break
+            message, batch = item
+            batch.done(self._process(callback, message, batch))
+
+    def _process(self, callback: Callable, message, batch: _Batch) -> str:
+        """
+        Call callback till message is processed, FAILED is retried as done
+        by MessageBusConsumer. Retries are delayed with backoff, message whose
+        callback keeps raising is acked after the retries, so it does not hold
+        the batch. Messages of a stopped batch are skipped.
+        """
+        failures = 0
+        delay = self._retry_delay
+        while not batch.stopped and not self._stop.is_set():
+            try:
+                status = callback(message)
+            except Exception as e:
+                failures += 1
+                if failures > self._retries:
+                    Log.error(f"Caught exception from caller: {e}. Failed {failures} times, ack message: {message}")
+                    return CONSUMER_STATUS.SUCCESS
+                Log.error(f"Caught exception from caller: {e}. retry again after {delay} sec ...")
+            else:
+                if status in (CONSUMER_STATUS.SUCCESS, CONSUMER_STATUS.SUCCESS_STOP, CONSUMER_STATUS.FAILED_STOP):
+                    return status
+            # Stop wakes up the retry wait
+            self._stop.wait(delay)
+            delay = min(delay * 2, const.DISPATCHER_RETRY_MAX_DELAY)
+        return CONSUMER_STATUS.FAILED_STOP